@@ -1,15 +1,49 @@
+from typing import Optional
+
 import click
 
-from anime_metadata import constants, models
+from anime_metadata import backends, constants
+
 
+@click.group(invoke_without_command=True)
+@click.pass_context
+def main(ctx: click.Context) -> None:
+    if ctx.invoked_subcommand is not None:
+        return
 
-@click.command()
-def main() -> None:
-    constants.DB.connect()
-    constants.DB.create_tables(
-        [
-            models.ProviderCache,
-        ]
-    )
+    _database_backend().create_tables()
 
     # TODO
+
+
+@main.command("cache-usage")
+def cache_usage() -> None:
+    """
+    Size of the cache by provider and data type
+    """
+    total_entries = total_size = 0
+    for item in _database_backend().usage():
+        click.echo(f"{item.provider:<10} {item.data_type:<20} {item.entries:>10} {item.size:>14}")
+        total_entries += item.entries
+        total_size += item.size
+    click.echo(f"{'total':<31} {total_entries:>10} {total_size:>14}")
+
+
+@main.command("cache-evict")
+@click.option("--max-size", type=int, default=None, help="Evict least recently used entries down to this many bytes.")
+@click.option("--vacuum/--no-vacuum", default=False, help="Reclaim the space of deleted entries afterwards.")
+def cache_evict(max_size: Optional[int], vacuum: bool) -> None:
+    """
+    Delete expired cache entries, then least recently used ones beyond the size budget
+    """
+    backend = _database_backend()
+    click.echo(f"Evicted {backend.evict(max_bytes=max_size)} entries")
+    if vacuum:
+        backend.vacuum()
+
+
+def _database_backend() -> backends.DatabaseBackend:
+    backend = backends.from_url(constants.CACHE_URL) if constants.CACHE_URL else backends.DatabaseBackend()
+    if not isinstance(backend, backends.DatabaseBackend):
+        raise click.ClickException("Cache maintenance requires a database backend (postgres:// or sqlite://)")
+    return backend
@@ -0,0 +1,245 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import attr
+
+from anime_metadata import dtos, interfaces
+from anime_metadata.exceptions import ProviderNoResultError, ValidationError
+from anime_metadata.typeshed import AnimeId, AnimeTitle
+
+__all__ = [
+    "Aggregator",
+    "PartialResult",
+]
+
+# Fields of dtos.TvSeriesData merged across providers; `_provider` and `_raw` are set by the aggregator itself
+MERGED_FIELDS = tuple(
+    attrib.name for attrib in attr.fields(dtos.TvSeriesData) if not attrib.name.startswith("_") and attrib.name != "id"
+)
+
+# Worker pools by `max_workers`, shared by all aggregator instances and kept for the lifetime of the process
+_executors: Dict[int, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+@attr.s(auto_attribs=True, kw_only=True, frozen=True)
+class PartialResult:
+    provider: str
+    data: Optional[dtos.TvSeriesData] = None
+    error: Optional[Exception] = None
+    merged: Optional[dtos.TvSeriesData] = None
+    pending: int
+
+
+class Aggregator:
+    """
+    Queries multiple providers at the same time and merges their results field by field.
+
+    Providers are identified by their class name. For each field the first non-empty value wins, following
+    `priority[field]` when given and the order of `providers` otherwise; nested DTOs and title dicts are merged
+    recursively in the same order.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[interfaces.BaseProvider],
+        priority: Optional[Mapping[str, Sequence[str]]] = None,
+        *,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        if not providers:
+            raise ValidationError('At least one "provider" is required!')
+
+        self.providers = {_provider_name(provider): provider for provider in providers}
+        self.priority = dict(priority or {})
+        self.max_workers = max_workers or len(self.providers)
+
+    def iter_search_series(self, *titles: Optional[AnimeTitle], year: Optional[int] = None) -> Iterator[PartialResult]:
+        return self._iter_results(
+            {name: _bind(provider.search_series, *titles, year=year) for name, provider in self.providers.items()}
+        )
+
+    def iter_get_series(self, anime_ids: Mapping[str, AnimeId]) -> Iterator[PartialResult]:
+        return self._iter_results(
+            {name: _bind(self.providers[name].get_series, anime_id) for name, anime_id in anime_ids.items()}
+        )
+
+    def search_series(self, *titles: Optional[AnimeTitle], year: Optional[int] = None) -> dtos.TvSeriesData:
+        return _final_result(self.iter_search_series(*titles, year=year))
+
+    def get_series(self, anime_ids: Mapping[str, AnimeId]) -> dtos.TvSeriesData:
+        return _final_result(self.iter_get_series(anime_ids))
+
+    def aiter_search_series(
+        self, *titles: Optional[AnimeTitle], year: Optional[int] = None
+    ) -> AsyncIterator[PartialResult]:
+        return self._aiter_results(
+            {name: provider.asearch_series(*titles, year=year) for name, provider in self.providers.items()}
+        )
+
+    def aiter_get_series(self, anime_ids: Mapping[str, AnimeId]) -> AsyncIterator[PartialResult]:
+        return self._aiter_results(
+            {name: self.providers[name].aget_series(anime_id) for name, anime_id in anime_ids.items()}
+        )
+
+    async def asearch_series(self, *titles: Optional[AnimeTitle], year: Optional[int] = None) -> dtos.TvSeriesData:
+        return await _afinal_result(self.aiter_search_series(*titles, year=year))
+
+    async def aget_series(self, anime_ids: Mapping[str, AnimeId]) -> dtos.TvSeriesData:
+        return await _afinal_result(self.aiter_get_series(anime_ids))
+
+    def merge(self, results: Mapping[str, dtos.TvSeriesData]) -> dtos.TvSeriesData:
+        if not results:
+            raise ProviderNoResultError("No provider returned any result")
+
+        default_order = self._ordered(results, None)
+        values: Dict[str, Any] = {
+            field: _merge_values([getattr(results[name], field) for name in self._ordered(results, field)])
+            for field in MERGED_FIELDS
+        }
+        return dtos.TvSeriesData(
+            provider=self,
+            raw=dict(results),
+            id=results[default_order[0]].id,
+            **values,
+        )
+
+    def _ordered(self, results: Mapping[str, dtos.TvSeriesData], field: Optional[str]) -> List[str]:
+        order = list(self.priority.get(field, ())) if field is not None else []
+        order.extend(name for name in self.providers if name not in order)
+        return [name for name in order if name in results]
+
+    def _iter_results(self, calls: Mapping[str, Callable[[], dtos.TvSeriesData]]) -> Iterator[PartialResult]:
+        results: Dict[str, dtos.TvSeriesData] = {}
+        futures = {_get_executor(self.max_workers).submit(call): name for name, call in calls.items()}
+        pending = len(futures)
+
+        try:
+            for future in as_completed(futures):
+                pending -= 1
+                try:
+                    data = future.result()
+                except Exception as exc:
+                    yield self._partial_result(futures[future], results, pending, error=exc)
+                else:
+                    results[futures[future]] = data
+                    yield self._partial_result(futures[future], results, pending, data=data)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    async def _aiter_results(self, calls: Mapping[str, Awaitable[dtos.TvSeriesData]]) -> AsyncIterator[PartialResult]:
+        results: Dict[str, dtos.TvSeriesData] = {}
+        tasks = [asyncio.ensure_future(_named(name, call)) for name, call in calls.items()]
+        pending = len(tasks)
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                pending -= 1
+                try:
+                    name, data = await next_done
+                except _ProviderFailed as exc:
+                    yield self._partial_result(exc.provider, results, pending, error=exc.error)
+                else:
+                    results[name] = data
+                    yield self._partial_result(name, results, pending, data=data)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _partial_result(
+        self,
+        provider: str,
+        results: Mapping[str, dtos.TvSeriesData],
+        pending: int,
+        *,
+        data: Optional[dtos.TvSeriesData] = None,
+        error: Optional[Exception] = None,
+    ) -> PartialResult:
+        return PartialResult(
+            provider=provider,
+            data=data,
+            error=error,
+            merged=self.merge(results) if results else None,
+            pending=pending,
+        )
+
+
+class _ProviderFailed(Exception):
+    def __init__(self, provider: str, error: Exception) -> None:
+        self.provider = provider
+        self.error = error
+        super().__init__(provider, error)
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    with _executors_lock:
+        if max_workers not in _executors:
+            _executors[max_workers] = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=Aggregator.__name__)
+        return _executors[max_workers]
+
+
+def _provider_name(provider: interfaces.BaseProvider) -> str:
+    return provider.__class__.__name__
+
+
+def _bind(func: Callable[..., dtos.TvSeriesData], *args: Any, **kwargs: Any) -> Callable[[], dtos.TvSeriesData]:
+    return lambda: func(*args, **kwargs)
+
+
+async def _named(provider: str, call: Awaitable[dtos.TvSeriesData]) -> Tuple[str, dtos.TvSeriesData]:
+    try:
+        return provider, await call
+    except Exception as exc:
+        raise _ProviderFailed(provider, exc) from exc
+
+
+def _final_result(partial_results: Iterator[PartialResult]) -> dtos.TvSeriesData:
+    merged = None
+    for partial_result in partial_results:
+        merged = partial_result.merged or merged
+    if merged is None:
+        raise ProviderNoResultError("No provider returned any result")
+    return merged
+
+
+async def _afinal_result(partial_results: AsyncIterator[PartialResult]) -> dtos.TvSeriesData:
+    merged = None
+    async for partial_result in partial_results:
+        merged = partial_result.merged or merged
+    if merged is None:
+        raise ProviderNoResultError("No provider returned any result")
+    return merged
+
+
+def is_empty(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, (str, bytes, dict, list, set, frozenset, tuple)):
+        return len(value) == 0
+    return False
+
+
+def _merge_values(values: Sequence[Any]) -> Any:
+    present = [value for value in values if not is_empty(value)]
+    if not present:
+        return None
+
+    first = present[0]
+    if isinstance(first, dict):
+        merged: Dict[Any, Any] = {}
+        for value in reversed(present):
+            merged.update(value)
+        return merged
+    if attr.has(type(first)) and not isinstance(first, dtos.ShowEpisode):
+        same_type = [value for value in present if type(value) is type(first)]
+        return type(first)(
+            **{
+                attrib.name: _merge_values([getattr(value, attrib.name) for value in same_type])
+                for attrib in attr.fields(type(first))
+                if attrib.init and not attrib.name.startswith("_")
+            }
+        )
+    return first
@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Sequence, Type, Union
+
+import attr
+import peewee
+
+from anime_metadata import constants, enums, interfaces, models, ttl
+from anime_metadata.typeshed import CacheEntry, CacheKey, RawHtml
+
+__all__ = [
+    "CacheUsage",
+    "DatabaseBackend",
+    "SqliteBackend",
+]
+
+
+@attr.s(auto_attribs=True, kw_only=True, frozen=True)
+class CacheUsage:
+    provider: str
+    data_type: str
+    entries: int
+    size: int  # bytes of stored, possibly compressed, data
+
+
+class DatabaseBackend(interfaces.BaseCacheBackend):
+    """
+    Stores cache entries in the `providers_cache` table of any peewee database, Postgres `constants.DB` by default
+    """
+
+    def __init__(self, database: Optional[peewee.Database] = None) -> None:
+        self.database = database or constants.DB
+        self.model = _bind_model(models.ProviderCache, self.database)
+        super().__init__()
+
+    def create_tables(self) -> None:
+        """
+        Creates the cache table, or brings one created by an older version up to date
+        """
+        self.model.migrate()
+        self.database.create_tables([self.model])
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        provider, data_type, _id = key
+        return self.model.get(provider, _id, data_type)
+
+    def set(
+        self,
+        key: CacheKey,
+        value: RawHtml,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        show_status: Optional[enums.ShowStatus] = None,
+    ) -> None:
+        provider, data_type, _id = key
+        self.model.set(provider, _id, data_type, value, etag, last_modified, show_status)
+
+    def get_many(self, keys: Sequence[CacheKey]) -> Dict[CacheKey, CacheEntry]:
+        entries = self.model.get_many((provider, _id, data_type) for provider, data_type, _id in keys)
+        return {(provider, data_type, _id): entry for (provider, _id, data_type), entry in entries.items()}
+
+    def set_many(self, items: Mapping[CacheKey, CacheEntry]) -> None:
+        self.model.set_many(
+            (provider, _id, data_type, entry.data, entry.etag, entry.last_modified, entry.show_status)
+            for (provider, data_type, _id), entry in items.items()
+        )
+
+    def touch(self, key: CacheKey) -> None:
+        provider, data_type, _id = key
+        self.model.touch(provider, _id, data_type)
+
+    def set_show_status(self, keys: Sequence[CacheKey], show_status: enums.ShowStatus) -> None:
+        self.model.set_show_status(((provider, _id, data_type) for provider, data_type, _id in keys), show_status)
+
+    def usage(self) -> List[CacheUsage]:
+        return [
+            CacheUsage(provider=row["provider"], data_type=row["data_type"], entries=row["entries"], size=row["size"] or 0)
+            for row in self.model.usage()
+        ]
+
+    def evict(
+        self,
+        *,
+        max_bytes: Optional[int] = None,
+        policy: Optional[ttl.TtlPolicy] = None,
+        grace: timedelta = constants.CACHE_STALE_GRACE,
+    ) -> int:
+        """
+        Deletes entries expired for longer than `grace`, then the least recently accessed ones until the stored data
+        fits in `max_bytes`, returns the number of deleted entries
+        """
+        policy = policy or ttl.get_default_policy()
+        now = datetime.utcnow()
+
+        evicted = 0
+        for group in list(self.model.iter_ttl_groups()):
+            show_status = enums.ShowStatus(group["show_status"]) if group["show_status"] else None
+            lifetime = policy.ttl(group["provider"], group["data_type"], show_status)
+            evicted += self.model.delete_updated_before(
+                group["provider"], group["data_type"], group["show_status"], now - lifetime - grace
+            )
+
+        size = sum(item.size for item in self.usage())
+        while max_bytes is not None and size > max_bytes:
+            # Only a batch of keys is loaded at a time, however large the cache is
+            batch = []
+            for row in self.model.least_recently_accessed(constants.CACHE_BATCH_SIZE):
+                if size <= max_bytes:
+                    break
+                batch.append((row["provider"], row["id"], row["data_type"]))
+                size -= row["size"] or 0
+            if not batch:
+                break
+            evicted += self.model.delete_many(batch)
+        return evicted
+
+    def vacuum(self) -> None:
+        """
+        Makes the space of deleted entries reusable
+        """
+        self.model.vacuum()
+
+
+class SqliteBackend(DatabaseBackend):
+    def __init__(self, path: Union[str, Path]) -> None:
+        # WAL lets readers proceed while a writer commits, `synchronous=normal` is durable enough for a cache
+        database = peewee.SqliteDatabase(
+            str(path),
+            pragmas={"journal_mode": "wal", "synchronous": "normal"},
+            check_same_thread=False,
+        )
+        super().__init__(database)
+        self.create_tables()
+
+
+def _bind_model(model: Type[models.ProviderCache], database: peewee.Database) -> Type[models.ProviderCache]:
+    if model._meta.database is database:
+        return model
+
+    # A subclass keeps the shared model bound to `constants.DB` when several databases are used side by side
+    meta = type("Meta", (), {"database": database, "table_name": model._meta.table_name})
+    return type(model.__name__, (model,), {"Meta": meta, "__module__": __name__})
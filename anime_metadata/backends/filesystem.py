@@ -0,0 +1,102 @@
+from datetime import datetime
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+from typing import Any, Dict, Optional, Sequence, Union
+
+from anime_metadata import enums, interfaces
+from anime_metadata.typeshed import CacheEntry, CacheKey, RawHtml
+
+__all__ = [
+    "FilesystemBackend",
+]
+
+
+class FilesystemBackend(interfaces.BaseCacheBackend):
+    """
+    One file per cache entry under `root`, sharded into `xx/yy/` directories by the key hash.
+
+    A file holds a JSON header line with the HTTP validators and the show status followed by the raw data, the file
+    modification time is the entry's last update.
+    """
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        super().__init__()
+
+    def path(self, key: CacheKey) -> Path:
+        digest = hashlib.sha1("\0".join(key).encode()).hexdigest()
+        return self.root / digest[:2] / digest[2:4] / digest
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        path = self.path(key)
+        try:
+            with path.open("rb") as file:
+                header = json.loads(file.readline())
+                data = file.read()
+                last_update = datetime.utcfromtimestamp(os.fstat(file.fileno()).st_mtime)
+        except FileNotFoundError:
+            return None
+
+        return CacheEntry(
+            data=data,
+            last_update=last_update,
+            etag=header.get("etag"),
+            last_modified=header.get("last_modified"),
+            show_status=enums.ShowStatus(header["show_status"]) if header.get("show_status") else None,
+        )
+
+    def set(
+        self,
+        key: CacheKey,
+        value: RawHtml,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        show_status: Optional[enums.ShowStatus] = None,
+    ) -> None:
+        path = self.path(key)
+        if show_status is None:
+            previous = self.get(key)
+            show_status = previous.show_status if previous is not None else None
+
+        header = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "show_status": show_status.value if show_status else None,
+        }
+        self._write(path, header, value)
+
+    def touch(self, key: CacheKey) -> None:
+        try:
+            os.utime(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def set_show_status(self, keys: Sequence[CacheKey], show_status: enums.ShowStatus) -> None:
+        for key in keys:
+            entry = self.get(key)
+            if entry is None or entry.show_status is show_status:
+                continue
+
+            path = self.path(key)
+            header = {"etag": entry.etag, "last_modified": entry.last_modified, "show_status": show_status.value}
+            self._write(path, header, entry.data)
+            # Tagging is not an update of the data, the entry keeps its age
+            timestamp = (entry.last_update - datetime(1970, 1, 1)).total_seconds()
+            os.utime(path, (timestamp, timestamp))
+
+    def _write(self, path: Path, header: Dict[str, Any], data: RawHtml) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write aside and rename, readers never see a partially written entry
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(json.dumps(header).encode() + b"\n" + data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
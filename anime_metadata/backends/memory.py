@@ -0,0 +1,130 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import threading
+from typing import Optional, Sequence
+
+import attr
+
+from anime_metadata import constants, enums, interfaces
+from anime_metadata.typeshed import CacheEntry, CacheKey, RawHtml
+
+__all__ = [
+    "CacheStats",
+    "MemoryBackend",
+]
+
+
+@attr.s(auto_attribs=True, kw_only=True, frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MemoryBackend(interfaces.BaseCacheBackend):
+    """
+    Process-local LRU cache bounded by the total size of stored data, entries older than `ttl` are dropped on read
+    """
+
+    def __init__(self, max_bytes: int = constants.MEMORY_CACHE_MAX_BYTES, ttl: Optional[timedelta] = None) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        super().__init__()
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and entry.last_update + self.ttl <= datetime.utcnow():
+                self._remove(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(
+        self,
+        key: CacheKey,
+        value: RawHtml,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        show_status: Optional[enums.ShowStatus] = None,
+    ) -> None:
+        if show_status is None:
+            with self._lock:
+                previous = self._entries.get(key)
+            show_status = previous.show_status if previous is not None else None
+
+        self.put(
+            key,
+            CacheEntry(
+                data=value,
+                last_update=datetime.utcnow(),
+                etag=etag,
+                last_modified=last_modified,
+                show_status=show_status,
+            ),
+        )
+
+    def put(self, key: CacheKey, entry: CacheEntry) -> None:
+        with self._lock:
+            self._remove(key)
+            if len(entry.data) > self.max_bytes:
+                return
+
+            self._entries[key] = entry
+            self.size += len(entry.data)
+
+            while self.size > self.max_bytes:
+                _key, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted.data)
+                self.evictions += 1
+
+    def invalidate(self, key: CacheKey) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def touch(self, key: CacheKey) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = entry._replace(last_update=datetime.utcnow())
+
+    def set_show_status(self, keys: Sequence[CacheKey], show_status: enums.ShowStatus) -> None:
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries[key] = entry._replace(show_status=show_status)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                size=self.size,
+            )
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry.data)
@@ -0,0 +1,92 @@
+from typing import Dict, Mapping, Optional, Sequence
+
+from anime_metadata import enums, interfaces, ttl
+from anime_metadata.typeshed import CacheEntry, CacheKey, RawHtml
+
+from .memory import CacheStats, MemoryBackend
+
+__all__ = [
+    "TieredBackend",
+]
+
+
+class TieredBackend(interfaces.BaseCacheBackend):
+    """
+    Bounded in-process LRU in front of a shared backend, writes go through to both tiers.
+
+    Front entries keep the `last_update` of the shared backend and expire according to `policy`, so an entry
+    refreshed by another process is picked up at the latest when the local copy would be revalidated anyway.
+    """
+
+    def __init__(
+        self,
+        backend: interfaces.BaseCacheBackend,
+        front: Optional[MemoryBackend] = None,
+        policy: Optional[ttl.TtlPolicy] = None,
+    ) -> None:
+        self.backend = backend
+        self.front = front or MemoryBackend()
+        self.policy = policy or ttl.get_default_policy()
+        super().__init__()
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        entry = self._get_front(key)
+        if entry is not None:
+            return entry
+
+        entry = self.backend.get(key)
+        # Expired entries are about to be revalidated and rewritten, keeping them in memory is pointless
+        if entry is not None and self.policy.is_fresh(key, entry):
+            self.front.put(key, entry)
+        return entry
+
+    def set(
+        self,
+        key: CacheKey,
+        value: RawHtml,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        show_status: Optional[enums.ShowStatus] = None,
+    ) -> None:
+        self.backend.set(key, value, etag, last_modified, show_status)
+        self.front.set(key, value, etag, last_modified, show_status)
+
+    def get_many(self, keys: Sequence[CacheKey]) -> Dict[CacheKey, CacheEntry]:
+        result = {}
+        missing = []
+        for key in keys:
+            entry = self._get_front(key)
+            if entry is None:
+                missing.append(key)
+            else:
+                result[key] = entry
+
+        if missing:
+            for key, entry in self.backend.get_many(missing).items():
+                if self.policy.is_fresh(key, entry):
+                    self.front.put(key, entry)
+                result[key] = entry
+        return result
+
+    def set_many(self, items: Mapping[CacheKey, CacheEntry]) -> None:
+        self.backend.set_many(items)
+        for key, entry in items.items():
+            self.front.set(key, entry.data, entry.etag, entry.last_modified, entry.show_status)
+
+    def touch(self, key: CacheKey) -> None:
+        self.backend.touch(key)
+        self.front.touch(key)
+
+    def set_show_status(self, keys: Sequence[CacheKey], show_status: enums.ShowStatus) -> None:
+        self.backend.set_show_status(keys, show_status)
+        self.front.set_show_status(keys, show_status)
+
+    def stats(self) -> CacheStats:
+        return self.front.stats()
+
+    def _get_front(self, key: CacheKey) -> Optional[CacheEntry]:
+        entry = self.front.get(key)
+        if entry is not None and not self.policy.is_fresh(key, entry):
+            self.front.invalidate(key)
+            return None
+        return entry
@@ -0,0 +1,179 @@
+import atexit
+from collections import OrderedDict
+from datetime import datetime
+import logging
+import threading
+from typing import Dict, Mapping, Optional, Sequence
+
+from anime_metadata import constants, enums, interfaces
+from anime_metadata.typeshed import CacheEntry, CacheKey, RawHtml
+
+__all__ = [
+    "WriteBehindBackend",
+]
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehindBackend(interfaces.BaseCacheBackend):
+    """
+    Queues writes in memory and persists them to `backend` in batches from a background thread.
+
+    Pending entries are served by `get()`, a newer write of the same key replaces the queued one. The queue is
+    flushed on `close()`, which also runs at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        backend: interfaces.BaseCacheBackend,
+        *,
+        durability: enums.CacheDurability = enums.CacheDurability.QUEUED,
+        max_pending: int = constants.CACHE_WRITE_BEHIND_MAX_PENDING,
+        flush_interval: float = constants.CACHE_WRITE_BEHIND_INTERVAL,
+    ) -> None:
+        self.backend = backend
+        self.durability = durability
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._pending: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        # Taken off the queue but not committed yet, still visible to readers
+        self._in_flight: Dict[CacheKey, CacheEntry] = {}
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        super().__init__()
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        with self._condition:
+            entry = self._pending.get(key) or self._in_flight.get(key)
+        return entry if entry is not None else self.backend.get(key)
+
+    def get_many(self, keys: Sequence[CacheKey]) -> Dict[CacheKey, CacheEntry]:
+        result = {}
+        with self._condition:
+            for key in keys:
+                entry = self._pending.get(key) or self._in_flight.get(key)
+                if entry is not None:
+                    result[key] = entry
+
+        missing = [key for key in keys if key not in result]
+        if missing:
+            result.update(self.backend.get_many(missing))
+        return result
+
+    def set(
+        self,
+        key: CacheKey,
+        value: RawHtml,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        show_status: Optional[enums.ShowStatus] = None,
+    ) -> None:
+        if self.durability is enums.CacheDurability.SYNC:
+            self.backend.set(key, value, etag, last_modified, show_status)
+            return
+
+        self._enqueue(
+            key,
+            CacheEntry(
+                data=value,
+                last_update=datetime.utcnow(),
+                etag=etag,
+                last_modified=last_modified,
+                show_status=show_status,
+            ),
+        )
+
+    def set_many(self, items: Mapping[CacheKey, CacheEntry]) -> None:
+        if self.durability is enums.CacheDurability.SYNC:
+            self.backend.set_many(items)
+            return
+
+        for key, entry in items.items():
+            self._enqueue(key, entry)
+
+    def touch(self, key: CacheKey) -> None:
+        with self._condition:
+            entry = self._pending.get(key)
+            if entry is not None:
+                self._pending[key] = entry._replace(last_update=datetime.utcnow())
+                return
+        self.backend.touch(key)
+
+    def set_show_status(self, keys: Sequence[CacheKey], show_status: enums.ShowStatus) -> None:
+        with self._condition:
+            for entries in (self._pending, self._in_flight):
+                for key in keys:
+                    entry = entries.get(key)
+                    if entry is not None:
+                        entries[key] = entry._replace(show_status=show_status)
+        self.backend.set_show_status(keys, show_status)
+
+    def flush(self) -> None:
+        """
+        Persists everything queued so far before returning
+        """
+        with self._condition:
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: not (self._pending or self._in_flight) or not self._thread.is_alive())
+
+    def close(self) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    def _enqueue(self, key: CacheKey, entry: CacheEntry) -> None:
+        with self._condition:
+            while key not in self._pending and len(self._pending) >= self.max_pending and not self._closed:
+                if self.durability is enums.CacheDurability.BEST_EFFORT:
+                    self.dropped += 1
+                    return
+                self._condition.notify_all()
+                self._condition.wait()
+
+            if self._closed:
+                # Nothing flushes after close, keep the write instead of losing it
+                self.backend.set(key, entry.data, entry.etag, entry.last_modified, entry.show_status)
+                return
+
+            self._pending[key] = entry
+            if len(self._pending) >= self.max_pending:
+                self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._take_batch()
+            if batch is None:
+                return
+
+            try:
+                self.backend.set_many(batch)
+            except Exception:
+                logger.exception("Failed to persist %d cache entries", len(batch))
+
+            with self._condition:
+                self._in_flight = {}
+                self._condition.notify_all()
+
+    def _take_batch(self) -> Optional[Dict[CacheKey, CacheEntry]]:
+        with self._condition:
+            while not self._pending:
+                if self._closed:
+                    return None
+                self._condition.notify_all()
+                self._condition.wait(self.flush_interval)
+
+            if not self._closed and len(self._pending) < self.max_pending:
+                # Give writers a moment to fill the batch
+                self._condition.wait(self.flush_interval)
+
+            self._in_flight, self._pending = dict(self._pending), OrderedDict()
+            self._condition.notify_all()
+            return self._in_flight
@@ -0,0 +1,46 @@
+from typing import Optional, Tuple
+import zlib
+
+from anime_metadata import constants
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+__all__ = [
+    "compress",
+    "decompress",
+]
+
+ZLIB = "zlib"
+ZSTD = "zstd"
+
+
+def compress(data: bytes) -> Tuple[Optional[str], bytes]:
+    """
+    Returns `(codec, payload)`, codec is `None` when the data is stored as is
+    """
+    if len(data) < constants.CACHE_COMPRESSION_MIN_SIZE:
+        return None, data
+
+    if zstandard is not None:
+        codec, payload = ZSTD, zstandard.ZstdCompressor(level=constants.CACHE_ZSTD_LEVEL).compress(data)
+    else:
+        codec, payload = ZLIB, zlib.compress(data, constants.CACHE_ZLIB_LEVEL)
+
+    if len(payload) >= len(data):
+        return None, data
+    return codec, payload
+
+
+def decompress(codec: Optional[str], payload: bytes) -> bytes:
+    if codec is None:
+        return payload
+    if codec == ZLIB:
+        return zlib.decompress(payload)
+    if codec == ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd compressed cache entries")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    raise ValueError(f"Unknown cache codec: {codec}")
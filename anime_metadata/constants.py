@@ -1,15 +1,50 @@
 import datetime
+import os
 
 import peewee
 
+from anime_metadata import enums
+
 INDENT_SIZE = 2
 
-DB = peewee.PostgresqlDatabase(
-    # TODO
-)
+# Deferred, call `DB.init(database, **connect_params)` before using the Postgres cache backend
+DB = peewee.PostgresqlDatabase(None)
+
+# Cache backend used when none is given explicitly, see `anime_metadata.backends.from_url()`;
+# `None` keeps the Postgres `DB` above
+CACHE_URL = os.environ.get("ANIME_METADATA_CACHE_URL")
+MEMORY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+CACHE_STALE_GRACE = datetime.timedelta(days=1)  # expired pages served while refreshed in the background
+CACHE_COMPRESSION_MIN_SIZE = 512  # bytes, smaller cache blobs are stored uncompressed
+CACHE_ZSTD_LEVEL = 6  # used when the optional `zstandard` package is installed
+CACHE_ZLIB_LEVEL = 6
+CACHE_BATCH_SIZE = 100  # rows per statement of bulk cache reads and writes
+CACHE_DURABILITY = enums.CacheDurability.SYNC  # anything else persists writes of the default backend behind
+CACHE_WRITE_BEHIND_MAX_PENDING = 1000  # entries waiting to be written
+CACHE_WRITE_BEHIND_INTERVAL = 1.0  # seconds between flushes of a queue which is not full
+CACHE_SEARCH_TTL = datetime.timedelta(days=1)  # cached search responses
+CACHE_NO_RESULT_TTL = datetime.timedelta(days=3)  # titles without a match are not searched again before
+CACHE_ACCESS_RESOLUTION = datetime.timedelta(hours=1)  # reads refresh `last_access` of cache rows at most this often
+CACHE_MEMORY_TIER = True  # keep recently used entries of the default backend in an in-process LRU as well
 
 MAX_CACHE_LIFETIME = datetime.timedelta(days=7)
 
+HTTP_POOL_CONNECTIONS = 10  # number of hosts
+HTTP_POOL_MAXSIZE = 10  # connections per host
+HTTP_ASYNC_MAX_CONNECTIONS = 100  # in-flight connections per event loop, all hosts
+HTTP_TIMEOUT = (5.0, 30.0)  # (connect, read) in seconds
+
+HTTP_THROTTLE_RETRIES = 3  # retries of a request answered with 429/503
+HTTP_THROTTLE_BACKOFF = 5.0  # seconds, doubled per consecutive throttle when there is no Retry-After
+HTTP_THROTTLE_MAX_BACKOFF = 300.0
+
+HTTP_RETRIES = 2  # retries of a request failed with a connection error, timeout or 5xx
+HTTP_RETRY_BACKOFF = 0.5  # seconds, upper bound of the jittered delay doubles per retry
+HTTP_RETRY_MAX_BACKOFF = 10.0
+
+CIRCUIT_BREAKER_FAILURES = 5  # consecutive failed requests before a provider is considered down
+CIRCUIT_BREAKER_RECOVERY_TIMEOUT = 60.0  # seconds before a probe request is let through again
+
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36"
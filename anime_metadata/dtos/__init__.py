@@ -1,2 +1,3 @@
 from .providers import *  # noqa
+from .serialization import *  # noqa
 from .show import *  # noqa
@@ -0,0 +1,123 @@
+import base64
+import collections.abc
+import datetime
+from decimal import Decimal
+import enum
+import importlib
+import json
+from typing import Any, Dict, Union
+
+import attr
+
+from .providers import TvSeriesData
+
+__all__ = [
+    "dumps_series",
+    "loads_series",
+]
+
+# JSON has no bytes or classes, values of untyped fields (e.g. raw pages) are wrapped in single-key objects
+_BYTES = "$bytes"
+_CLASS = "$class"
+
+
+def dumps_series(data: TvSeriesData) -> bytes:
+    """
+    JSON document of `data`, unlike a pickle it stays readable when fields are added to or removed from the DTOs
+    """
+    return json.dumps(_unstructure(data), separators=(",", ":")).encode("utf-8")
+
+
+def loads_series(raw_data: bytes) -> TvSeriesData:
+    """
+    Reverse of `dumps_series()`, raises `ValueError` when the document doesn't fit the current DTOs
+    """
+    try:
+        return _structure_attrs(json.loads(raw_data), TvSeriesData)
+    except (AttributeError, ImportError, KeyError, TypeError) as exc:
+        raise ValueError(f"Cannot load {TvSeriesData.__name__}: {exc!r}") from exc
+
+
+def _unstructure(value: Any) -> Any:  # noqa: C901
+    if attr.has(type(value)):
+        return {field.name: _unstructure(getattr(value, field.name)) for field in attr.fields(type(value))}
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, dict):
+        return {_unstructure(key): _unstructure(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_unstructure(item) for item in value]
+    if isinstance(value, (Decimal, datetime.date)):
+        return str(value)
+    if isinstance(value, bytes):
+        return {_BYTES: base64.b64encode(value).decode("ascii")}
+    if isinstance(value, type):
+        return {_CLASS: f"{value.__module__}:{value.__qualname__}"}
+    return value
+
+
+def _structure(value: Any, type_: Any) -> Any:  # noqa: C901
+    if value is None:
+        return None
+
+    origin = getattr(type_, "__origin__", None)
+    if origin is Union:
+        options = [option for option in type_.__args__ if option is not type(None)]
+        # Unions of plain JSON types (e.g. `AnimeId`) come back as they were stored
+        return _structure(value, options[0]) if len(options) == 1 else value
+    if origin in (set, frozenset, collections.abc.Set):
+        return {_structure(item, type_.__args__[0]) for item in value}
+    if origin in (list, collections.abc.Sequence):
+        return [_structure(item, type_.__args__[0]) for item in value]
+    if origin in (dict, collections.abc.Mapping):
+        key_type, value_type = type_.__args__
+        return {_structure(key, key_type): _structure(item, value_type) for key, item in value.items()}
+
+    if type_ in (Any, object):
+        return _structure_any(value)
+    if attr.has(type_):
+        return _structure_attrs(value, type_)
+    if isinstance(type_, type) and issubclass(type_, enum.Enum):
+        return type_[value]
+    if type_ is Decimal:
+        return Decimal(value)
+    if type_ is datetime.date:
+        return datetime.date.fromisoformat(value)
+    return value
+
+
+def _structure_any(value: Any) -> Any:
+    if not (isinstance(value, dict) and len(value) == 1):
+        return value
+    if _BYTES in value:
+        return base64.b64decode(value[_BYTES])
+    if _CLASS in value:
+        module_name, qualname = value[_CLASS].split(":")
+        result = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            result = getattr(result, name)
+        return result
+    return value
+
+
+def _structure_attrs(data: Dict[str, Any], cls: Any) -> Any:
+    # Stored values are already converted, neither converters nor `__attrs_post_init__` run again
+    instance = object.__new__(cls)
+    for field in attr.fields(cls):
+        if field.name in data:
+            value = _structure(data[field.name], field.type)
+        elif field.default is not attr.NOTHING:
+            value = _default(field, instance)
+        else:
+            raise KeyError(field.name)
+        object.__setattr__(instance, field.name, value)
+    return instance
+
+
+def _default(field: Any, instance: Any) -> Any:
+    # Fields added after the document was stored get the value `__init__` would give them
+    value = field.default
+    factory = getattr(value, "factory", None)  # `attr.Factory`
+    if factory is not None:
+        value = factory(instance) if value.takes_self else factory()
+    return field.converter(value) if field.converter else value
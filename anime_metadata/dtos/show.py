@@ -38,6 +38,17 @@ class ShowDate:
     ended: Union[datetime.date, None] = attr.ib(converter=_utils.date_converter)
     year: Union[int, None] = attr.ib(default=attr.Factory(_utils.year_factory, takes_self=True))
 
+    @property
+    def status(self) -> Union[enums.ShowStatus, None]:
+        today = datetime.date.today()
+        if self.premiered is None:
+            return None
+        if self.premiered > today:
+            return enums.ShowStatus.NOT_YET_AIRED
+        if self.ended is not None and self.ended <= today:
+            return enums.ShowStatus.FINISHED
+        return enums.ShowStatus.AIRING
+
 
 @attr.s(auto_attribs=True, kw_only=True, frozen=True)
 class ShowImage:
@@ -3,6 +3,12 @@ import enum
 from .language import *  # noqa
 
 
+class CacheDurability(enum.Enum):
+    SYNC = enum.auto()  # cache writes are persisted before returning
+    QUEUED = enum.auto()  # written behind in batches, writers wait while the queue is full, flushed on exit
+    BEST_EFFORT = enum.auto()  # like QUEUED, but writes are dropped while the queue is full
+
+
 class CharacterType(enum.Enum):
     MAIN = enum.auto()
     SUPPORTING = enum.auto()
@@ -40,6 +46,12 @@ class MPAA(enum.Enum):
     XXX = "XXX"
 
 
+class ShowStatus(enum.Enum):
+    NOT_YET_AIRED = "not_yet_aired"
+    AIRING = "airing"
+    FINISHED = "finished"
+
+
 class SourceMaterial(enum.Enum):
     GAME = enum.auto()
     LIGHT_NOVEL = enum.auto()
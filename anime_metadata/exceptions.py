@@ -1,4 +1,4 @@
-from anime_metadata.typeshed import ApiResponseData
+from anime_metadata.typeshed import ApiResponseData, CacheEntry
 
 
 class AnimeMetadataError(Exception):
@@ -23,9 +23,19 @@ class ProviderMultipleResultError(AnimeMetadataProviderError):
     pass
 
 
+class ProviderUnavailableError(AnimeMetadataProviderError):
+    pass
+
+
 class ValidationError(AnimeMetadataError):
     pass
 
 
 class CacheDataNotFound(AnimeMetadataError):
     pass
+
+
+class CacheDataExpired(CacheDataNotFound):
+    def __init__(self, entry: CacheEntry, *args: object) -> None:
+        self.entry = entry
+        super().__init__(*args)
@@ -1,2 +1,4 @@
 from .cache import *  # noqa
+from .cache_backend import *  # noqa
 from .provider import *  # noqa
+from .scraper import *  # noqa
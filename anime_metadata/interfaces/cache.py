@@ -1,10 +1,15 @@
+import asyncio
 from contextlib import AbstractContextManager, ContextDecorator
+from datetime import datetime
+import functools
 from types import TracebackType
-from typing import Optional, Type, Union
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
 
-from anime_metadata import models
-from anime_metadata.exceptions import CacheDataNotFound
-from anime_metadata.typeshed import RawHtml
+from anime_metadata import backends, enums, ttl
+from anime_metadata.exceptions import CacheDataExpired, CacheDataNotFound
+from anime_metadata.typeshed import CacheEntry, CacheKey, RawHtml
+
+from .cache_backend import BaseCacheBackend
 
 __all__ = [
     "BaseCache",
@@ -16,11 +21,24 @@ class BaseCache(AbstractContextManager, ContextDecorator):  # type:ignore
     def provider_name(self) -> str:
         raise NotImplementedError
 
-    def __init__(self, data_type: str, _id: Union[str, int]) -> None:
+    def __init__(
+        self,
+        data_type: str,
+        _id: Union[str, int],
+        *,
+        backend: Optional[BaseCacheBackend] = None,
+        ttl_policy: Optional[ttl.TtlPolicy] = None,
+    ) -> None:
         self.id = _id
         self.data_type = data_type
+        self.backend = backend or backends.get_default_backend()
+        self.ttl_policy = ttl_policy or ttl.get_default_policy()
         super().__init__()
 
+    @property
+    def key(self) -> CacheKey:
+        return self.provider_name, self.data_type, str(self.id)
+
     def __exit__(
         self,
         exc_type: Optional[Type[BaseException]],
@@ -31,12 +49,98 @@ class BaseCache(AbstractContextManager, ContextDecorator):  # type:ignore
             raise exc_value
         return None
 
-    def get(self) -> Optional[RawHtml]:
-        result = models.ProviderCache.get(self.provider_name, self.id, self.data_type)  # type:ignore
+    def get(self) -> RawHtml:
+        result = self.backend.get(self.key)
         if result is None:
             raise CacheDataNotFound
-        return result
+        if not self.ttl_policy.is_fresh(self.key, result):
+            # The expired entry is still useful to revalidate it with a conditional request
+            raise CacheDataExpired(result)
+        return result.data
+
+    def set(
+        self,
+        value: RawHtml,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        *,
+        show_status: Optional[enums.ShowStatus] = None,
+    ) -> None:
+        self.backend.set(self.key, value, etag, last_modified, show_status)
+        return None
 
-    def set(self, value: RawHtml) -> None:
-        models.ProviderCache.set(self.provider_name, self.id, self.data_type, value)  # type:ignore
+    def touch(self) -> None:
+        self.backend.touch(self.key)
         return None
+
+    @staticmethod
+    def get_many(caches: Sequence["BaseCache"]) -> List[Optional[RawHtml]]:
+        """
+        Fresh data of every cache in one lookup per backend, `None` where the entry is missing or expired
+        """
+        entries: Dict[CacheKey, CacheEntry] = {}
+        for backend, group in _group_by_backend(caches):
+            entries.update(backend.get_many([cache.key for cache in group]))
+
+        now = datetime.utcnow()
+        result: List[Optional[RawHtml]] = []
+        for cache in caches:
+            entry = entries.get(cache.key)
+            result.append(entry.data if entry and cache.ttl_policy.is_fresh(cache.key, entry, now) else None)
+        return result
+
+    @staticmethod
+    def set_many(items: Sequence[Tuple["BaseCache", RawHtml]]) -> None:
+        for backend, group in _group_by_backend([cache for cache, _value in items]):
+            keys = {cache.key for cache in group}
+            now = datetime.utcnow()
+            backend.set_many(
+                {cache.key: CacheEntry(data=value, last_update=now) for cache, value in items if cache.key in keys}
+            )
+
+    @staticmethod
+    def set_show_status(caches: Sequence["BaseCache"], show_status: enums.ShowStatus) -> None:
+        """
+        Tags the entries with the status of their show, which selects their lifetime in the TTL policy
+        """
+        for backend, group in _group_by_backend(caches):
+            backend.set_show_status([cache.key for cache in group], show_status)
+
+    # Backends are blocking, async callers run cache I/O in the default executor
+
+    async def aget(self) -> RawHtml:
+        return await asyncio.get_running_loop().run_in_executor(None, self.get)
+
+    async def aset(
+        self,
+        value: RawHtml,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        *,
+        show_status: Optional[enums.ShowStatus] = None,
+    ) -> None:
+        return await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self.set, value, etag, last_modified, show_status=show_status)
+        )
+
+    async def atouch(self) -> None:
+        return await asyncio.get_running_loop().run_in_executor(None, self.touch)
+
+    @staticmethod
+    async def aget_many(caches: Sequence["BaseCache"]) -> List[Optional[RawHtml]]:
+        return await asyncio.get_running_loop().run_in_executor(None, BaseCache.get_many, caches)
+
+    @staticmethod
+    async def aset_many(items: Sequence[Tuple["BaseCache", RawHtml]]) -> None:
+        return await asyncio.get_running_loop().run_in_executor(None, BaseCache.set_many, items)
+
+    @staticmethod
+    async def aset_show_status(caches: Sequence["BaseCache"], show_status: enums.ShowStatus) -> None:
+        return await asyncio.get_running_loop().run_in_executor(None, BaseCache.set_show_status, caches, show_status)
+
+
+def _group_by_backend(caches: Sequence[BaseCache]) -> List[Tuple[BaseCacheBackend, List[BaseCache]]]:
+    groups: Dict[int, Tuple[BaseCacheBackend, List[BaseCache]]] = {}
+    for cache in caches:
+        groups.setdefault(id(cache.backend), (cache.backend, []))[1].append(cache)
+    return list(groups.values())
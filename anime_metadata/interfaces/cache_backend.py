@@ -0,0 +1,43 @@
+from typing import Dict, Mapping, Optional, Sequence
+
+from anime_metadata import enums
+from anime_metadata.typeshed import CacheEntry, CacheKey, RawHtml
+
+__all__ = [
+    "BaseCacheBackend",
+]
+
+
+class BaseCacheBackend:
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    def set(
+        self,
+        key: CacheKey,
+        value: RawHtml,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        show_status: Optional[enums.ShowStatus] = None,
+    ) -> None:
+        raise NotImplementedError
+
+    def touch(self, key: CacheKey) -> None:
+        raise NotImplementedError
+
+    def get_many(self, keys: Sequence[CacheKey]) -> Dict[CacheKey, CacheEntry]:
+        result = {}
+        for key in keys:
+            entry = self.get(key)
+            if entry is not None:
+                result[key] = entry
+        return result
+
+    def set_many(self, items: Mapping[CacheKey, CacheEntry]) -> None:
+        for key, entry in items.items():
+            self.set(key, entry.data, entry.etag, entry.last_modified, entry.show_status)
+
+    def set_show_status(self, keys: Sequence[CacheKey], show_status: enums.ShowStatus) -> None:
+        """
+        Tags existing entries with the status of their show, backends not storing it keep the default TTL
+        """
@@ -1,31 +1,166 @@
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple, Type
 
+import attr
 from furl import furl
+import httpx
 import requests
 
-from anime_metadata import dtos
-from anime_metadata.exceptions import ProviderNoResultError, ValidationError
-from anime_metadata.typeshed import AnimeId, AnimeTitle
+from anime_metadata import constants, dtos, enums, utils
+from anime_metadata.exceptions import CacheDataExpired, CacheDataNotFound, ProviderNoResultError, ValidationError
+from anime_metadata.ratelimit import RateLimit, RequestScheduler, get_default_scheduler
+from anime_metadata.resilience import (
+    CircuitBreaker,
+    RetryPolicy,
+    acall_with_retries,
+    call_with_retries,
+    get_circuit_breaker,
+)
+from anime_metadata.singleflight import AsyncSingleFlight, SingleFlight
+from anime_metadata.transport import (
+    AsyncTransport,
+    Transport,
+    get_default_async_transport,
+    get_default_transport,
+    to_httpx_timeout,
+)
+from anime_metadata.typeshed import AnimeId, AnimeTitle, CacheEntry, CacheKey, HttpTimeout, RawHtml
+
+from .cache import BaseCache
 
 __all__ = [
     "BaseProvider",
+    "ProviderRequest",
 ]
 
+NOT_MODIFIED = 304
+
+logger = logging.getLogger(__name__)
+
+# Cached pages read during the current `get_series()`, tagged with the show status once the series is parsed
+_series_reads: "ContextVar[Optional[_SeriesReads]]" = ContextVar("series_reads", default=None)
+# Keys with a background refresh queued or running
+_refreshing: Set[CacheKey] = set()
+_refreshing_lock = threading.Lock()
+_refresh_executor: Optional[ThreadPoolExecutor] = None
+
+# Identical in-process fetches, keyed on (provider, data_type, id), share one cache lookup and download
+_single_flight = SingleFlight()
+_async_single_flight = AsyncSingleFlight()
+
+
+@attr.s(auto_attribs=True, kw_only=True, frozen=True)
+class ProviderRequest:
+    url: furl
+    headers: Dict[str, str] = attr.Factory(dict)
+    cache: Optional[BaseCache] = None
+    validator: Optional[Callable[[RawHtml], None]] = None
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class _SeriesReads:
+    pages: List[BaseCache] = attr.Factory(list)
+    # A stale page was served, the DTO parsed from it is not cached
+    stale: bool = False
+    # Details were left out of the series, e.g. past a time budget, the DTO is not cached either
+    partial: bool = False
+
 
 class BaseProvider:
-    def __init__(self, api_key: str, title_similarity_factor: float = 0.9) -> None:
+    # Pace of requests to each host of the provider, adapted at runtime to 429/503 responses
+    rate_limit: Optional[RateLimit] = None
+    # `dtos.TvSeriesData` fields the provider fills in, `None` means all of them
+    provides: Optional[FrozenSet[str]] = None
+    # Prior estimate of seconds per series lookup, used by the planner until real latencies are measured
+    expected_latency: float = 1.0
+    # Cache of the provider's raw pages, also holds its parsed `dtos.TvSeriesData`
+    cache_class: Optional[Type[BaseCache]] = None
+    # Bump when parsing changes, cached DTOs of older parser versions are ignored
+    parser_version: int = 1
+
+    def __init__(
+        self,
+        api_key: str,
+        title_similarity_factor: float = 0.9,
+        *,
+        transport: Optional[Transport] = None,
+        async_transport: Optional[AsyncTransport] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        timeout: Optional[HttpTimeout] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        stale_grace: timedelta = constants.CACHE_STALE_GRACE,
+    ) -> None:
         self.api_key = api_key
         self.title_similarity_factor = title_similarity_factor
+        self.transport = transport or get_default_transport()
+        self.async_transport = async_transport or get_default_async_transport()
+        self.scheduler = scheduler or get_default_scheduler()
+        # Overrides the transport's (connect, read) timeout for requests of this provider
+        self.timeout = timeout
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Shared by all instances of the provider class unless given explicitly
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker(self.__class__.__name__)
+        # For this long past expiry cached pages are served as they are while a refresh runs in the background
+        self.stale_grace = stale_grace
         super().__init__()
 
     def _get_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
         raise NotImplementedError
 
+    async def _aget_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        raise NotImplementedError
+
     def _find_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
         raise NotImplementedError
 
+    async def _afind_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
+        raise NotImplementedError
+
     def get_series(self, anime_id: AnimeId) -> dtos.TvSeriesData:
-        return self._get_series_by_id(anime_id)
+        if self.cache_class is None:
+            return self._get_series_by_id(anime_id)
+
+        with self._dto_cache(anime_id) as cache:
+            try:
+                return _loads_dto(cache.get())
+            except CacheDataNotFound:
+                pass
+
+            reads = _SeriesReads()
+            token = _series_reads.set(reads)
+            try:
+                result = self._get_series_by_id(anime_id)
+            finally:
+                _series_reads.reset(token)
+            self._store_series(cache, reads, result)
+
+        return result
+
+    async def aget_series(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        if self.cache_class is None:
+            return await self._aget_series_by_id(anime_id)
+
+        with self._dto_cache(anime_id) as cache:
+            try:
+                return _loads_dto(await cache.aget())
+            except CacheDataNotFound:
+                pass
+
+            reads = _SeriesReads()
+            token = _series_reads.set(reads)
+            try:
+                result = await self._aget_series_by_id(anime_id)
+            finally:
+                _series_reads.reset(token)
+            await self._astore_series(cache, reads, result)
+
+        return result
 
     def search_series(
         self,
@@ -36,16 +171,291 @@ class BaseProvider:
             raise ValidationError('At least one "title" argument is required!')
 
         for title in titles:
-            if title is None:
+            if title is None or self._is_known_no_result(title, year):
                 continue
             try:
                 return self._find_series_by_title(title, year)
             except ProviderNoResultError:
+                self._remember_no_result(title, year)
+
+        raise ProviderNoResultError(f"Cannot find {self.__class__.__name__} for titles={repr(titles)}")
+
+    async def asearch_series(
+        self,
+        *titles: Optional[AnimeTitle],
+        year: Optional[int] = None,
+    ) -> dtos.TvSeriesData:
+        if not titles:
+            raise ValidationError('At least one "title" argument is required!')
+
+        for title in titles:
+            if title is None or await self._ais_known_no_result(title, year):
                 continue
+            try:
+                return await self._afind_series_by_title(title, year)
+            except ProviderNoResultError:
+                await self._aremember_no_result(title, year)
 
         raise ProviderNoResultError(f"Cannot find {self.__class__.__name__} for titles={repr(titles)}")
 
+    def _dto_cache_variant(self) -> Tuple[Any, ...]:
+        """
+        Options of the instance which change the parsed series, DTOs parsed with other options are cached apart
+        """
+        return ()
+
+    def _dto_cache(self, anime_id: AnimeId) -> BaseCache:
+        data_type = f"dto,v{self.parser_version}"
+        variant = self._dto_cache_variant()
+        if variant:
+            data_type += "," + hashlib.blake2b(repr(variant).encode(), digest_size=5).hexdigest()
+        return self.cache_class(data_type, anime_id)  # type:ignore[misc]
+
+    def _mark_partial(self) -> None:
+        """
+        Keeps the series being parsed out of the DTO cache, e.g. when some of its details were left out
+        """
+        reads = _series_reads.get()
+        if reads is not None:
+            reads.partial = True
+
+    def _search_cache(self, data_type: str, title: AnimeTitle, *parts: Any) -> Optional[BaseCache]:
+        """
+        Cache of a title lookup keyed on the normalized title and `parts`, e.g. year or page of the search
+        """
+        if self.cache_class is None:
+            return None
+        return self.cache_class(data_type, utils.search_cache_id(title, *parts))
+
+    def _is_known_no_result(self, title: AnimeTitle, year: Optional[int]) -> bool:
+        cache = self._search_cache("search,noresult", title, year)
+        if cache is None:
+            return False
+        try:
+            cache.get()
+        except CacheDataNotFound:
+            return False
+        return True
+
+    async def _ais_known_no_result(self, title: AnimeTitle, year: Optional[int]) -> bool:
+        cache = self._search_cache("search,noresult", title, year)
+        if cache is None:
+            return False
+        try:
+            await cache.aget()
+        except CacheDataNotFound:
+            return False
+        return True
+
+    def _remember_no_result(self, title: AnimeTitle, year: Optional[int]) -> None:
+        cache = self._search_cache("search,noresult", title, year)
+        if cache is not None:
+            cache.set(b"")
+
+    async def _aremember_no_result(self, title: AnimeTitle, year: Optional[int]) -> None:
+        cache = self._search_cache("search,noresult", title, year)
+        if cache is not None:
+            await cache.aset(b"")
+
+    def _store_series(self, cache: BaseCache, reads: _SeriesReads, result: dtos.TvSeriesData) -> None:
+        # The pages share the lifetime of the series, e.g. pages of an airing show expire sooner
+        show_status = _show_status(result)
+        if show_status is not None:
+            BaseCache.set_show_status(reads.pages, show_status)
+        # A DTO parsed from stale pages would outlive their refresh, parse again once they are fresh
+        if not (reads.stale or reads.partial):
+            cache.set(dtos.dumps_series(result), show_status=show_status)
+
+    async def _astore_series(self, cache: BaseCache, reads: _SeriesReads, result: dtos.TvSeriesData) -> None:
+        show_status = _show_status(result)
+        if show_status is not None:
+            await BaseCache.aset_show_status(reads.pages, show_status)
+        if not (reads.stale or reads.partial):
+            await cache.aset(dtos.dumps_series(result), show_status=show_status)
+
+    def fetch(self, request: ProviderRequest) -> RawHtml:
+        if request.cache is None:
+            return self._download(request).content
+        _record_reads([request.cache])
+        return _single_flight.do(request.cache.key, lambda: self._fetch_cached(request))
+
+    async def afetch(self, request: ProviderRequest) -> RawHtml:
+        if request.cache is None:
+            return (await self._adownload(request)).content
+        _record_reads([request.cache])
+        return await _async_single_flight.do(request.cache.key, lambda: self._afetch_cached(request))
+
+    def get_cached_many(self, provider_requests: Sequence[ProviderRequest]) -> List[Optional[RawHtml]]:
+        """
+        Fresh cached data of `provider_requests` read in bulk, `None` for those which still have to be fetched
+        """
+        caches = [request.cache for request in provider_requests if request.cache is not None]
+        _record_reads(caches)
+        cached = iter(BaseCache.get_many(caches))
+        return [None if request.cache is None else next(cached) for request in provider_requests]
+
+    async def aget_cached_many(self, provider_requests: Sequence[ProviderRequest]) -> List[Optional[RawHtml]]:
+        caches = [request.cache for request in provider_requests if request.cache is not None]
+        _record_reads(caches)
+        cached = iter(await BaseCache.aget_many(caches))
+        return [None if request.cache is None else next(cached) for request in provider_requests]
+
     def get_request(self, url: furl, *args: Any, **kwargs: Any) -> bytes:
-        response = requests.get(url.tostr(), *args, **kwargs)
+        return self.get_response(url, *args, **kwargs).content
+
+    async def aget_request(self, url: furl, **kwargs: Any) -> bytes:
+        return (await self.aget_response(url, **kwargs)).content
+
+    def get_response(self, url: furl, *args: Any, **kwargs: Any) -> requests.Response:
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        return call_with_retries(lambda: self._send(url, *args, **kwargs), self.retry_policy, self.circuit_breaker)
+
+    async def aget_response(self, url: furl, **kwargs: Any) -> httpx.Response:
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", to_httpx_timeout(self.timeout))
+        return await acall_with_retries(lambda: self._asend(url, **kwargs), self.retry_policy, self.circuit_breaker)
+
+    def _send(self, url: furl, *args: Any, **kwargs: Any) -> requests.Response:
+        for _attempt in range(1 + constants.HTTP_THROTTLE_RETRIES):
+            self.scheduler.acquire(url.host, self.rate_limit)
+            response = self.transport.get(url, *args, **kwargs)
+            if not self.scheduler.feedback(
+                url.host, self.rate_limit, response.status_code, response.headers.get("Retry-After")
+            ):
+                break
+
         response.raise_for_status()
+        return response
+
+    async def _asend(self, url: furl, **kwargs: Any) -> httpx.Response:
+        for _attempt in range(1 + constants.HTTP_THROTTLE_RETRIES):
+            await self.scheduler.aacquire(url.host, self.rate_limit)
+            response = await self.async_transport.get(url, **kwargs)
+            if not self.scheduler.feedback(
+                url.host, self.rate_limit, response.status_code, response.headers.get("Retry-After")
+            ):
+                break
+
+        # Unlike requests, httpx treats every non-2xx status as an error, including 304 Not Modified
+        if response.status_code != NOT_MODIFIED:
+            response.raise_for_status()
+        return response
+
+    def _download(self, request: ProviderRequest, stale_entry: Optional[CacheEntry] = None) -> requests.Response:
+        response = self.get_response(request.url, headers=_conditional_headers(request, stale_entry))
+        if request.validator is not None and response.status_code != NOT_MODIFIED:
+            request.validator(response.content)
+        return response
+
+    async def _adownload(self, request: ProviderRequest, stale_entry: Optional[CacheEntry] = None) -> httpx.Response:
+        response = await self.aget_response(request.url, headers=_conditional_headers(request, stale_entry))
+        if request.validator is not None and response.status_code != NOT_MODIFIED:
+            request.validator(response.content)
+        return response
+
+    def _fetch_cached(self, request: ProviderRequest) -> RawHtml:
+        with request.cache as cache:  # type:ignore
+            try:
+                return cache.get()
+            except CacheDataExpired as exc:
+                if self._serve_stale(request, exc.entry):
+                    return exc.entry.data
+                stale_entry: Optional[CacheEntry] = exc.entry
+            except CacheDataNotFound:
+                stale_entry = None
+
+            return self._revalidate(cache, request, stale_entry)
+
+    def _revalidate(self, cache: BaseCache, request: ProviderRequest, stale_entry: Optional[CacheEntry]) -> RawHtml:
+        response = self._download(request, stale_entry)
+        if stale_entry is not None and response.status_code == NOT_MODIFIED:
+            cache.touch()
+            return stale_entry.data
+
+        cache.set(response.content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return response.content
+
+    def _serve_stale(self, request: ProviderRequest, stale_entry: CacheEntry) -> bool:
+        expires_at = request.cache.ttl_policy.expires_at(request.cache.key, stale_entry)  # type:ignore
+        if expires_at + self.stale_grace <= datetime.utcnow():
+            return False
+
+        reads = _series_reads.get()
+        if reads is not None:
+            reads.stale = True
+
+        with _refreshing_lock:
+            if request.cache.key in _refreshing:  # type:ignore
+                return True
+            _refreshing.add(request.cache.key)  # type:ignore
+        _get_refresh_executor().submit(self._refresh, request, stale_entry)
+        return True
+
+    def _refresh(self, request: ProviderRequest, stale_entry: CacheEntry) -> None:
+        try:
+            with request.cache as cache:  # type:ignore
+                self._revalidate(cache, request, stale_entry)
+        except Exception:
+            logger.exception("Background refresh of %s failed", request.url)
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(request.cache.key)  # type:ignore
+
+    async def _afetch_cached(self, request: ProviderRequest) -> RawHtml:
+        with request.cache as cache:  # type:ignore
+            try:
+                return await cache.aget()
+            except CacheDataExpired as exc:
+                # Refreshes run on the worker pool, they outlive the event loop of the caller
+                if self._serve_stale(request, exc.entry):
+                    return exc.entry.data
+                stale_entry: Optional[CacheEntry] = exc.entry
+            except CacheDataNotFound:
+                stale_entry = None
+
+            response = await self._adownload(request, stale_entry)
+            if stale_entry is not None and response.status_code == NOT_MODIFIED:
+                await cache.atouch()
+                return stale_entry.data
+
+            await cache.aset(response.content, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
         return response.content
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    global _refresh_executor
+
+    with _refreshing_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(thread_name_prefix="cache-refresh")
+    return _refresh_executor
+
+
+def _record_reads(caches: Sequence[BaseCache]) -> None:
+    reads = _series_reads.get()
+    if reads is not None:
+        reads.pages.extend(caches)
+
+
+def _show_status(data: dtos.TvSeriesData) -> Optional[enums.ShowStatus]:
+    return data.dates.status if data.dates else None
+
+
+def _loads_dto(raw_data: bytes) -> dtos.TvSeriesData:
+    try:
+        return dtos.loads_series(raw_data)
+    except ValueError:
+        # Stored by a version with other DTOs, parse the pages again
+        raise CacheDataNotFound
+
+
+def _conditional_headers(request: ProviderRequest, stale_entry: Optional[CacheEntry]) -> Dict[str, str]:
+    headers = dict(request.headers)
+    if stale_entry is not None:
+        if stale_entry.etag:
+            headers["If-None-Match"] = stale_entry.etag
+        if stale_entry.last_modified:
+            headers["If-Modified-Since"] = stale_entry.last_modified
+    return headers
@@ -0,0 +1,28 @@
+from typing import Dict
+
+from lxml.html import HtmlElement
+
+from anime_metadata import utils
+
+__all__ = [
+    "BaseScraper",
+]
+
+
+class BaseScraper:
+    """
+    Parses each raw page attribute lazily and at most once, every extractor reading the page shares its tree
+    """
+
+    def __init__(self) -> None:
+        self._pages: Dict[str, HtmlElement] = {}
+        super().__init__()
+
+    def _load_page(self, name: str) -> HtmlElement:
+        page = self._pages.get(name)
+        if page is None:
+            raw_data = getattr(self, name)
+            if not raw_data:
+                raise ValueError
+            page = self._pages[name] = utils.load_html(raw_data)
+        return page
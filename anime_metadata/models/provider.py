@@ -1,9 +1,12 @@
 from datetime import datetime
-from typing import Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import peewee
+from playhouse.migrate import SchemaMigrator, migrate
 
-from anime_metadata import constants
+from anime_metadata import constants, enums
+from anime_metadata.compression import compress, decompress
+from anime_metadata.typeshed import CacheEntry
 
 from .base import BaseModel
 
@@ -11,43 +14,232 @@ __all__ = [
     "ProviderCache",
 ]
 
+ProviderCacheKey = Tuple[str, str, str]  # (provider, id, data_type)
+# key + data, etag, last_modified, show_status
+ProviderCacheItem = Tuple[str, str, str, bytes, Optional[str], Optional[str], Optional[enums.ShowStatus]]
+
 
 class ProviderCache(BaseModel):
     id: str = peewee.CharField(max_length=10, index=True)
     provider: str = peewee.CharField(max_length=20, index=True)
     data_type: str = peewee.CharField(max_length=20, index=True)
     last_update: datetime = peewee.DateTimeField(default=datetime.utcnow)
+    # Last read or write of the row, to a precision of `CACHE_ACCESS_RESOLUTION`, drives LRU eviction
+    last_access: datetime = peewee.DateTimeField(default=datetime.utcnow, index=True)
     data: memoryview = peewee.BlobField()
+    # HTTP validators of `data`, used to revalidate expired rows with conditional requests
+    etag: Optional[str] = peewee.CharField(max_length=255, null=True)
+    last_modified: Optional[str] = peewee.CharField(max_length=64, null=True)
+    # Compression of `data`, NULL for rows stored uncompressed
+    codec: Optional[str] = peewee.CharField(max_length=8, null=True)
+    # `enums.ShowStatus` value of the show the row belongs to, selects its TTL; NULL until the show was parsed
+    show_status: Optional[str] = peewee.CharField(max_length=16, null=True)
 
     class Meta:
         table_name = "providers_cache"
         primary_key = peewee.CompositeKey("id", "provider", "data_type")
 
     @classmethod
-    def get(cls, provider: str, _id: str, _type: str) -> Union[bytes, None]:
-        try:
-            result: "ProviderCache" = super().get(
+    def migrate(cls) -> None:
+        """
+        Adds the columns missing from a table created by an older version, existing rows stay readable.
+
+        Run before `create_tables()`, which then adds the missing indexes.
+        """
+        database = cls._meta.database
+        table_name = cls._meta.table_name
+        if not database.table_exists(table_name):
+            return
+
+        columns = {column.name for column in database.get_columns(table_name)}
+        missing = [field for field in cls._meta.sorted_fields if field.column_name not in columns]
+        if not missing:
+            return
+
+        migrator = SchemaMigrator.from_database(database)
+        operations = []
+        for field in missing:
+            field = field.clone()
+            field.index = False
+            # Rows get the field default, e.g. `last_access` of the migration time or NULL validators, codec and status
+            operations.append(migrator.add_column(table_name, field.column_name, field))
+
+        with database.atomic():
+            migrate(*operations)
+
+    @classmethod
+    def get(cls, provider: str, _id: str, _type: str) -> Union[CacheEntry, None]:
+        return cls.get_many([(provider, _id, _type)]).get((provider, _id, _type))
+
+    @classmethod
+    def get_many(cls, keys: Iterable[ProviderCacheKey]) -> Dict[ProviderCacheKey, CacheEntry]:
+        result = {}
+        accessed = []
+        now = datetime.utcnow()
+        for batch in peewee.chunked(keys, constants.CACHE_BATCH_SIZE):
+            query = cls.select().where(peewee.Tuple(cls.provider, cls.id, cls.data_type).in_(batch))
+            for item in query:
+                if item.last_access + constants.CACHE_ACCESS_RESOLUTION <= now:
+                    accessed.append((item.provider, item.id, item.data_type))
+                result[(item.provider, item.id, item.data_type)] = CacheEntry(
+                    data=decompress(item.codec, bytes(item.data)),
+                    last_update=item.last_update,
+                    etag=item.etag,
+                    last_modified=item.last_modified,
+                    show_status=enums.ShowStatus(item.show_status) if item.show_status else None,
+                )
+
+        # Updating every read would turn reads into writes, a row is only touched once per resolution period
+        for batch in peewee.chunked(accessed, constants.CACHE_BATCH_SIZE):
+            cls.update(last_access=now).where(peewee.Tuple(cls.provider, cls.id, cls.data_type).in_(batch)).execute()
+        return result
+
+    @classmethod
+    def set(
+        cls,
+        provider: str,
+        _id: str,
+        _type: str,
+        data: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        show_status: Optional[enums.ShowStatus] = None,
+    ) -> None:
+        cls.set_many([(provider, _id, _type, data, etag, last_modified, show_status)])
+
+    @classmethod
+    def set_many(cls, items: Iterable[ProviderCacheItem]) -> None:
+        now = datetime.utcnow()
+        rows = []
+        for provider, _id, _type, data, etag, last_modified, show_status in items:
+            codec, payload = compress(data)
+            rows.append(
+                {
+                    "id": _id,
+                    "provider": provider,
+                    "data_type": _type,
+                    "codec": codec,
+                    "data": payload,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "last_update": now,
+                    "last_access": now,
+                    "show_status": show_status.value if show_status else None,
+                }
+            )
+
+        # INSERT ... ON CONFLICT DO UPDATE, a single statement per batch instead of SELECT + INSERT/UPDATE per row
+        with cls._meta.database.atomic():
+            for batch in peewee.chunked(rows, constants.CACHE_BATCH_SIZE):
+                cls.insert_many(batch).on_conflict(
+                    conflict_target=[cls.id, cls.provider, cls.data_type],
+                    preserve=[cls.codec, cls.data, cls.etag, cls.last_modified, cls.last_update, cls.last_access],
+                    # A refetched page still belongs to the same show, keep its status unless a new one is known
+                    update={cls.show_status: peewee.fn.COALESCE(peewee.EXCLUDED.show_status, cls.show_status)},
+                ).execute()
+
+    @classmethod
+    def touch(cls, provider: str, _id: str, _type: str) -> None:
+        now = datetime.utcnow()
+        cls.update(last_update=now, last_access=now).where(
+            cls.provider == provider,
+            cls.id == _id,
+            cls.data_type == _type,
+        ).execute()
+
+    @classmethod
+    def set_show_status(cls, keys: Iterable[ProviderCacheKey], show_status: enums.ShowStatus) -> None:
+        with cls._meta.database.atomic():
+            for batch in peewee.chunked(keys, constants.CACHE_BATCH_SIZE):
+                cls.update(show_status=show_status.value).where(
+                    peewee.Tuple(cls.provider, cls.id, cls.data_type).in_(batch)
+                ).execute()
+
+    @classmethod
+    def delete_many(cls, keys: Iterable[ProviderCacheKey]) -> int:
+        deleted = 0
+        # One short transaction per batch, concurrent readers and writers are never blocked for long
+        for batch in peewee.chunked(keys, constants.CACHE_BATCH_SIZE):
+            with cls._meta.database.atomic():
+                deleted += cls.delete().where(peewee.Tuple(cls.provider, cls.id, cls.data_type).in_(batch)).execute()
+        return deleted
+
+    @classmethod
+    def iter_ttl_groups(cls) -> Iterator[Dict[str, Any]]:
+        """
+        Distinct `provider`, `data_type` and `show_status` of the rows, which together select their TTL
+        """
+        return cls.select(cls.provider, cls.data_type, cls.show_status).distinct().dicts().iterator()
+
+    @classmethod
+    def delete_updated_before(
+        cls,
+        provider: str,
+        data_type: str,
+        show_status: Optional[str],
+        updated_before: datetime,
+    ) -> int:
+        query = (
+            cls.select(cls.provider, cls.id, cls.data_type)
+            .where(
                 cls.provider == provider,
-                cls.id == _id,
-                cls.data_type == _type,
+                cls.data_type == data_type,
+                peewee.fn.COALESCE(cls.show_status, "") == (show_status or ""),
+                cls.last_update <= updated_before,
             )
-        except peewee.DoesNotExist:
-            return None
+            .limit(constants.CACHE_BATCH_SIZE)
+        )
 
-        if result.last_update + constants.MAX_CACHE_LIFETIME <= datetime.utcnow():
-            return None
+        deleted = 0
+        while True:
+            with cls._meta.database.atomic():
+                count = cls.delete().where(peewee.Tuple(cls.provider, cls.id, cls.data_type).in_(query)).execute()
+            deleted += count
+            if count < constants.CACHE_BATCH_SIZE:
+                return deleted
 
-        return result.data.tobytes()
+    @classmethod
+    def least_recently_accessed(cls, limit: int) -> List[Dict[str, Any]]:
+        """
+        Keys of the `limit` rows accessed longest ago, `size` is the stored (compressed) data length
+        """
+        return list(
+            cls.select(cls.provider, cls.id, cls.data_type, peewee.fn.LENGTH(cls.data).alias("size"))
+            .order_by(cls.last_access)
+            .limit(limit)
+            .dicts()
+            .iterator()
+        )
 
     @classmethod
-    def set(cls, provider: str, _id: str, _type: str, data: bytes) -> None:
-        item, _created = cls.get_or_create(
-            id=_id,
-            provider=provider,
-            data_type=_type,
-            defaults={
-                "data": data,
-            },
+    def usage(cls) -> Iterator[Dict[str, Any]]:
+        """
+        `entries`, `size` and oldest `last_access` of rows grouped by provider and data type
+        """
+        return (
+            cls.select(
+                cls.provider,
+                cls.data_type,
+                peewee.fn.COUNT(cls.id).alias("entries"),
+                peewee.fn.SUM(peewee.fn.LENGTH(cls.data)).alias("size"),
+                peewee.fn.MIN(cls.last_access).alias("last_access"),
+            )
+            .group_by(cls.provider, cls.data_type)
+            .order_by(cls.provider, cls.data_type)
+            .dicts()
+            .iterator()
         )
-        item.data = data
-        item.save()
+
+    @classmethod
+    def vacuum(cls) -> None:
+        """
+        Makes the space of deleted rows reusable, on Postgres without locking out readers and writers
+        """
+        database = cls._meta.database
+        if isinstance(database, peewee.PostgresqlDatabase):
+            sql = f'VACUUM ANALYZE "{cls._meta.table_name}"'
+        elif isinstance(database, peewee.SqliteDatabase):
+            sql = "VACUUM"
+        else:
+            return
+        cls.raw(sql).execute()
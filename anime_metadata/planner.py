@@ -0,0 +1,202 @@
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Set
+
+import attr
+
+from anime_metadata import dtos, interfaces
+from anime_metadata.aggregator import MERGED_FIELDS, Aggregator, is_empty
+from anime_metadata.exceptions import ProviderNoResultError, ProviderUnavailableError, ValidationError
+from anime_metadata.typeshed import AnimeId, AnimeTitle
+
+__all__ = [
+    "LatencyTracker",
+    "Planner",
+]
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest measurement in the moving average of provider latency
+LATENCY_SMOOTHING = 0.3
+
+
+class LatencyTracker:
+    def __init__(self, smoothing: float = LATENCY_SMOOTHING) -> None:
+        self.smoothing = smoothing
+        self._latencies: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, provider: str, seconds: float) -> None:
+        with self._lock:
+            previous = self._latencies.get(provider)
+            self._latencies[provider] = (
+                seconds if previous is None else self.smoothing * seconds + (1 - self.smoothing) * previous
+            )
+
+    def estimate(self, provider: str, default: float) -> float:
+        with self._lock:
+            return self._latencies.get(provider, default)
+
+
+class Planner(Aggregator):
+    """
+    Queries providers one by one, cheapest first, until every requested field is filled.
+
+    Fields are `dtos.TvSeriesData` attribute names, optionally dotted into nested DTOs (e.g. `images.folder`).
+    Providers are ranked by measured latency, falling back to their `expected_latency` before the first lookup, and
+    skipped when none of the still missing fields is in their `provides`.
+    """
+
+    def __init__(self, *args: Any, latency_tracker: Optional[LatencyTracker] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.latency_tracker = latency_tracker or LatencyTracker()
+
+    def plan(self, fields: Iterable[str]) -> List[str]:
+        wanted = _top_level_fields(fields)
+        candidates = [name for name, provider in self.providers.items() if _provides_any(provider, wanted)]
+        return sorted(
+            candidates,
+            key=lambda name: self.latency_tracker.estimate(name, self.providers[name].expected_latency),
+        )
+
+    def search_series(
+        self,
+        *titles: Optional[AnimeTitle],
+        fields: Iterable[str] = MERGED_FIELDS,
+        year: Optional[int] = None,
+    ) -> dtos.TvSeriesData:
+        return self._run(
+            fields,
+            self.plan(fields),
+            lambda name: self.providers[name].search_series(*titles, year=year),
+        )
+
+    def get_series(
+        self,
+        anime_ids: Mapping[str, AnimeId],
+        fields: Iterable[str] = MERGED_FIELDS,
+    ) -> dtos.TvSeriesData:
+        return self._run(
+            fields,
+            [name for name in self.plan(fields) if name in anime_ids],
+            lambda name: self.providers[name].get_series(anime_ids[name]),
+        )
+
+    async def asearch_series(
+        self,
+        *titles: Optional[AnimeTitle],
+        fields: Iterable[str] = MERGED_FIELDS,
+        year: Optional[int] = None,
+    ) -> dtos.TvSeriesData:
+        return await self._arun(
+            fields,
+            self.plan(fields),
+            lambda name: self.providers[name].asearch_series(*titles, year=year),
+        )
+
+    async def aget_series(
+        self,
+        anime_ids: Mapping[str, AnimeId],
+        fields: Iterable[str] = MERGED_FIELDS,
+    ) -> dtos.TvSeriesData:
+        return await self._arun(
+            fields,
+            [name for name in self.plan(fields) if name in anime_ids],
+            lambda name: self.providers[name].aget_series(anime_ids[name]),
+        )
+
+    def _run(
+        self,
+        fields: Iterable[str],
+        plan: List[str],
+        call: Callable[[str], dtos.TvSeriesData],
+    ) -> dtos.TvSeriesData:
+        missing = _validate_fields(fields)
+        results: Dict[str, dtos.TvSeriesData] = {}
+
+        for name in plan:
+            if not _provides_any(self.providers[name], _top_level_fields(missing)):
+                continue
+            started = time.monotonic()
+            try:
+                results[name] = call(name)
+            except Exception as exc:
+                # Like the aggregator, a failed provider is skipped and the next cheapest one tried instead
+                _log_provider_error(name, exc)
+                continue
+            finally:
+                self.latency_tracker.observe(name, time.monotonic() - started)
+
+            missing = _missing_fields(self.merge(results), missing)
+            if not missing:
+                break
+
+        return self.merge(results)
+
+    async def _arun(
+        self,
+        fields: Iterable[str],
+        plan: List[str],
+        call: Callable[[str], Awaitable[dtos.TvSeriesData]],
+    ) -> dtos.TvSeriesData:
+        missing = _validate_fields(fields)
+        results: Dict[str, dtos.TvSeriesData] = {}
+
+        for name in plan:
+            if not _provides_any(self.providers[name], _top_level_fields(missing)):
+                continue
+            started = time.monotonic()
+            try:
+                results[name] = await call(name)
+            except Exception as exc:
+                _log_provider_error(name, exc)
+                continue
+            finally:
+                self.latency_tracker.observe(name, time.monotonic() - started)
+
+            missing = _missing_fields(self.merge(results), missing)
+            if not missing:
+                break
+
+        return self.merge(results)
+
+
+def _log_provider_error(provider: str, exc: Exception) -> None:
+    if isinstance(exc, (ProviderNoResultError, ProviderUnavailableError)):
+        logger.debug("%s: %r", provider, exc)
+    else:
+        logger.warning("%s failed, trying the next provider", provider, exc_info=exc)
+
+
+def _validate_fields(fields: Iterable[str]) -> Set[str]:
+    result = set(fields)
+    if not result:
+        raise ValidationError('At least one "field" is required!')
+
+    unknown = _top_level_fields(result) - set(MERGED_FIELDS)
+    if unknown:
+        raise ValidationError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return result
+
+
+def _top_level_fields(fields: Iterable[str]) -> Set[str]:
+    return {field.split(".", 1)[0] for field in fields}
+
+
+def _provides_any(provider: interfaces.BaseProvider, fields: Set[str]) -> bool:
+    return provider.provides is None or not provider.provides.isdisjoint(fields)
+
+
+def _missing_fields(data: dtos.TvSeriesData, fields: Iterable[str]) -> Set[str]:
+    return {field for field in fields if is_empty(_get_field(data, field))}
+
+
+def _get_field(data: Any, field: str) -> Any:
+    for name in field.split("."):
+        if data is None:
+            return None
+        if not attr.has(type(data)) or not hasattr(data, name):
+            raise ValidationError(f"Unknown field: {field}")
+        data = getattr(data, name)
+    return data
@@ -1,14 +1,17 @@
+import asyncio
 from collections import OrderedDict, defaultdict
+import io
 from pathlib import Path
 import re
-from typing import Any, Dict, List, Optional, Sequence, Set, Union, cast
-import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union, cast
 
 from furl import furl
+from lxml import etree
 import requests
 
 from anime_metadata import constants, dtos, enums, interfaces, utils
-from anime_metadata.exceptions import CacheDataNotFound, ProviderResultFound
+from anime_metadata.exceptions import ProviderResultFound
+from anime_metadata.ratelimit import RateLimit
 from anime_metadata.typeshed import (
     AnimeId,
     AnimeTitle,
@@ -20,6 +23,7 @@ from anime_metadata.typeshed import (
     StaffList,
 )
 
+from . import xpaths
 from .typeshed import DatRow
 
 __all__ = [
@@ -42,6 +46,27 @@ class Cache(interfaces.BaseCache):
 
 
 class AniDBProvider(interfaces.BaseProvider):
+    # https://wiki.anidb.net/HTTP_API_Definition#Flood_Protection
+    rate_limit = RateLimit(requests_per_second=0.5)
+    provides = frozenset(
+        {
+            "dates",
+            "episodes",
+            "genres",
+            "images",
+            "main_characters",
+            "plot",
+            "rating",
+            "secondary_characters",
+            "source_material",
+            "staff",
+            "studios",
+            "titles",
+        }
+    )
+    expected_latency = 4.0
+    cache_class = Cache
+
     def __init__(self, *args: Any, anime_titles_file: Path, **kwargs: Any) -> None:
         # https://wiki.anidb.net/API#Anime_Titles
         self.anime_titles_db = tuple(
@@ -52,6 +77,27 @@ class AniDBProvider(interfaces.BaseProvider):
         super().__init__(*args, **kwargs)
 
     def _find_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
+        return self.get_series(self._find_anime_id_by_title(title))
+
+    async def _afind_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
+        return await self.aget_series(self._find_anime_id_by_title(title))
+
+    def _get_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        return _raw_data_to_dto(
+            self.fetch(self._anime_from_api_request(anime_id)),
+            self.fetch(self._anime_from_web_request(anime_id)),
+        )
+
+    async def _aget_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        raw_xml_doc, web_html_page = await asyncio.gather(
+            self.afetch(self._anime_from_api_request(anime_id)),
+            self.afetch(self._anime_from_web_request(anime_id)),
+        )
+        return _raw_data_to_dto(raw_xml_doc, web_html_page)
+
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _find_anime_id_by_title(self, title: AnimeTitle) -> AnimeId:
         try:
             utils.find_title_in_provider_results(
                 title=title,
@@ -60,56 +106,42 @@ class AniDBProvider(interfaces.BaseProvider):
                 title_similarity_factor=self.title_similarity_factor,
             )
         except ProviderResultFound as exc:
-            return self._get_series_by_id(cast(DatRow, exc.data_item).aid)
+            return cast(DatRow, exc.data_item).aid
 
         raise NotImplementedError
 
-    def _get_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
-        return _raw_data_to_dto(
-            self._get_anime_from_api(anime_id),
-            self._get_anime_from_web(anime_id),
+    def _anime_from_api_request(self, anime_id: AnimeId) -> interfaces.ProviderRequest:
+        # https://wiki.anidb.net/HTTP_API_Definition
+        return interfaces.ProviderRequest(
+            cache=Cache("httpapi,anime", anime_id),
+            url=furl(
+                BASE_API_URL,
+                args={
+                    "aid": anime_id,
+                    "client": self.api_key.split("|")[0],
+                    "clientver": self.api_key.split("|")[1],
+                    "protover": 1,
+                    "request": "anime",
+                },
+            ).add(path=["httpapi"]),
+            validator=_validate_api_response,
+        )
+
+    def _anime_from_web_request(self, anime_id: AnimeId) -> interfaces.ProviderRequest:
+        return interfaces.ProviderRequest(
+            cache=Cache("web,anime", anime_id),
+            url=furl(BASE_WEB_URL).add(path=["anime", anime_id]),
+            headers={
+                "User-Agent": constants.USER_AGENT,
+                "Referer": BASE_WEB_URL,
+            },
         )
 
-    # ------------------------------------------------------------------------------------------------------------------
 
-    def _get_anime_from_api(self, anime_id: AnimeId) -> RawHtml:
-        with Cache("httpapi,anime", anime_id) as cache:
-            try:
-                raw_xml_doc = cache.get()
-            except CacheDataNotFound:
-                # https://wiki.anidb.net/HTTP_API_Definition
-                raw_xml_doc = self.get_request(
-                    furl(
-                        BASE_API_URL,
-                        args={
-                            "aid": anime_id,
-                            "client": self.api_key.split("|")[0],
-                            "clientver": self.api_key.split("|")[1],
-                            "protover": 1,
-                            "request": "anime",
-                        },
-                    ).add(path=["httpapi"])
-                )
-                if raw_xml_doc.startswith(b"<error"):
-                    raise requests.HTTPError(raw_xml_doc.decode("utf-8"))
-
-        return raw_xml_doc
-
-    def _get_anime_from_web(self, anime_id: AnimeId) -> RawHtml:
-        with Cache("web,anime", anime_id) as cache:
-            try:
-                raw_html_page = cache.get()
-            except CacheDataNotFound:
-                raw_html_page = self.get_request(
-                    furl(BASE_WEB_URL).add(path=["anime", anime_id]),
-                    headers={
-                        "User-Agent": constants.USER_AGENT,
-                        "Referer": BASE_WEB_URL,
-                    },
-                )
-                cache.set(raw_html_page)
-
-        return raw_html_page
+def _validate_api_response(raw_xml_doc: RawHtml) -> None:
+    # AniDB HTTP API reports errors (e.g. bans) with HTTP 200 and an <error> document
+    if raw_xml_doc.startswith(b"<error"):
+        raise requests.HTTPError(raw_xml_doc.decode("utf-8"))
 
 
 def _raw_data_to_dto(raw_xml_doc: RawHtml, web_html_page: RawHtml) -> dtos.TvSeriesData:
@@ -173,122 +205,179 @@ class AniDBXML:
     NS = "{http://www.w3.org/XML/1998/namespace}"
 
     def __init__(self, raw_xml_doc: RawHtml) -> None:
-        self.xml_root = ET.fromstring(raw_xml_doc)
+        self._id: AnimeId = ""
+        # Text of the direct children of <anime>, e.g. dates, picture and description
+        self._texts: Dict[str, Optional[str]] = {}
+        self._rating: Optional[str] = None
+        self._main_characters: Dict[str, str] = {}
+        self._supporting_characters: Dict[str, str] = {}
+        self._regular_episodes: List[RawEpisode] = []
+        self._special_episodes: List[RawEpisode] = []
+        self._main_staff: StaffList = defaultdict(set)
+        self._titles: Dict[enums.Language, Dict[str, AnimeTitle]] = defaultdict(dict)
+        self._parse(raw_xml_doc)
         super().__init__()
 
     def get_characters(self) -> Dict[enums.CharacterType, CharacterList]:
-        main_characters = {}
-        supporting_characters = {}
-
-        for item in self.xml_root.findall("./characters/character"):
-            name = getattr(item.find("./name"), "text", "").strip()
-            seiyuu = getattr(item.find("./seiyuu"), "text", "").strip()
-
-            if not (name and seiyuu):
-                continue
-
-            if "main character" in item.attrib["type"]:
-                main_characters[name] = utils.reverse_name_order(seiyuu)
-            if "secondary cast" in item.attrib["type"]:
-                supporting_characters[name] = utils.reverse_name_order(seiyuu)
-
         return {
-            enums.CharacterType.MAIN: OrderedDict(sorted(main_characters.items())),
-            enums.CharacterType.SUPPORTING: OrderedDict(sorted(supporting_characters.items())),
+            enums.CharacterType.MAIN: OrderedDict(sorted(self._main_characters.items())),
+            enums.CharacterType.SUPPORTING: OrderedDict(sorted(self._supporting_characters.items())),
         }
 
     def get_date(self, date_name: str) -> Union[Iso8601DateStr, Iso8601DateTimeStr, None]:
-        result = self.xml_root.find(f"./{date_name}")
-        if result is None:
+        if date_name not in self._texts:
             return None
-        return result.text.strip()
-
-    def get_episodes(self) -> Dict[enums.EpisodeType, Sequence[RawEpisode]]:  # noqa: C901
-        result_regular = []
-        result_special = []
+        return self._texts[date_name].strip()  # type:ignore
 
-        for item in self.xml_root.findall("./episodes/episode"):
-            _epno = item.find("./epno")
-            # 1 = regular, 2 = Special (& OVA?), 3 = Opening/Ending, 4 = Trailer/Promo
-            _type = int(_epno.attrib["type"])
-
-            if _type not in (1, 2):
-                continue
+    def get_episodes(self) -> Dict[enums.EpisodeType, Sequence[RawEpisode]]:
+        return {
+            enums.EpisodeType.REGULAR: sorted(
+                self._regular_episodes, key=lambda item: (int(item["no"]), item.get("airdate"))
+            ),
+            enums.EpisodeType.SPECIAL: sorted(
+                self._special_episodes, key=lambda item: (int(item["no"]), item.get("airdate"))
+            ),
+        }
 
-            no = int(re.search(r"(\d+)", _epno.text).group(1))  # type:ignore
-            if not no:
-                continue
+    def get_id(self) -> AnimeId:
+        return self._id
 
-            ep: RawEpisode = {
-                "id": item.attrib.get("id"),
-                "no": no,
-                "titles": self.get_titles(item),
-            }
+    def get_main_staff(self) -> StaffList:
+        return self._main_staff
 
-            airdate = getattr(item.find("./airdate"), "text", None)
-            if airdate:
-                ep["premiered"] = airdate
+    def get_picture(self) -> str:
+        return utils.normalize_string(self._texts.get("picture"))
 
-            plot = utils.normalize_string(item.find("./summary"))
-            if plot:
-                ep["plot"] = plot
+    def get_plot(self) -> str:
+        return utils.normalize_string(self._texts.get("description"))
 
-            rating = getattr(item.find("./rating"), "text", None)
-            if rating:
-                ep["rating"] = rating
+    def get_rating(self) -> Optional[str]:
+        return self._rating
 
-            if _type == 1:
-                result_regular.append(ep)
-            elif _type == 2:
-                result_special.append(ep)
+    def get_titles(self, elem: etree._Element = None) -> Dict[enums.Language, AnimeTitle]:
+        results: Dict[enums.Language, Dict[str, AnimeTitle]] = self._titles
+        if elem is not None:
+            results = defaultdict(dict)
+            for item in elem.findall("./title"):
+                _add_title(results, item)
 
         return {
-            enums.EpisodeType.REGULAR: sorted(result_regular, key=lambda item: (int(item["no"]), item.get("airdate"))),
-            enums.EpisodeType.SPECIAL: sorted(result_special, key=lambda item: (int(item["no"]), item.get("airdate"))),
+            lang: utils.normalize_string(titles.get("main", titles.get("official"))) for lang, titles in results.items()
         }
 
-    def get_id(self) -> AnimeId:
-        return self.xml_root.attrib["id"]
+    def _parse(self, raw_xml_doc: RawHtml) -> None:
+        """
+        Fills every section in a single streaming pass, finished items and sections are dropped right away
+        """
+        # External entities are neither resolved nor downloaded (XXE)
+        events = etree.iterparse(
+            io.BytesIO(raw_xml_doc),
+            events=("end",),
+            remove_comments=True,
+            resolve_entities=False,
+            no_network=True,
+        )
+        for _, elem in events:
+            parent = elem.getparent()
+            if parent is None:
+                # <anime> is the last element to end
+                self._id = elem.attrib["id"]
+            elif parent.getparent() is None:
+                self._texts[elem.tag] = elem.text
+                _release(elem)
+            elif parent.getparent().getparent() is None:
+                handler = self._item_handlers.get((parent.tag, elem.tag))
+                if handler is not None:
+                    handler(self, elem)
+                _release(elem)
+
+    def _add_character(self, item: etree._Element) -> None:
+        name = getattr(item.find("./name"), "text", "").strip()
+        seiyuu = getattr(item.find("./seiyuu"), "text", "").strip()
+
+        if not (name and seiyuu):
+            return
+
+        if "main character" in item.attrib["type"]:
+            self._main_characters[name] = utils.reverse_name_order(seiyuu)
+        if "secondary cast" in item.attrib["type"]:
+            self._supporting_characters[name] = utils.reverse_name_order(seiyuu)
+
+    def _add_episode(self, item: etree._Element) -> None:  # noqa: C901
+        _epno = item.find("./epno")
+        # 1 = regular, 2 = Special (& OVA?), 3 = Opening/Ending, 4 = Trailer/Promo
+        _type = int(_epno.attrib["type"])
+
+        if _type not in (1, 2):
+            return
+
+        no = int(re.search(r"(\d+)", _epno.text).group(1))  # type:ignore
+        if not no:
+            return
+
+        ep: RawEpisode = {
+            "id": item.attrib.get("id"),
+            "no": no,
+            "titles": self.get_titles(item),
+        }
 
-    def get_main_staff(self) -> StaffList:
-        results = defaultdict(set)
+        airdate = getattr(item.find("./airdate"), "text", None)
+        if airdate:
+            ep["premiered"] = airdate
 
-        for item in self.xml_root.findall("./creators/name"):
-            results[item.attrib["type"]].add(utils.reverse_name_order(item.text))
+        plot = utils.normalize_string(item.find("./summary"))
+        if plot:
+            ep["plot"] = plot
 
-        return results
+        rating = getattr(item.find("./rating"), "text", None)
+        if rating:
+            ep["rating"] = rating
 
-    def get_picture(self) -> str:
-        return utils.normalize_string(self.xml_root.find("./picture"))
+        if _type == 1:
+            self._regular_episodes.append(ep)
+        elif _type == 2:
+            self._special_episodes.append(ep)
 
-    def get_plot(self) -> str:
-        return utils.normalize_string(self.xml_root.find("./description"))
+    def _add_creator(self, item: etree._Element) -> None:
+        self._main_staff[item.attrib["type"]].add(utils.reverse_name_order(item.text))
 
-    def get_rating(self) -> Optional[str]:
-        return getattr(self.xml_root.find("./ratings/permanent"), "text", None)
+    def _add_anime_title(self, item: etree._Element) -> None:
+        _add_title(self._titles, item)
 
-    def get_titles(self, elem: ET.Element = None) -> Dict[enums.Language, AnimeTitle]:
-        elem = elem or self.xml_root.find("./titles")
+    def _set_rating(self, item: etree._Element) -> None:
+        self._rating = item.text
 
-        results: Dict[enums.Language, Dict[str, AnimeTitle]] = defaultdict(dict)
+    # Items handled as soon as they are parsed, keyed on their path below <anime>
+    _item_handlers: Dict[Tuple[str, ...], Callable[["AniDBXML", etree._Element], None]] = {
+        ("characters", "character"): _add_character,
+        ("episodes", "episode"): _add_episode,
+        ("creators", "name"): _add_creator,
+        ("titles", "title"): _add_anime_title,
+        ("ratings", "permanent"): _set_rating,
+    }
 
-        for item in elem.findall("./title"):
-            _lang = item.attrib[f"{AniDBXML.NS}lang"]
-            _type = item.attrib.get("type", "main")
 
-            if _lang not in LANG.keys():
-                continue
-            if _type not in ("main", "official"):
-                continue
+def _add_title(results: Dict[enums.Language, Dict[str, AnimeTitle]], item: etree._Element) -> None:
+    _lang = item.attrib[f"{AniDBXML.NS}lang"]
+    _type = item.attrib.get("type", "main")
 
-            results[LANG[_lang]].setdefault(_type, item.text.rstrip("."))
+    if _lang not in LANG.keys():
+        return
+    if _type not in ("main", "official"):
+        return
 
-        return {
-            lang: utils.normalize_string(titles.get("main", titles.get("official"))) for lang, titles in results.items()
-        }
+    results[LANG[_lang]].setdefault(_type, item.text.rstrip("."))
+
+
+def _release(elem: etree._Element) -> None:
+    # A cleared element still hangs on its parent, drop it together with the siblings handled before it
+    elem.clear()
+    parent = elem.getparent()
+    while elem.getprevious() is not None:
+        del parent[0]
 
 
-class AniDBWeb:
+class AniDBWeb(interfaces.BaseScraper):
     source_material_tags = {
         # https://anidb.net/tag/2609/animetb
         2609: "original work",
@@ -310,14 +399,13 @@ class AniDBWeb:
 
     def __init__(self, *, anime_page: bytes = None) -> None:
         self.anime_page = anime_page
+        self._all_tags: Optional[List[Dict[str, Union[int, str]]]] = None
         super().__init__()
 
     def extract_episodes_count(self) -> int:
-        if not self.anime_page:
-            raise ValueError
-        the_page = utils.load_html(self.anime_page)
+        the_page = self._load_page("anime_page")
 
-        return int(the_page.xpath("//*[@itemprop='numberOfEpisodes']")[0].text.strip())
+        return int(xpaths.EPISODES_COUNT(the_page)[0].text.strip())
 
     def extract_source_material(self) -> enums.SourceMaterial:
         # fmt: off
@@ -357,19 +445,21 @@ class AniDBWeb:
         # fmt: on
 
     def _get_all_tags(self) -> List[Dict[str, Union[int, str]]]:
-        if not self.anime_page:
-            raise ValueError
-        the_page = utils.load_html(self.anime_page)
+        # Shared by source material and tags extraction
+        if self._all_tags is not None:
+            return self._all_tags
+        the_page = self._load_page("anime_page")
 
         result = []
-        for item in the_page.xpath("//span[contains(@class, 'tagname')][@itemprop='genre']"):
+        for item in xpaths.TAGS(the_page):
             result.append(
                 {
-                    "id": int(item.xpath("./ancestor::a[position()=1]")[0].attrib["href"].split("/")[2]),
+                    "id": int(xpaths.TAG_LINK(item)[0].attrib["href"].split("/")[2]),
                     "name": item.text.strip(),
                 }
             )
 
+        self._all_tags = result
         return result
 
 
@@ -0,0 +1,13 @@
+from lxml.etree import XPath
+
+__all__ = [
+    "EPISODES_COUNT",
+    "TAGS",
+    "TAG_LINK",
+]
+
+EPISODES_COUNT = XPath("//*[@itemprop='numberOfEpisodes']")
+
+# Tag name elements of the anime page, relative selectors below apply to them
+TAGS = XPath("//span[contains(@class, 'tagname')][@itemprop='genre']")
+TAG_LINK = XPath("./ancestor::a[position()=1]")
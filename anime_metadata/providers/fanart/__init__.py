@@ -1,10 +1,10 @@
 import json
-from typing import Any, List, Optional, Sequence, Union, cast
+from typing import Any, List, Optional, Sequence, Tuple, Union, cast
 
 from furl import furl
 
 from anime_metadata import constants, dtos, enums, interfaces, utils
-from anime_metadata.exceptions import CacheDataNotFound, ProviderResultFound
+from anime_metadata.exceptions import ProviderResultFound
 from anime_metadata.typeshed import AnimeId, AnimeTitle
 
 from .typeshed import ImageData, SearchResultItem, TvData
@@ -22,14 +22,52 @@ class Cache(interfaces.BaseCache):
 
 
 class FanartProvider(interfaces.BaseProvider):
+    provides = frozenset({"images", "titles"})
+    expected_latency = 0.5
+    cache_class = Cache
+
     def __init__(self, *args: Any, preferred_lang: Sequence[enums.Language] = None, **kwargs: Any) -> None:
         preferred_lang = preferred_lang or [enums.Language.ENGLISH, enums.Language.JAPANESE, enums.Language.UNKNOWN]
         self.preferred_lang = [item.value for item in preferred_lang]
         super().__init__(*args, **kwargs)
 
+    def _dto_cache_variant(self) -> Tuple[Any, ...]:
+        return tuple(self.preferred_lang)
+
     def _find_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
-        response = self.get_request(
-            furl(
+        return self.get_series(self._match_search_results(title, self.fetch(self._search_request(title))))
+
+    async def _afind_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
+        raw_stringified_json = await self.afetch(self._search_request(title))
+        return await self.aget_series(self._match_search_results(title, raw_stringified_json))
+
+    def _get_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        return self._json_data_to_dto(anime_id, json.loads(self.fetch(self._tv_request(anime_id))))
+
+    async def _aget_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        return self._json_data_to_dto(anime_id, json.loads(await self.afetch(self._tv_request(anime_id))))
+
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _match_search_results(self, title: AnimeTitle, raw_stringified_json: bytes) -> AnimeId:
+        json_data: List[SearchResultItem] = json.loads(raw_stringified_json)
+
+        try:
+            utils.find_title_in_provider_results(
+                title=title,
+                data=(item for item in json_data if int(item["image_count"]) > 0),  # type:ignore
+                data_item_title_getter=lambda item: cast(SearchResultItem, item)["title"],
+                title_similarity_factor=self.title_similarity_factor,
+            )
+        except ProviderResultFound as exc:
+            return cast(SearchResultItem, exc.data_item)["id"]
+
+        raise NotImplementedError
+
+    def _search_request(self, title: AnimeTitle) -> interfaces.ProviderRequest:
+        return interfaces.ProviderRequest(
+            cache=self._search_cache("search", title),
+            url=furl(
                 BASE_WEB_URL,
                 path=["api", "search.php"],
                 args={
@@ -44,37 +82,19 @@ class FanartProvider(interfaces.BaseProvider):
                 "Alt-Used": "fanart.tv",
             },
         )
-        json_data: List[SearchResultItem] = json.loads(response)
-
-        try:
-            utils.find_title_in_provider_results(
-                title=title,
-                data=(item for item in json_data if int(item["image_count"]) > 0),  # type:ignore
-                data_item_title_getter=lambda item: cast(SearchResultItem, item)["title"],
-                title_similarity_factor=self.title_similarity_factor,
-            )
-        except ProviderResultFound as exc:
-            return self._get_series_by_id(cast(SearchResultItem, exc.data_item)["id"])
 
-        raise NotImplementedError
-
-    def _get_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
-        with Cache("api,tv", anime_id) as cache:
-            try:
-                raw_stringified_json = cache.get()
-            except CacheDataNotFound:
-                # https://fanarttv.docs.apiary.io/#reference/tv/get-show/get-images-for-show
-                raw_stringified_json = self.get_request(
-                    furl(
-                        BASE_API_URL,
-                        path=["v3", "tv", anime_id],
-                        args={"api_key": self.api_key},
-                    ),
-                )
-                cache.set(raw_stringified_json)
-
-        json_data: TvData = json.loads(raw_stringified_json)
+    def _tv_request(self, anime_id: AnimeId) -> interfaces.ProviderRequest:
+        # https://fanarttv.docs.apiary.io/#reference/tv/get-show/get-images-for-show
+        return interfaces.ProviderRequest(
+            cache=Cache("api,tv", anime_id),
+            url=furl(
+                BASE_API_URL,
+                path=["v3", "tv", anime_id],
+                args={"api_key": self.api_key},
+            ),
+        )
 
+    def _json_data_to_dto(self, anime_id: AnimeId, json_data: TvData) -> dtos.TvSeriesData:
         return dtos.TvSeriesData(
             provider=FanartProvider,
             raw={"api": json_data},
@@ -90,8 +110,6 @@ class FanartProvider(interfaces.BaseProvider):
             titles={enums.Language.ENGLISH: json_data["name"]},
         )
 
-    # ------------------------------------------------------------------------------------------------------------------
-
     def _get_best_image(self, data: List[ImageData]) -> Union[str, None]:
         lang_points = {lang: weight for weight, lang in enumerate(self.preferred_lang)}
 
@@ -1,6 +1,11 @@
+import asyncio
 import collections
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
 import json
-from typing import Dict, List, Optional, Sequence, Set, Union, cast
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar, Union, cast
 
 import babelfish
 from furl import furl
@@ -8,7 +13,8 @@ from lxml.html import HtmlElement
 from typing_extensions import OrderedDict
 
 from anime_metadata import dtos, enums, interfaces, utils
-from anime_metadata.exceptions import CacheDataNotFound, ProviderResultFound
+from anime_metadata.exceptions import ProviderResultFound
+from anime_metadata.ratelimit import RateLimit
 from anime_metadata.typeshed import (
     AnimeId,
     AnimeTitle,
@@ -18,9 +24,11 @@ from anime_metadata.typeshed import (
     EpisodeNumber,
     RawCharacter,
     RawEpisode,
+    RawHtml,
     StaffList,
 )
 
+from . import xpaths
 from .typeshed import MALApiResponse
 
 __all__ = [
@@ -30,6 +38,14 @@ __all__ = [
 BASE_API_URL = "https://api.myanimelist.net"
 BASE_WEB_URL = "https://myanimelist.net"
 
+T = TypeVar("T")
+
+MAX_WORKERS = 8
+
+# Worker pools by `max_workers`, shared by all provider instances and kept for the lifetime of the process
+_executors: Dict[int, ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
+
 MAL_DATA = {
     "alternative_titles",
     "average_episode_duration",
@@ -71,19 +87,82 @@ class Cache(interfaces.BaseCache):
 
 
 class MALProvider(interfaces.BaseProvider):
+    rate_limit = RateLimit(requests_per_second=2, burst=4)
+    # Every show costs a characters page plus one page per character and per episode
+    expected_latency = 15.0
+    cache_class = Cache
+
+    def __init__(
+        self,
+        *args: Any,
+        max_workers: int = MAX_WORKERS,
+        episode_plots: bool = True,
+        episode_plots_budget: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        # Bounds concurrent per-character and per-episode page downloads, both for the worker pool and the async path;
+        # instances with the same `max_workers` share one worker pool
+        self.max_workers = max_workers
+        # With `episode_plots=False` episodes come without plots, use `get_episode_plot()` to load them on demand
+        self.episode_plots = episode_plots
+        # Seconds to wait for all episode plots of a show, episodes still downloading after that come without a plot
+        self.episode_plots_budget = episode_plots_budget
+        super().__init__(*args, **kwargs)
+
+    def _dto_cache_variant(self) -> Tuple[Any, ...]:
+        return (self.episode_plots,)
+
+    def _submit(self, func: Callable[..., T], *args: Any) -> "concurrent.futures.Future[T]":
+        # Workers run in the caller's context, e.g. stale page reads are reported to the running `get_series()`
+        return _get_executor(self.max_workers).submit(contextvars.copy_context().run, func, *args)
+
+    def get_episode_plot(self, anime_id: AnimeId, episode_no: EpisodeNumber) -> str:
+        return self._get_anime_episode_from_web(anime_id, episode_no)["synopsis"]
+
+    async def aget_episode_plot(self, anime_id: AnimeId, episode_no: EpisodeNumber) -> str:
+        return (await self._aget_anime_episode_from_web(anime_id, episode_no))["synopsis"]
+
     def _find_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
-        response = self.get_request(
-            furl(
-                BASE_WEB_URL,
-                path=["search", "prefix.json"],
-                args={"keyword": title, "type": "anime", "v": 1},
-            ),
-            headers={
-                "Referer": BASE_WEB_URL,
-                "X-Requested-With": "XMLHttpRequest",
-            },
+        return self.get_series(self._match_search_results(title, self.fetch(self._search_request(title))))
+
+    async def _afind_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
+        raw_stringified_json = await self.afetch(self._search_request(title))
+        return await self.aget_series(self._match_search_results(title, raw_stringified_json))
+
+    def _get_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        # Characters and staff are listed on the same page, download it once
+        characters_page = MALWeb(anime_characters_page=self.fetch(self._anime_characters_request(anime_id)))
+        characters = self._get_characters_from_web(characters_page.extract_anime_characters_from_html())
+
+        return _raw_data_to_dto(
+            episodes_list=self._get_anime_episodes_from_web(anime_id),
+            main_characters=characters[enums.CharacterType.MAIN],
+            mal_api_data=self._get_anime_from_api(anime_id),
+            staff_list=characters_page.extract_anime_staff_from_html(),
+            supporting_characters=characters[enums.CharacterType.SUPPORTING],
+        )
+
+    async def _aget_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        raw_characters_page, episodes_list, mal_api_data = await asyncio.gather(
+            self.afetch(self._anime_characters_request(anime_id)),
+            self._aget_anime_episodes_from_web(anime_id),
+            self._aget_anime_from_api(anime_id),
         )
-        json_data: ApiResponseDataDict = json.loads(response)
+        characters_page = MALWeb(anime_characters_page=raw_characters_page)
+        characters = await self._aget_characters_from_web(characters_page.extract_anime_characters_from_html())
+
+        return _raw_data_to_dto(
+            episodes_list=episodes_list,
+            main_characters=characters[enums.CharacterType.MAIN],
+            mal_api_data=mal_api_data,
+            staff_list=characters_page.extract_anime_staff_from_html(),
+            supporting_characters=characters[enums.CharacterType.SUPPORTING],
+        )
+
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _match_search_results(self, title: AnimeTitle, raw_stringified_json: bytes) -> AnimeId:
+        json_data: ApiResponseDataDict = json.loads(raw_stringified_json)
 
         try:
             utils.find_title_in_provider_results(
@@ -94,143 +173,240 @@ class MALProvider(interfaces.BaseProvider):
             )
         except ProviderResultFound as exc:
             data_item: ApiResponseDataDict = exc.data_item  # type:ignore
-            return self._get_series_by_id(data_item["id"])
+            return data_item["id"]
 
         raise NotImplementedError
 
-    def _get_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
-        characters_list = self._get_anime_characters_from_web(anime_id)
+    def _search_request(self, title: AnimeTitle) -> interfaces.ProviderRequest:
+        return interfaces.ProviderRequest(
+            cache=self._search_cache("search", title),
+            url=furl(
+                BASE_WEB_URL,
+                path=["search", "prefix.json"],
+                args={"keyword": title, "type": "anime", "v": 1},
+            ),
+            headers={
+                "Referer": BASE_WEB_URL,
+                "X-Requested-With": "XMLHttpRequest",
+            },
+        )
 
-        return _raw_data_to_dto(
-            episodes_list=self._get_anime_episodes_from_web(anime_id),
-            main_characters=collections.OrderedDict(
-                (character_name, self._get_character_from_web(character_id))
-                for character_name, character_id in characters_list[enums.CharacterType.MAIN].items()
+    def _anime_characters_request(self, anime_id: AnimeId) -> interfaces.ProviderRequest:
+        return interfaces.ProviderRequest(
+            cache=Cache("web,anime,characters", anime_id),
+            url=furl(
+                BASE_WEB_URL,
+                path=["anime", anime_id, "_", "characters"],
             ),
-            mal_api_data=self._get_anime_from_api(anime_id),
-            staff_list=self._get_anime_staff_from_web(anime_id),
-            supporting_characters=collections.OrderedDict(
-                (character_name, self._get_character_from_web(character_id))
-                for character_name, character_id in characters_list[enums.CharacterType.SUPPORTING].items()
+            headers={
+                "Referer": furl(BASE_WEB_URL, path=["anime", anime_id]).tostr(),
+            },
+        )
+
+    def _anime_episode_request(self, anime_id: AnimeId, episode_no: EpisodeNumber) -> interfaces.ProviderRequest:
+        return interfaces.ProviderRequest(
+            cache=Cache("web,anime,episode", episode_id(anime_id, episode_no)),
+            url=furl(
+                BASE_WEB_URL,
+                path=["anime", anime_id, "_", "episode", episode_no],
             ),
+            headers={
+                "Referer": furl(BASE_WEB_URL, path=["anime", anime_id, "episode"]).tostr(),
+            },
         )
 
-    # ------------------------------------------------------------------------------------------------------------------
+    def _anime_episodes_request(self, anime_id: AnimeId) -> interfaces.ProviderRequest:
+        return interfaces.ProviderRequest(
+            cache=Cache("web,anime,episodes", anime_id),
+            url=furl(
+                BASE_WEB_URL,
+                path=["anime", anime_id, "_", "episode"],
+            ),
+            headers={
+                "Referer": furl(BASE_WEB_URL, path=["anime", anime_id, "episode"]).tostr(),
+            },
+        )
 
-    def _get_anime_characters_from_web(self, anime_id: AnimeId) -> Dict[enums.CharacterType, CharacterList]:
-        with Cache("web,anime,characters", anime_id) as cache:
-            try:
-                raw_html_page = cache.get()
-            except CacheDataNotFound:
-                raw_html_page = self.get_request(
-                    furl(
-                        BASE_WEB_URL,
-                        path=["anime", anime_id, "_", "characters"],
-                    ),
-                    headers={
-                        "Referer": furl(BASE_WEB_URL, path=["anime", anime_id]).tostr(),
-                    },
-                )
-                cache.set(raw_html_page)
-
-        return MALWeb(anime_characters_page=raw_html_page).extract_anime_characters_from_html()
-
-    def _get_anime_episode_from_web(self, anime_id: AnimeId, episode_no: EpisodeNumber) -> ApiResponseDataDict:
-        with Cache("web,anime,episode", episode_id(anime_id, episode_no)) as cache:
-            try:
-                raw_html_page = cache.get()
-            except CacheDataNotFound:
-                raw_html_page = self.get_request(
-                    furl(
-                        BASE_WEB_URL,
-                        path=["anime", anime_id, "_", "episode", episode_no],
-                    ),
-                    headers={
-                        "Referer": furl(BASE_WEB_URL, path=["anime", anime_id, "episode"]).tostr(),
-                    },
-                )
-                cache.set(raw_html_page)
+    def _anime_from_api_request(self, anime_id: AnimeId) -> interfaces.ProviderRequest:
+        # https://myanimelist.net/apiconfig/references/api/v2#operation/anime_anime_id_get
+        return interfaces.ProviderRequest(
+            cache=Cache("apiv2,anime", anime_id),
+            url=furl(
+                BASE_API_URL,
+                path=["v2", "anime", anime_id],
+                args={"fields": ",".join(MAL_DATA)},
+            ),
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+            },
+        )
+
+    def _character_request(self, character_id: Union[int, str]) -> interfaces.ProviderRequest:
+        return interfaces.ProviderRequest(
+            cache=Cache("web,character", character_id),
+            url=furl(
+                BASE_WEB_URL,
+                path=["character", character_id],
+            ),
+            headers={
+                "Referer": BASE_WEB_URL,
+            },
+        )
+
+    def _get_anime_episode_from_web(
+        self,
+        anime_id: AnimeId,
+        episode_no: EpisodeNumber,
+        raw_html_page: Optional[RawHtml] = None,
+    ) -> ApiResponseDataDict:
+        if raw_html_page is None:
+            raw_html_page = self.fetch(self._anime_episode_request(anime_id, episode_no))
+        return MALWeb(episode_page=raw_html_page).extract_episode_from_html()
 
+    async def _aget_anime_episode_from_web(
+        self,
+        anime_id: AnimeId,
+        episode_no: EpisodeNumber,
+        raw_html_page: Optional[RawHtml] = None,
+    ) -> ApiResponseDataDict:
+        if raw_html_page is None:
+            raw_html_page = await self.afetch(self._anime_episode_request(anime_id, episode_no))
         return MALWeb(episode_page=raw_html_page).extract_episode_from_html()
 
     def _get_anime_episodes_from_web(self, anime_id: AnimeId) -> Sequence[RawEpisode]:
-        with Cache("web,anime,episodes", anime_id) as cache:
-            try:
-                raw_html_page = cache.get()
-            except CacheDataNotFound:
-                raw_html_page = self.get_request(
-                    furl(
-                        BASE_WEB_URL,
-                        path=["anime", anime_id, "_", "episode"],
-                    ),
-                    headers={
-                        "Referer": furl(BASE_WEB_URL, path=["anime", anime_id, "episode"]).tostr(),
-                    },
-                )
-                cache.set(raw_html_page)
+        raw_html_page = self.fetch(self._anime_episodes_request(anime_id))
 
         episodes = MALWeb(anime_episodes_page=raw_html_page).extract_episodes_from_html()
-        for episode in episodes:
-            episode_details = self._get_anime_episode_from_web(anime_id, episode["no"])
-            episode["plot"] = episode_details["synopsis"]
+        if not (self.episode_plots and episodes):
+            return episodes
+
+        # Pages cached by earlier lookups are read in one round trip, only the rest is downloaded
+        cached_pages = self.get_cached_many(
+            [self._anime_episode_request(anime_id, episode["no"]) for episode in episodes]
+        )
+        futures = [
+            self._submit(self._get_anime_episode_from_web, anime_id, episode["no"], raw_html_page)
+            for episode, raw_html_page in zip(episodes, cached_pages)
+        ]
+        done, not_done = concurrent.futures.wait(futures, timeout=self.episode_plots_budget)
+        # Downloads already in progress are not interrupted, they still end up in the cache for the next lookup
+        for future in not_done:
+            future.cancel()
+        if not_done:
+            self._mark_partial()
+
+        for episode, future in zip(episodes, futures):
+            if future in done:
+                episode["plot"] = future.result()["synopsis"]
+        return episodes
+
+    async def _aget_anime_episodes_from_web(self, anime_id: AnimeId) -> Sequence[RawEpisode]:
+        raw_html_page = await self.afetch(self._anime_episodes_request(anime_id))
+
+        episodes = MALWeb(anime_episodes_page=raw_html_page).extract_episodes_from_html()
+        if not (self.episode_plots and episodes):
+            return episodes
+
+        cached_pages = await self.aget_cached_many(
+            [self._anime_episode_request(anime_id, episode["no"]) for episode in episodes]
+        )
+        episodes_details = await utils.wait_with_concurrency(
+            self.max_workers,
+            self.episode_plots_budget,
+            *(
+                self._aget_anime_episode_from_web(anime_id, episode["no"], raw_html_page)
+                for episode, raw_html_page in zip(episodes, cached_pages)
+            ),
+        )
+        for episode, episode_details in zip(episodes, episodes_details):
+            if episode_details is None:
+                self._mark_partial()
+            else:
+                episode["plot"] = episode_details["synopsis"]
         return episodes
 
     def _get_anime_from_api(self, anime_id: AnimeId) -> MALApiResponse:
-        with Cache("apiv2,anime", anime_id) as cache:
-            try:
-                raw_stringified_json = cache.get()
-            except CacheDataNotFound:
-                # https://myanimelist.net/apiconfig/references/api/v2#operation/anime_anime_id_get
-                raw_stringified_json = self.get_request(
-                    furl(
-                        BASE_API_URL,
-                        path=["v2", "anime", anime_id],
-                        args={"fields": ",".join(MAL_DATA)},
-                    ),
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                    },
-                )
-                cache.set(raw_stringified_json)
-
-        return json.loads(raw_stringified_json)
-
-    def _get_anime_staff_from_web(self, anime_id: AnimeId) -> StaffList:
-        with Cache("web,anime,characters", anime_id) as cache:
-            try:
-                raw_html_page = cache.get()
-            except CacheDataNotFound:
-                raw_html_page = self.get_request(
-                    furl(
-                        BASE_WEB_URL,
-                        path=["anime", anime_id, "_", "characters"],
-                    ),
-                    headers={
-                        "Referer": furl(BASE_WEB_URL, path=["anime", anime_id]).tostr(),
-                    },
-                )
-                cache.set(raw_html_page)
-
-        return MALWeb(anime_characters_page=raw_html_page).extract_anime_staff_from_html()
-
-    def _get_character_from_web(self, character_id: Union[int, str]) -> RawCharacter:
-        with Cache("web,character", character_id) as cache:
-            try:
-                raw_html_page = cache.get()
-            except CacheDataNotFound:
-                raw_html_page = self.get_request(
-                    furl(
-                        BASE_WEB_URL,
-                        path=["character", character_id],
-                    ),
-                    headers={
-                        "Referer": BASE_WEB_URL,
-                    },
-                )
-                cache.set(raw_html_page)
+        return json.loads(self.fetch(self._anime_from_api_request(anime_id)))
 
+    async def _aget_anime_from_api(self, anime_id: AnimeId) -> MALApiResponse:
+        return json.loads(await self.afetch(self._anime_from_api_request(anime_id)))
+
+    def _get_character_from_web(
+        self,
+        character_id: Union[int, str],
+        raw_html_page: Optional[RawHtml] = None,
+    ) -> RawCharacter:
+        if raw_html_page is None:
+            raw_html_page = self.fetch(self._character_request(character_id))
         return MALWeb(character_page=raw_html_page).extract_character_from_html()
 
+    async def _aget_character_from_web(
+        self,
+        character_id: Union[int, str],
+        raw_html_page: Optional[RawHtml] = None,
+    ) -> RawCharacter:
+        if raw_html_page is None:
+            raw_html_page = await self.afetch(self._character_request(character_id))
+        return MALWeb(character_page=raw_html_page).extract_character_from_html()
+
+    def _get_characters_from_web(
+        self, characters_list: Dict[enums.CharacterType, CharacterList]
+    ) -> Dict[enums.CharacterType, OrderedDict[CharacterName, RawCharacter]]:
+        characters = _flatten_characters_list(characters_list)
+        cached_pages = self.get_cached_many([self._character_request(character_id) for *_, character_id in characters])
+        futures = [
+            self._submit(self._get_character_from_web, character_id, raw_html_page)
+            for (_type, _name, character_id), raw_html_page in zip(characters, cached_pages)
+        ]
+        characters_data = [future.result() for future in futures]
+        return _group_characters(characters_list, characters, characters_data)
+
+    async def _aget_characters_from_web(
+        self, characters_list: Dict[enums.CharacterType, CharacterList]
+    ) -> Dict[enums.CharacterType, OrderedDict[CharacterName, RawCharacter]]:
+        characters = _flatten_characters_list(characters_list)
+        cached_pages = await self.aget_cached_many(
+            [self._character_request(character_id) for *_, character_id in characters]
+        )
+        characters_data = await utils.gather_with_concurrency(
+            self.max_workers,
+            *(
+                self._aget_character_from_web(character_id, raw_html_page)
+                for (_type, _name, character_id), raw_html_page in zip(characters, cached_pages)
+            ),
+        )
+        return _group_characters(characters_list, characters, characters_data)
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    with _executors_lock:
+        if max_workers not in _executors:
+            _executors[max_workers] = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=MALProvider.__name__)
+        return _executors[max_workers]
+
+
+def _flatten_characters_list(
+    characters_list: Dict[enums.CharacterType, CharacterList]
+) -> List[Tuple[enums.CharacterType, CharacterName, str]]:
+    return [
+        (character_type, character_name, character_id)
+        for character_type, characters in characters_list.items()
+        for character_name, character_id in characters.items()
+    ]
+
+
+def _group_characters(
+    characters_list: Dict[enums.CharacterType, CharacterList],
+    characters: List[Tuple[enums.CharacterType, CharacterName, str]],
+    characters_data: Iterable[RawCharacter],
+) -> Dict[enums.CharacterType, OrderedDict[CharacterName, RawCharacter]]:
+    result: Dict[enums.CharacterType, OrderedDict[CharacterName, RawCharacter]] = {
+        character_type: collections.OrderedDict() for character_type in characters_list
+    }
+    for (character_type, character_name, _id), character_data in zip(characters, characters_data):
+        result[character_type][character_name] = character_data
+    return result
+
 
 def _raw_data_to_dto(
     *,
@@ -354,7 +530,7 @@ class MALApi:
         return result
 
 
-class MALWeb:
+class MALWeb(interfaces.BaseScraper):
     def __init__(
         self,
         *,
@@ -370,19 +546,17 @@ class MALWeb:
         super().__init__()
 
     def extract_anime_characters_from_html(self) -> Dict[enums.CharacterType, CharacterList]:
-        if not self.anime_characters_page:
-            raise ValueError
-        the_page = utils.load_html(self.anime_characters_page)
+        the_page = self._load_page("anime_characters_page")
 
         main_characters = {}
         supporting_characters = {}
 
-        for _h3 in the_page.xpath("//*[contains(@class, 'h3_character_name')]"):  # type:HtmlElement
-            _td: HtmlElement = _h3.xpath("./ancestor::td[position()=1]")[0]
-            _href: HtmlElement = _h3.xpath("./ancestor::a[position()=1]")[0]
+        for _h3 in xpaths.CHARACTER_NAMES(the_page):  # type:HtmlElement
+            _td: HtmlElement = xpaths.CHARACTER_CELL(_h3)[0]
+            _href: HtmlElement = xpaths.CHARACTER_LINK(_h3)[0]
 
             _name: str = _h3.text.split("(")[0].strip()
-            _type: str = _td.xpath("./*[contains(@class, 'spaceit_pad')][position()=2]")[0].text.strip()
+            _type: str = xpaths.CHARACTER_TYPE(_td)[0].text.strip()
             _id: str = _href.attrib["href"].split("character/")[-1].split("/", 1)[0]
 
             if _type == "Main":
@@ -396,23 +570,19 @@ class MALWeb:
         }
 
     def extract_anime_staff_from_html(self) -> StaffList:
-        if not self.anime_characters_page:
-            raise ValueError
-        the_page = utils.load_html(self.anime_characters_page)
+        the_page = self._load_page("anime_characters_page")
 
-        _staff_h2: HtmlElement = the_page.xpath("//h2[contains(text(), 'Staff')][contains(@class, 'h2_overwrite')]")[0]
-        _staff: List[HtmlElement] = _staff_h2.xpath("./ancestor::div[position()=1]")[0].xpath(
-            "./following-sibling::table"
-        )
+        _staff_h2: HtmlElement = xpaths.STAFF_HEADER(the_page)[0]
+        _staff: List[HtmlElement] = xpaths.STAFF_TABLES(xpaths.STAFF_HEADER_CONTAINER(_staff_h2)[0])
 
         result = collections.defaultdict(set)
 
         for item in _staff:
-            for link in item.xpath(".//a[contains(@href, 'myanimelist.net/people/')]"):  # type: HtmlElement
+            for link in xpaths.PEOPLE_LINKS(item):  # type: HtmlElement
                 if not link.text_content().strip():
                     continue
 
-                _position: str = link.xpath("./ancestor::td[position()=1]/div/small")[0].text.strip()
+                _position: str = xpaths.PERSON_ROLE(link)[0].text.strip()
                 positions: List[str] = list(map(str.strip, _position.split(",")))
 
                 for position_name in positions:
@@ -421,14 +591,12 @@ class MALWeb:
         return result
 
     def extract_character_from_html(self) -> RawCharacter:
-        if not self.character_page:
-            raise ValueError
-        the_page = utils.load_html(self.character_page)
+        the_page = self._load_page("character_page")
 
-        _content: HtmlElement = the_page.xpath("//*[@id='content']")[0]
-        _name_en: HtmlElement = _content.xpath("//h2[contains(@class, 'normal_header')]")[0]
+        _content: HtmlElement = xpaths.CONTENT(the_page)[0]
+        _name_en: HtmlElement = xpaths.CHARACTER_HEADER(_content)[0]
         _name_jp_jp: HtmlElement = _name_en.find("./span/small")
-        _seiyuus: List[HtmlElement] = _content.xpath("//table//a[contains(@href, 'myanimelist.net/people/')]")
+        _seiyuus: List[HtmlElement] = xpaths.SEIYUU_LINKS(_content)
 
         result: RawCharacter = {
             "name": {
@@ -445,41 +613,37 @@ class MALWeb:
                 continue
             seiyuu_name: str = seiyuu.text.strip()
             seiyuu_lang = babelfish.Language.fromname(
-                seiyuu.xpath("./ancestor::td[position()=1]/div/small")[0].text.strip()
+                xpaths.PERSON_ROLE(seiyuu)[0].text.strip()
             )
             result["seiyuu"][seiyuu_lang].add(utils.reverse_name_order(seiyuu_name))
 
         return result
 
     def extract_episode_from_html(self) -> Dict[str, str]:
-        if not self.episode_page:
-            raise ValueError
-        the_page = utils.load_html(self.episode_page)
+        the_page = self._load_page("episode_page")
 
         return {
             "synopsis": utils.normalize_string(
-                the_page.xpath("//h2[contains(text(), 'Synopsis')]/ancestor::*[position()=1]")[0].text_content()[8:]
+                xpaths.EPISODE_SYNOPSIS(the_page)[0].text_content()[8:]
             )
         }
 
     def extract_episodes_from_html(self) -> Sequence[RawEpisode]:  # noqa: C901
-        if not self.anime_episodes_page:
-            raise ValueError
-        the_page = utils.load_html(self.anime_episodes_page)
+        the_page = self._load_page("anime_episodes_page")
 
         result = []
 
-        _table: HtmlElement = the_page.xpath("//table[contains(@class, 'episode_list')][contains(@class, 'ascend')]")[0]
-        for episode in _table.xpath("./tr[contains(@class, 'episode-list-data')]"):  # type: HtmlElement
+        _table: HtmlElement = xpaths.EPISODES_TABLE(the_page)[0]
+        for episode in xpaths.EPISODE_ROWS(_table):  # type: HtmlElement
             ep: RawEpisode = {
-                "no": int(episode.xpath("./td[contains(@class, 'episode-number')]")[0].text.strip()),
+                "no": int(xpaths.EPISODE_NUMBER(episode)[0].text.strip()),
                 "titles": {
-                    enums.Language.ENGLISH: episode.xpath("./td[contains(@class, 'episode-title')]/a")[0].text.strip(),
+                    enums.Language.ENGLISH: xpaths.EPISODE_TITLE(episode)[0].text.strip(),
                 },
-                "premiered": episode.xpath("./td[contains(@class, 'episode-aired')]")[0].text.strip(),
+                "premiered": xpaths.EPISODE_AIRED(episode)[0].text.strip(),
             }
             try:
-                jp_titles = episode.xpath("./td[contains(@class, 'episode-title')]/span")[0].text.strip().split("(")
+                jp_titles = xpaths.EPISODE_TITLE_JAPANESE(episode)[0].text.strip().split("(")
                 if jp_titles:
                     ep["titles"][enums.Language.ROMAJI] = jp_titles[0].replace("\xa0", "").strip(" ()")
                 if len(jp_titles) == 2:
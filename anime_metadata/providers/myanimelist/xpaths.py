@@ -0,0 +1,52 @@
+from lxml.etree import XPath
+
+__all__ = [
+    "CHARACTER_CELL",
+    "CHARACTER_HEADER",
+    "CHARACTER_LINK",
+    "CHARACTER_NAMES",
+    "CHARACTER_TYPE",
+    "CONTENT",
+    "EPISODES_TABLE",
+    "EPISODE_AIRED",
+    "EPISODE_NUMBER",
+    "EPISODE_ROWS",
+    "EPISODE_SYNOPSIS",
+    "EPISODE_TITLE",
+    "EPISODE_TITLE_JAPANESE",
+    "PEOPLE_LINKS",
+    "PERSON_ROLE",
+    "SEIYUU_LINKS",
+    "STAFF_HEADER",
+    "STAFF_HEADER_CONTAINER",
+    "STAFF_TABLES",
+]
+
+# Anime characters page
+CHARACTER_NAMES = XPath("//*[contains(@class, 'h3_character_name')]")
+CHARACTER_CELL = XPath("./ancestor::td[position()=1]")
+CHARACTER_LINK = XPath("./ancestor::a[position()=1]")
+CHARACTER_TYPE = XPath("./*[contains(@class, 'spaceit_pad')][position()=2]")
+STAFF_HEADER = XPath("//h2[contains(text(), 'Staff')][contains(@class, 'h2_overwrite')]")
+STAFF_HEADER_CONTAINER = XPath("./ancestor::div[position()=1]")
+STAFF_TABLES = XPath("./following-sibling::table")
+PEOPLE_LINKS = XPath(".//a[contains(@href, 'myanimelist.net/people/')]")
+
+# Staff position or seiyuu language next to a person link
+PERSON_ROLE = XPath("./ancestor::td[position()=1]/div/small")
+
+# Character page
+CONTENT = XPath("//*[@id='content']")
+CHARACTER_HEADER = XPath("//h2[contains(@class, 'normal_header')]")
+SEIYUU_LINKS = XPath("//table//a[contains(@href, 'myanimelist.net/people/')]")
+
+# Episode page
+EPISODE_SYNOPSIS = XPath("//h2[contains(text(), 'Synopsis')]/ancestor::*[position()=1]")
+
+# Anime episodes page
+EPISODES_TABLE = XPath("//table[contains(@class, 'episode_list')][contains(@class, 'ascend')]")
+EPISODE_ROWS = XPath("./tr[contains(@class, 'episode-list-data')]")
+EPISODE_NUMBER = XPath("./td[contains(@class, 'episode-number')]")
+EPISODE_TITLE = XPath("./td[contains(@class, 'episode-title')]/a")
+EPISODE_TITLE_JAPANESE = XPath("./td[contains(@class, 'episode-title')]/span")
+EPISODE_AIRED = XPath("./td[contains(@class, 'episode-aired')]")
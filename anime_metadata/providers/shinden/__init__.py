@@ -1,15 +1,18 @@
 import datetime
-from typing import Any, Dict, Iterator, List, Optional, Union, cast
+from typing import Any, AsyncGenerator, Dict, Iterator, List, Optional, Union, cast
 
+import attr
 from bs4 import BeautifulSoup
 from furl import furl
 from lxml import html
 from lxml.html import HtmlElement
 
 from anime_metadata import constants, dtos, enums, interfaces, utils
-from anime_metadata.exceptions import CacheDataNotFound, ProviderResultFound
+from anime_metadata.exceptions import ProviderResultFound
+from anime_metadata.ratelimit import RateLimit
 from anime_metadata.typeshed import AnimeId, AnimeTitle
 
+from . import xpaths
 from .typeshed import SearchResult
 
 __all__ = [
@@ -25,39 +28,67 @@ class Cache(interfaces.BaseCache):
 
 
 class ShindenProvider(interfaces.BaseProvider):
+    rate_limit = RateLimit(requests_per_second=1, burst=2)
+    provides = frozenset(
+        {"dates", "genres", "images", "mpaa", "plot", "rating", "source_material", "studios", "titles"}
+    )
+    expected_latency = 2.0
+    cache_class = Cache
+
     def _find_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
+        return self.get_series(
+            self._match_search_results(title, self._search_shinden_with_pagination(title, year)),
+        )
+
+    async def _afind_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
+        search_results: List[SearchResult] = []
+        pages = self._asearch_shinden_with_pagination(title, year)
+        try:
+            # Like the lazily consumed pages of the sync search, an exact match stops fetching further pages
+            async for item in pages:
+                if utils.title_similarity(item["title"], title) == 1.0:
+                    return await self.aget_series(item["id"])
+                search_results.append(item)
+        finally:
+            await pages.aclose()
+
+        return await self.aget_series(self._match_search_results(title, iter(search_results)))
+
+    def _get_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        raw_html_page = self.fetch(self._series_request(anime_id))
+        return ShindenWeb(anime_id, series_page=raw_html_page).extract_series_data()
+
+    async def _aget_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        raw_html_page = await self.afetch(self._series_request(anime_id))
+        return ShindenWeb(anime_id, series_page=raw_html_page).extract_series_data()
+
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _match_search_results(self, title: AnimeTitle, search_results: Iterator[SearchResult]) -> AnimeId:
         try:
             utils.find_title_in_provider_results(
                 title=title,
-                data=self._search_shinden_with_pagination(title, year),  # type:ignore
+                data=search_results,  # type:ignore
                 data_item_title_getter=lambda item: cast(SearchResult, item)["title"],
                 title_similarity_factor=self.title_similarity_factor,
             )
         except ProviderResultFound as exc:
             data_item: SearchResult = exc.data_item  # type:ignore
-            return self._get_series_by_id(data_item["id"])
+            return data_item["id"]
 
         raise NotImplementedError
 
-    def _get_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
-        with Cache("web,series", anime_id) as cache:
-            try:
-                raw_html_page = cache.get()
-            except CacheDataNotFound:
-                raw_html_page = self.get_request(
-                    furl(BASE_WEB_URL).add(path=["series", anime_id]),
-                    headers={
-                        "User-Agent": constants.USER_AGENT,
-                        "Referer": BASE_WEB_URL,
-                    },
-                )
-                cache.set(raw_html_page)
-
-        return ShindenWeb(anime_id, series_page=raw_html_page).extract_series_data()
-
-    # ------------------------------------------------------------------------------------------------------------------
+    def _series_request(self, anime_id: AnimeId) -> interfaces.ProviderRequest:
+        return interfaces.ProviderRequest(
+            cache=Cache("web,series", anime_id),
+            url=furl(BASE_WEB_URL).add(path=["series", anime_id]),
+            headers={
+                "User-Agent": constants.USER_AGENT,
+                "Referer": BASE_WEB_URL,
+            },
+        )
 
-    def _search_shinden_with_pagination(self, title: AnimeTitle, year: int = None) -> Iterator[SearchResult]:
+    def _search_request(self, title: AnimeTitle, year: Optional[int]) -> interfaces.ProviderRequest:
         url = furl(
             BASE_WEB_URL,
             args={
@@ -73,13 +104,16 @@ class ShindenProvider(interfaces.BaseProvider):
         if year:
             url.add({"start_date_precision": 1, "year_from": year})
 
-        referer = BASE_WEB_URL
-        for _unused in range(MAX_SEARCH_PAGES):
-            response = self.get_request(
-                url,
-                headers={"User-Agent": constants.USER_AGENT, "Referer": referer},
-            )
-            data = ShindenWeb(search_result_page=response).extract_search_results()
+        return interfaces.ProviderRequest(
+            cache=self._search_cache("search", title, year, 1),
+            url=url,
+            headers={"User-Agent": constants.USER_AGENT, "Referer": BASE_WEB_URL},
+        )
+
+    def _search_shinden_with_pagination(self, title: AnimeTitle, year: Optional[int]) -> Iterator[SearchResult]:
+        request = self._search_request(title, year)
+        for page_no in range(1, MAX_SEARCH_PAGES + 1):
+            data = ShindenWeb(search_result_page=self.fetch(request)).extract_search_results()
 
             if not data["items"]:
                 break
@@ -90,11 +124,45 @@ class ShindenProvider(interfaces.BaseProvider):
             if data["_next_page"] is None:
                 break
             else:
-                referer = url.tostr()
-                url = data["_next_page"]
+                request = _next_page_request(
+                    request, data["_next_page"], self._search_cache("search", title, year, page_no + 1)
+                )
+
+    async def _asearch_shinden_with_pagination(
+        self, title: AnimeTitle, year: Optional[int]
+    ) -> AsyncGenerator[SearchResult, None]:
+        request = self._search_request(title, year)
+        for page_no in range(1, MAX_SEARCH_PAGES + 1):
+            data = ShindenWeb(search_result_page=await self.afetch(request)).extract_search_results()
 
+            if not data["items"]:
+                break
+
+            for item in data["items"]:
+                yield cast(SearchResult, item)
 
-class ShindenWeb:
+            if data["_next_page"] is None:
+                break
+            else:
+                request = _next_page_request(
+                    request, data["_next_page"], self._search_cache("search", title, year, page_no + 1)
+                )
+
+
+def _next_page_request(
+    request: interfaces.ProviderRequest,
+    next_page: furl,
+    cache: Optional[interfaces.BaseCache],
+) -> interfaces.ProviderRequest:
+    return attr.evolve(
+        request,
+        cache=cache,
+        url=next_page,
+        headers={**request.headers, "Referer": request.url.tostr()},
+    )
+
+
+class ShindenWeb(interfaces.BaseScraper):
     def __init__(
         self, anime_id: AnimeId = None, *, series_page: bytes = None, search_result_page: bytes = None
     ) -> None:
@@ -104,9 +172,7 @@ class ShindenWeb:
         super().__init__()
 
     def extract_series_data(self) -> dtos.TvSeriesData:
-        if not self.series_page:
-            raise ValueError
-        the_page = utils.load_html(self.series_page)
+        the_page = self._load_page("series_page")
 
         basic_information = self._extract_show_basic_information(the_page)
         tags = self._extract_show_tags(the_page)
@@ -125,9 +191,7 @@ class ShindenWeb:
             # IMAGES
             images=dtos.ShowImage(
                 base_url=BASE_WEB_URL,
-                folder=the_page.xpath("//*[normalize-space(@class)='title-cover']/a[contains(@href, '/images/')]")[
-                    0
-                ].attrib["href"],
+                folder=xpaths.COVER_LINK(the_page)[0].attrib["href"],
             ),
             # MPAA
             mpaa=basic_information["mpaa"],
@@ -146,25 +210,21 @@ class ShindenWeb:
         )
 
     def _extract_show_title(self, the_page: HtmlElement) -> AnimeTitle:
-        return the_page.xpath("//h1[contains(@class, 'page-title')]//*[normalize-space(@class)='title']")[
-            0
-        ].text.strip()
+        return xpaths.TITLE(the_page)[0].text.strip()
 
     def _extract_show_plot(self, the_page: HtmlElement) -> str:
-        raw_description: HtmlElement = the_page.xpath("//*[normalize-space(@id)='description']")[0]
+        raw_description: HtmlElement = xpaths.DESCRIPTION(the_page)[0]
         return html.tostring(raw_description, encoding="utf-8").decode()
 
     def _extract_show_rating(self, the_page: HtmlElement) -> Optional[str]:
-        data: List[HtmlElement] = the_page.xpath("//*[normalize-space(@class)='info-aside-rating-user']")
+        data: List[HtmlElement] = xpaths.RATING(the_page)
         if not data:
             return None
 
         return data[0].text.strip().replace(",", ".")
 
     def _extract_show_tags(self, the_page: HtmlElement) -> Dict[str, Any]:  # noqa: C901
-        tags_etc: List[HtmlElement] = the_page.xpath(
-            "//*[normalize-space(@class)='info-top-table-highlight']//ul[normalize-space(@class)='tags']//a"
-        )
+        tags_etc: List[HtmlElement] = xpaths.TAG_LINKS(the_page)
 
         genres = set()
         source_material = None
@@ -196,16 +256,14 @@ class ShindenWeb:
         }
 
     def _extract_show_basic_information(self, the_page: HtmlElement) -> Dict[str, Any]:
-        basic_information: List[HtmlElement] = the_page.xpath(
-            "//*[normalize-space(@class)='title-small-info']//dl[normalize-space(@class)='info-aside-list']/dt"
-        )
+        basic_information: List[HtmlElement] = xpaths.INFO_TERMS(the_page)
         date_premiered = None
         date_ended = None
         mpaa = None
         studios = None
 
         for dt in basic_information:
-            dd: HtmlElement = dt.xpath("./following-sibling::dd[1]")[0]
+            dd: HtmlElement = xpaths.INFO_DEFINITION(dt)[0]
             title = dt.text
             descr = dd.text.strip() if dd.text else None
 
@@ -227,33 +285,25 @@ class ShindenWeb:
         }
 
     def extract_search_results(self) -> Dict[str, Union[None, str, List[SearchResult]]]:  # noqa: C901
-        if not self.search_result_page:
-            raise ValueError
-        the_page = utils.load_html(self.search_result_page)
+        the_page = self._load_page("search_result_page")
 
         result = []
-        for item in the_page.xpath("//*[normalize-space(@class)='title-table']//ul[normalize-space(@class)='div-row']"):
+        for item in xpaths.SEARCH_ROWS(the_page):
             try:
-                image: str = item.xpath(".//li[normalize-space(@class)='cover-col']/a")[0].attrib["href"]
+                image: str = xpaths.SEARCH_ROW_COVER_LINK(item)[0].attrib["href"]
             except IndexError:
                 continue
+            title_link: HtmlElement = xpaths.SEARCH_ROW_TITLE_LINK(item)[0]
 
             result.append(
                 {
                     "image": image,
-                    "title": BeautifulSoup(
-                        html.tostring(item.xpath(".//li[normalize-space(@class)='desc-col']//a")[0]), features="lxml"
-                    ).get_text(" "),
-                    "id": (
-                        item.xpath(".//li[normalize-space(@class)='desc-col']//a")[0]
-                        .attrib["href"]
-                        .rsplit("/", 1)[-1]
-                        .split("-", 1)[0]
-                    ),
-                    "type": item.xpath(".//li[normalize-space(@class)='title-kind-col']")[0].text.strip(),
-                    "total_episodes": int(item.xpath(".//li[normalize-space(@class)='episodes-col']")[0].text.strip()),
-                    "status": item.xpath(".//li[normalize-space(@class)='title-status-col']")[0].text.strip(),
-                    "rating": item.xpath(".//li[normalize-space(@class)='rate-top']")[0].text.strip().replace(",", "."),
+                    "title": BeautifulSoup(html.tostring(title_link), features="lxml").get_text(" "),
+                    "id": title_link.attrib["href"].rsplit("/", 1)[-1].split("-", 1)[0],
+                    "type": xpaths.SEARCH_ROW_TYPE(item)[0].text.strip(),
+                    "total_episodes": int(xpaths.SEARCH_ROW_EPISODES(item)[0].text.strip()),
+                    "status": xpaths.SEARCH_ROW_STATUS(item)[0].text.strip(),
+                    "rating": xpaths.SEARCH_ROW_RATING(item)[0].text.strip().replace(",", "."),
                 }
             )
 
@@ -261,13 +311,13 @@ class ShindenWeb:
         _next_page = None
         try:
             _prev_page = furl(
-                BASE_WEB_URL + the_page.xpath("//*[normalize-space(@class)='pagination-prev']//a")[0].attrib["href"]
+                BASE_WEB_URL + xpaths.PREV_PAGE_LINK(the_page)[0].attrib["href"]
             ).remove(args=["r307"])
         except IndexError:
             pass
         try:
             _next_page = furl(
-                BASE_WEB_URL + the_page.xpath("//*[normalize-space(@class)='pagination-next']//a")[0].attrib["href"]
+                BASE_WEB_URL + xpaths.NEXT_PAGE_LINK(the_page)[0].attrib["href"]
             ).remove(args=["r307"])
         except IndexError:
             pass
@@ -0,0 +1,40 @@
+from lxml.etree import XPath
+
+__all__ = [
+    "COVER_LINK",
+    "DESCRIPTION",
+    "INFO_DEFINITION",
+    "INFO_TERMS",
+    "NEXT_PAGE_LINK",
+    "PREV_PAGE_LINK",
+    "RATING",
+    "SEARCH_ROWS",
+    "SEARCH_ROW_COVER_LINK",
+    "SEARCH_ROW_EPISODES",
+    "SEARCH_ROW_RATING",
+    "SEARCH_ROW_STATUS",
+    "SEARCH_ROW_TITLE_LINK",
+    "SEARCH_ROW_TYPE",
+    "TAG_LINKS",
+    "TITLE",
+]
+
+# Series page
+COVER_LINK = XPath("//*[normalize-space(@class)='title-cover']/a[contains(@href, '/images/')]")
+TITLE = XPath("//h1[contains(@class, 'page-title')]//*[normalize-space(@class)='title']")
+DESCRIPTION = XPath("//*[normalize-space(@id)='description']")
+RATING = XPath("//*[normalize-space(@class)='info-aside-rating-user']")
+TAG_LINKS = XPath("//*[normalize-space(@class)='info-top-table-highlight']//ul[normalize-space(@class)='tags']//a")
+INFO_TERMS = XPath("//*[normalize-space(@class)='title-small-info']//dl[normalize-space(@class)='info-aside-list']/dt")
+INFO_DEFINITION = XPath("./following-sibling::dd[1]")
+
+# Search results page, row selectors apply to `SEARCH_ROWS` items
+SEARCH_ROWS = XPath("//*[normalize-space(@class)='title-table']//ul[normalize-space(@class)='div-row']")
+SEARCH_ROW_COVER_LINK = XPath(".//li[normalize-space(@class)='cover-col']/a")
+SEARCH_ROW_TITLE_LINK = XPath(".//li[normalize-space(@class)='desc-col']//a")
+SEARCH_ROW_TYPE = XPath(".//li[normalize-space(@class)='title-kind-col']")
+SEARCH_ROW_EPISODES = XPath(".//li[normalize-space(@class)='episodes-col']")
+SEARCH_ROW_STATUS = XPath(".//li[normalize-space(@class)='title-status-col']")
+SEARCH_ROW_RATING = XPath(".//li[normalize-space(@class)='rate-top']")
+PREV_PAGE_LINK = XPath("//*[normalize-space(@class)='pagination-prev']//a")
+NEXT_PAGE_LINK = XPath("//*[normalize-space(@class)='pagination-next']//a")
@@ -1,10 +1,10 @@
 import json
-from typing import Any, Optional, cast
+from typing import Any, Optional, Tuple, cast
 
 from furl import furl
 
 from anime_metadata import dtos, enums, interfaces, utils
-from anime_metadata.exceptions import CacheDataNotFound, ProviderResultFound
+from anime_metadata.exceptions import ProviderResultFound
 from anime_metadata.typeshed import AnimeTitle, ApiResponseDataDict, TvShowId
 
 __all__ = [
@@ -17,11 +17,49 @@ class Cache(interfaces.BaseCache):
 
 
 class TMDBProvider(interfaces.BaseProvider):
+    provides = frozenset({"dates", "genres", "images", "plot", "rating", "studios", "titles"})
+    expected_latency = 1.0
+    cache_class = Cache
+
     def __init__(self, *args: Any, lang: str = "en-US", **kwargs: Any) -> None:
         self.lang = lang
         super().__init__(*args, **kwargs)
 
+    def _dto_cache_variant(self) -> Tuple[Any, ...]:
+        return (self.lang,)
+
     def _find_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
+        return self.get_series(self._match_search_results(title, self.fetch(self._search_request(title, year))))
+
+    async def _afind_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
+        raw_stringified_json = await self.afetch(self._search_request(title, year))
+        return await self.aget_series(self._match_search_results(title, raw_stringified_json))
+
+    def _get_series_by_id(self, show_id: TvShowId) -> dtos.TvSeriesData:
+        return _json_data_to_dto(json.loads(self.fetch(self._tv_request(show_id))))
+
+    async def _aget_series_by_id(self, show_id: TvShowId) -> dtos.TvSeriesData:
+        return _json_data_to_dto(json.loads(await self.afetch(self._tv_request(show_id))))
+
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _match_search_results(self, title: AnimeTitle, raw_stringified_json: bytes) -> TvShowId:
+        json_data: ApiResponseDataDict = json.loads(raw_stringified_json)
+
+        try:
+            utils.find_title_in_provider_results(
+                title=title,
+                data=json_data.get("results", []),
+                data_item_title_getter=lambda item: cast(ApiResponseDataDict, item)["name"],
+                title_similarity_factor=self.title_similarity_factor,
+            )
+        except ProviderResultFound as exc:
+            data_item: ApiResponseDataDict = exc.data_item  # type:ignore
+            return data_item["id"]
+
+        raise NotImplementedError
+
+    def _search_request(self, title: AnimeTitle, year: Optional[int]) -> interfaces.ProviderRequest:
         # https://developers.themoviedb.org/3/search/search-tv-shows
         url = furl("https://api.themoviedb.org/3/search/tv")
         url.set(
@@ -37,40 +75,19 @@ class TMDBProvider(interfaces.BaseProvider):
         if year:
             url.args["first_air_date_year"] = year
 
-        response = self.get_request(url)
-        json_data: ApiResponseDataDict = json.loads(response)
-
-        try:
-            utils.find_title_in_provider_results(
-                title=title,
-                data=json_data.get("results", []),
-                data_item_title_getter=lambda item: cast(ApiResponseDataDict, item)["name"],
-                title_similarity_factor=self.title_similarity_factor,
-            )
-        except ProviderResultFound as exc:
-            data_item: ApiResponseDataDict = exc.data_item  # type:ignore
-            return self._get_series_by_id(data_item["id"])
-
-        raise NotImplementedError
+        return interfaces.ProviderRequest(cache=self._search_cache("search", title, year, self.lang), url=url)
 
-    def _get_series_by_id(self, show_id: TvShowId) -> dtos.TvSeriesData:
-        with Cache("apiv3,tv", show_id) as cache:
-            try:
-                raw_stringified_json = cache.get()
-            except CacheDataNotFound:
-                # https://developers.themoviedb.org/3/tv/get-tv-details
-                url = furl("https://api.themoviedb.org/3/tv")
-                url.path.add(show_id)
-                url.set(
-                    {
-                        "api_key": self.api_key,
-                        "language": self.lang,
-                    }
-                )
-                raw_stringified_json = self.get_request(url)
-                cache.set(raw_stringified_json)
-
-        return _json_data_to_dto(json.loads(raw_stringified_json))
+    def _tv_request(self, show_id: TvShowId) -> interfaces.ProviderRequest:
+        # https://developers.themoviedb.org/3/tv/get-tv-details
+        url = furl("https://api.themoviedb.org/3/tv")
+        url.path.add(show_id)
+        url.set(
+            {
+                "api_key": self.api_key,
+                "language": self.lang,
+            }
+        )
+        return interfaces.ProviderRequest(cache=Cache("apiv3,tv", show_id), url=url)
 
 
 def _json_data_to_dto(json_data: ApiResponseDataDict) -> dtos.TvSeriesData:
@@ -0,0 +1,193 @@
+import asyncio
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import attr
+
+from anime_metadata import constants
+
+__all__ = [
+    "HostMetrics",
+    "RateLimit",
+    "RequestScheduler",
+    "TokenBucket",
+    "get_default_scheduler",
+]
+
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+_default_scheduler: Optional["RequestScheduler"] = None
+_default_scheduler_lock = threading.Lock()
+
+
+@attr.s(auto_attribs=True, kw_only=True, frozen=True)
+class RateLimit:
+    requests_per_second: Optional[float] = None  # None = no fixed limit, only honor server throttling
+    burst: int = 1
+
+
+@attr.s(auto_attribs=True, kw_only=True, frozen=True)
+class HostMetrics:
+    queue_depth: int
+    requests: int
+    requests_per_second: Optional[float]
+    throttled: int
+
+
+class TokenBucket:
+    """
+    Token bucket implemented as GCRA (virtual scheduling): every request reserves the next free slot
+    and is told how long to wait for it. The rate halves on throttling and recovers on success.
+    """
+
+    def __init__(self, rate_limit: RateLimit) -> None:
+        self.rate_limit = rate_limit
+        self.requests_per_second = rate_limit.requests_per_second
+        self.queue_depth = 0
+        self.requests = 0
+        self.throttled = 0
+        self._consecutive_throttles = 0
+        self._theoretical_arrival = time.monotonic()
+        self._lock = threading.Lock()
+        super().__init__()
+
+    @property
+    def _interval(self) -> float:
+        return 1 / self.requests_per_second if self.requests_per_second else 0.0
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            arrival = max(self._theoretical_arrival, now)
+            delay = max(0.0, arrival - (self.rate_limit.burst - 1) * self._interval - now)
+            self._theoretical_arrival = arrival + self._interval
+            self.requests += 1
+            return delay
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            self._update_queue_depth(1)
+            try:
+                time.sleep(delay)
+            finally:
+                self._update_queue_depth(-1)
+
+    async def aacquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            self._update_queue_depth(1)
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._update_queue_depth(-1)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._consecutive_throttles = 0
+            if self.rate_limit.requests_per_second and self.requests_per_second:
+                self.requests_per_second = min(
+                    self.rate_limit.requests_per_second,
+                    self.requests_per_second + self.rate_limit.requests_per_second * 0.1,
+                )
+
+    def on_throttle(self, retry_after: Optional[float]) -> None:
+        with self._lock:
+            self.throttled += 1
+            self._consecutive_throttles += 1
+            if retry_after is None:
+                retry_after = min(
+                    constants.HTTP_THROTTLE_MAX_BACKOFF,
+                    constants.HTTP_THROTTLE_BACKOFF * 2 ** (self._consecutive_throttles - 1),
+                )
+            if self.requests_per_second:
+                self.requests_per_second = max(
+                    self.rate_limit.requests_per_second * 0.1,  # type:ignore
+                    self.requests_per_second / 2,
+                )
+            # Nobody is let through before `retry_after`, then requests are spaced again by the (reduced) rate
+            resume_at = time.monotonic() + retry_after + (self.rate_limit.burst - 1) * self._interval
+            self._theoretical_arrival = max(self._theoretical_arrival, resume_at)
+
+    def _update_queue_depth(self, delta: int) -> None:
+        with self._lock:
+            self.queue_depth += delta
+
+
+class RequestScheduler:
+    """
+    Per-host pacing of outgoing requests, shared by threads and event loops.
+
+    Buckets are keyed on the host and the rate limit, requests to the same host with different limits are paced
+    independently and each at its own rate.
+    """
+
+    def __init__(self) -> None:
+        self._buckets: Dict[Tuple[str, RateLimit], TokenBucket] = {}
+        self._lock = threading.Lock()
+        super().__init__()
+
+    def bucket(self, host: str, rate_limit: Optional[RateLimit]) -> TokenBucket:
+        key = (host, rate_limit or RateLimit())
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = TokenBucket(key[1])
+            return self._buckets[key]
+
+    def acquire(self, host: str, rate_limit: Optional[RateLimit]) -> None:
+        self.bucket(host, rate_limit).acquire()
+
+    async def aacquire(self, host: str, rate_limit: Optional[RateLimit]) -> None:
+        await self.bucket(host, rate_limit).aacquire()
+
+    def feedback(self, host: str, rate_limit: Optional[RateLimit], status_code: int, retry_after: Optional[str]) -> bool:
+        """
+        Report a response, returns True when the host throttled the request and it should be retried
+        """
+        bucket = self.bucket(host, rate_limit)
+        if status_code in THROTTLE_STATUS_CODES:
+            bucket.on_throttle(_parse_retry_after(retry_after))
+            return True
+        bucket.on_success()
+        return False
+
+    def metrics(self) -> Dict[Tuple[str, RateLimit], HostMetrics]:
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {
+            key: HostMetrics(
+                queue_depth=bucket.queue_depth,
+                requests=bucket.requests,
+                requests_per_second=bucket.requests_per_second,
+                throttled=bucket.throttled,
+            )
+            for key, bucket in buckets.items()
+        }
+
+
+def get_default_scheduler() -> RequestScheduler:
+    global _default_scheduler
+
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = RequestScheduler()
+    return _default_scheduler
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    # https://httpwg.org/specs/rfc9110.html#field.retry-after
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
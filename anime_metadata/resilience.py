@@ -0,0 +1,220 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import contextlib
+import enum
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, Set, TypeVar
+
+import attr
+import httpx
+import requests
+
+from anime_metadata import constants
+from anime_metadata.exceptions import ProviderUnavailableError
+from anime_metadata.ratelimit import THROTTLE_STATUS_CODES
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitState",
+    "RetryPolicy",
+    "acall_with_retries",
+    "call_with_retries",
+    "get_circuit_breaker",
+]
+
+T = TypeVar("T")
+
+_circuit_breakers: Dict[str, "CircuitBreaker"] = {}
+_circuit_breakers_lock = threading.Lock()
+_hedge_executor: Optional[ThreadPoolExecutor] = None
+
+
+class CircuitState(enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+@attr.s(auto_attribs=True, kw_only=True, frozen=True)
+class RetryPolicy:
+    retries: int = constants.HTTP_RETRIES
+    backoff: float = constants.HTTP_RETRY_BACKOFF
+    max_backoff: float = constants.HTTP_RETRY_MAX_BACKOFF
+    # Seconds to wait for a response before sending a duplicate request and using whichever answers first
+    hedge_after: Optional[float] = None
+
+    def delay(self, attempt: int) -> float:
+        # "Full jitter", spreads retries of concurrent callers over the whole backoff window
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+
+class CircuitBreaker:
+    """
+    Fails fast with `ProviderUnavailableError` after `failure_threshold` consecutive transient failures,
+    lets a single probe request through after `recovery_timeout` seconds and closes again when it succeeds.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = constants.CIRCUIT_BREAKER_FAILURES,
+        recovery_timeout: float = constants.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+        super().__init__()
+
+    @contextlib.contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Wraps a single request: transient errors count as failures, any other outcome closes the circuit
+        """
+        probe = self.before_call()
+        try:
+            yield
+        except BaseException as exc:
+            self._on_error(exc, probe)
+            raise
+        else:
+            self.on_success()
+
+    def before_call(self) -> bool:
+        """
+        Raises `ProviderUnavailableError` while the circuit is open, returns True for the probe of a half-open circuit
+        """
+        with self._lock:
+            if self.state is CircuitState.CLOSED:
+                return False
+            if self.state is CircuitState.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+                self.state = CircuitState.HALF_OPEN
+                return True
+            raise ProviderUnavailableError(f"{self.name} is unavailable, circuit breaker is {self.state.value}")
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.state = CircuitState.CLOSED
+            self.failures = 0
+
+    def on_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state is CircuitState.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        with self._lock:
+            if self.state is CircuitState.HALF_OPEN:
+                # Still past the recovery timeout, the next call becomes the probe
+                self.state = CircuitState.OPEN
+
+    def _on_error(self, exc: BaseException, probe: bool) -> None:
+        # `asyncio.CancelledError` is an `Exception` before Python 3.8
+        if not isinstance(exc, Exception) or isinstance(exc, asyncio.CancelledError):
+            # Cancelled or interrupted before any outcome, let the next call probe instead of staying half-open
+            if probe:
+                self.release_probe()
+        elif is_transient_error(exc):
+            self.on_failure()
+        else:
+            self.on_success()
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    with _circuit_breakers_lock:
+        if name not in _circuit_breakers:
+            _circuit_breakers[name] = CircuitBreaker(name)
+        return _circuit_breakers[name]
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    # 429/503 were already retried by `BaseProvider` with the Retry-After backoff of the request scheduler
+    if isinstance(exc, requests.HTTPError):
+        return (
+            exc.response is not None
+            and exc.response.status_code >= 500
+            and exc.response.status_code not in THROTTLE_STATUS_CODES
+        )
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500 and exc.response.status_code not in THROTTLE_STATUS_CODES
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout, httpx.TransportError))
+
+
+def call_with_retries(func: Callable[[], T], policy: RetryPolicy, circuit_breaker: CircuitBreaker) -> T:
+    for attempt in range(1 + policy.retries):
+        try:
+            with circuit_breaker.guard():
+                return func() if policy.hedge_after is None else _hedged_call(func, policy.hedge_after)
+        except Exception as exc:
+            if attempt == policy.retries or not is_transient_error(exc):
+                raise
+        time.sleep(policy.delay(attempt))
+
+    raise AssertionError("unreachable")
+
+
+async def acall_with_retries(
+    func: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    circuit_breaker: CircuitBreaker,
+) -> T:
+    for attempt in range(1 + policy.retries):
+        try:
+            with circuit_breaker.guard():
+                return await (func() if policy.hedge_after is None else _ahedged_call(func, policy.hedge_after))
+        except Exception as exc:
+            if attempt == policy.retries or not is_transient_error(exc):
+                raise
+        await asyncio.sleep(policy.delay(attempt))
+
+    raise AssertionError("unreachable")
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+
+    with _circuit_breakers_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(thread_name_prefix="hedge")
+    return _hedge_executor
+
+
+def _hedged_call(func: Callable[[], T], hedge_after: float) -> T:
+    executor = _get_hedge_executor()
+    futures: Set["Future[T]"] = {executor.submit(func)}
+    done, _pending = wait(futures, timeout=hedge_after)
+    if not done:
+        futures.add(executor.submit(func))
+
+    while True:
+        done, pending = wait(futures, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None or not pending:
+                return future.result()
+        futures = pending
+
+
+async def _ahedged_call(func: Callable[[], Awaitable[T]], hedge_after: float) -> T:
+    tasks: Set["asyncio.Future[Any]"] = {asyncio.ensure_future(func())}
+    done, _pending = await asyncio.wait(tasks, timeout=hedge_after)
+    if not done:
+        tasks.add(asyncio.ensure_future(func()))
+
+    try:
+        while True:
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None or not pending:
+                    return task.result()
+            tasks = pending
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,68 @@
+import asyncio
+from concurrent.futures import Future
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+import weakref
+
+__all__ = [
+    "AsyncSingleFlight",
+    "SingleFlight",
+]
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls sharing a key, across threads: one caller runs `func`, the others wait for its result
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "Future[Any]"] = {}
+        super().__init__()
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        with self._lock:
+            in_flight = self._calls.get(key)
+            if in_flight is None:
+                future: "Future[Any]" = Future()
+                self._calls[key] = future
+
+        if in_flight is not None:
+            return in_flight.result()
+
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Coalesce concurrent calls sharing a key, across asyncio tasks of the same event loop
+    """
+
+    def __init__(self) -> None:
+        self._calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Future[Any]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        super().__init__()
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        calls = self._calls.setdefault(asyncio.get_running_loop(), {})
+
+        task = calls.get(key)
+        if task is None:
+            task = calls[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _task: calls.pop(key, None))
+
+        # A cancelled waiter must not cancel the download other waiters depend on
+        return await asyncio.shield(task)
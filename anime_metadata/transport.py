@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from typing import Any, AsyncGenerator, Optional, Tuple
+import weakref
+
+from furl import furl
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+from anime_metadata import constants
+from anime_metadata.typeshed import HttpTimeout
+
+__all__ = [
+    "AsyncTransport",
+    "Transport",
+    "get_default_async_transport",
+    "get_default_transport",
+    "to_httpx_timeout",
+]
+
+_default_transport: Optional["Transport"] = None
+_default_async_transport: Optional["AsyncTransport"] = None
+_default_transport_lock = threading.Lock()
+
+
+class Transport:
+    """
+    Shared HTTP transport with per-host keep-alive connection pools
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int = constants.HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = constants.HTTP_POOL_MAXSIZE,
+        timeout: HttpTimeout = constants.HTTP_TIMEOUT,
+    ) -> None:
+        self.timeout = timeout
+        self.session = requests.Session()
+        # Advertise every content-coding urllib3 can decode here (gzip, deflate and br/zstd when available)
+        self.session.headers.update(make_headers(accept_encoding=True))
+
+        # `pool_connections` is the number of hosts kept in the pool, `pool_maxsize` is connections per host
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        super().__init__()
+
+    def get(self, url: furl, *args: Any, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(url.tostr(), *args, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class AsyncTransport:
+    """
+    Asyncio counterpart of `Transport`, one pooled client per running event loop.
+
+    A client is closed by `aclose()` or, at the latest, by `loop.shutdown_asyncgens()` which `asyncio.run()` awaits
+    before closing its loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_maxsize: int = constants.HTTP_POOL_MAXSIZE,
+        max_connections: int = constants.HTTP_ASYNC_MAX_CONNECTIONS,
+        timeout: HttpTimeout = constants.HTTP_TIMEOUT,
+    ) -> None:
+        self.timeout = to_httpx_timeout(timeout)
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=pool_maxsize)
+        # Client of each event loop with the async generator which closes it at loop shutdown
+        self._clients: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, AsyncGenerator[None, None]]]"
+        ) = weakref.WeakKeyDictionary()
+        super().__init__()
+
+    async def get(self, url: furl, **kwargs: Any) -> httpx.Response:
+        client = await self.client()
+        return await client.get(url.tostr(), **kwargs)
+
+    async def client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if loop in self._clients:
+            return self._clients[loop][0]
+
+        # httpx negotiates gzip/deflate (and br/zstd when available) by default
+        client = httpx.AsyncClient(follow_redirects=True, limits=self.limits, timeout=self.timeout)
+        closer = _close_at_loop_shutdown(client)
+        self._clients[loop] = client, closer
+        # The loop only tracks async generators which have started
+        await closer.__anext__()
+        return client
+
+    async def aclose(self) -> None:
+        """
+        Closes the client of the running event loop, a later request opens a new one
+        """
+        item = self._clients.pop(asyncio.get_running_loop(), None)
+        if item is not None:
+            await item[1].aclose()
+
+
+async def _close_at_loop_shutdown(client: httpx.AsyncClient) -> AsyncGenerator[None, None]:
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+def to_httpx_timeout(timeout: HttpTimeout) -> httpx.Timeout:
+    connect_timeout, read_timeout = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    return httpx.Timeout(read_timeout, connect=connect_timeout)
+
+
+def get_default_transport() -> Transport:
+    global _default_transport
+
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = Transport()
+    return _default_transport
+
+
+def get_default_async_transport() -> AsyncTransport:
+    global _default_async_transport
+
+    with _default_transport_lock:
+        if _default_async_transport is None:
+            _default_async_transport = AsyncTransport()
+    return _default_async_transport
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+import threading
+from typing import Optional, Sequence
+
+import attr
+
+from anime_metadata import constants, enums
+from anime_metadata.typeshed import CacheEntry, CacheKey
+
+__all__ = [
+    "TtlPolicy",
+    "TtlRule",
+    "get_default_policy",
+    "set_default_policy",
+]
+
+_default_policy: Optional["TtlPolicy"] = None
+_default_policy_lock = threading.Lock()
+
+
+@attr.s(auto_attribs=True, kw_only=True, frozen=True)
+class TtlRule:
+    ttl: timedelta
+    # Criteria left as `None` match anything, `data_type` matches as a prefix ("web" matches "web,character")
+    provider: Optional[str] = None
+    data_type: Optional[str] = None
+    show_status: Optional[enums.ShowStatus] = None
+
+    def matches(self, provider: str, data_type: str, show_status: Optional[enums.ShowStatus]) -> bool:
+        return (
+            (self.provider is None or self.provider == provider)
+            and (self.data_type is None or data_type.startswith(self.data_type))
+            and (self.show_status is None or self.show_status is show_status)
+        )
+
+
+DEFAULT_RULES = (
+    TtlRule(data_type="search,noresult", ttl=constants.CACHE_NO_RESULT_TTL),
+    TtlRule(data_type="search", ttl=constants.CACHE_SEARCH_TTL),
+    TtlRule(show_status=enums.ShowStatus.AIRING, ttl=timedelta(days=1)),
+    TtlRule(show_status=enums.ShowStatus.NOT_YET_AIRED, ttl=timedelta(days=3)),
+    TtlRule(show_status=enums.ShowStatus.FINISHED, ttl=timedelta(days=90)),
+)
+
+
+class TtlPolicy:
+    """
+    Lifetime of cache entries by provider, data type and status of the show, the first matching rule wins
+    """
+
+    def __init__(self, rules: Sequence[TtlRule] = DEFAULT_RULES, default: timedelta = constants.MAX_CACHE_LIFETIME):
+        self.rules = tuple(rules)
+        self.default = default
+
+    def ttl(self, provider: str, data_type: str, show_status: Optional[enums.ShowStatus] = None) -> timedelta:
+        for rule in self.rules:
+            if rule.matches(provider, data_type, show_status):
+                return rule.ttl
+        return self.default
+
+    def expires_at(self, key: CacheKey, entry: CacheEntry) -> datetime:
+        provider, data_type, _id = key
+        return entry.last_update + self.ttl(provider, data_type, entry.show_status)
+
+    def is_fresh(self, key: CacheKey, entry: CacheEntry, now: Optional[datetime] = None) -> bool:
+        return self.expires_at(key, entry) > (now or datetime.utcnow())
+
+
+def get_default_policy() -> TtlPolicy:
+    global _default_policy
+
+    with _default_policy_lock:
+        if _default_policy is None:
+            _default_policy = TtlPolicy()
+    return _default_policy
+
+
+def set_default_policy(policy: Optional[TtlPolicy]) -> None:
+    global _default_policy
+
+    with _default_policy_lock:
+        _default_policy = policy
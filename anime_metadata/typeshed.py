@@ -1,5 +1,6 @@
+from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, NamedTuple, Set, Union
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple, Union
 
 import babelfish
 from typing_extensions import OrderedDict, TypedDict
@@ -29,6 +30,10 @@ StaffList = Dict[PositionName, Set[PersonName]]
 
 RawHtml = bytes
 
+HttpTimeout = Union[float, Tuple[float, float]]
+
+CacheKey = Tuple[str, str, str]  # (provider, data_type, id)
+
 Iso8601DateStr = str
 Iso8601DateTimeStr = str
 
@@ -48,3 +53,11 @@ class RawEpisode(TypedDict, total=False):
     premiered: str
     rating: str
     titles: Dict[enums.Language, AnimeTitle]
+
+
+class CacheEntry(NamedTuple):
+    data: RawHtml
+    last_update: datetime
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    show_status: Optional[enums.ShowStatus] = None
@@ -1,16 +1,37 @@
+import asyncio
 from collections.abc import Generator, Iterator
+import functools
+import hashlib
 import re
-from typing import Callable, Iterable, List, Union
+from typing import Any, Awaitable, Callable, Iterable, List, Optional, TypeVar, Union
 import xml.etree.ElementTree as ET
 
 from bs4 import BeautifulSoup
-from lxml import html
+from lxml import etree, html
 from rapidfuzz.distance import Indel
 
 from anime_metadata.exceptions import ProviderMultipleResultError, ProviderNoResultError, ProviderResultFound
 from anime_metadata.typeshed import AnimeTitle, ApiResponseData, StaffList
 
 ANIDB_LINK_REMOVER = re.compile(r"https?://(www\.)?anidb\.net/[^\s]+\s\[([^\]]+)\]")
+NORMALIZED_CHARACTERS = str.maketrans({"`": "'", "’": "'", "“": '"', "”": '"', "…": "...", "—": "-"})
+MULTIPLE_SPACES = re.compile(r" {2,}")
+# Characters BeautifulSoup does not pass through unchanged, text without any of them skips HTML parsing
+MARKUP_CHARACTERS = re.compile("[<&\r\x00]")
+SKIPPED_LINE_PREFIXES = ("source:", "note:")
+
+LINE_EDGE_WHITESPACES = re.compile(r"(^[\s]+)|([\s]+$)", re.MULTILINE)
+WHITESPACES_BEFORE_TAG = re.compile(r"[\s]+<")
+WHITESPACES_AFTER_TAG = re.compile(r">[\s]+")
+# Entities like `&nbsp;` are decoded once the page is parsed, only ASCII whitespaces are minimized in the tree
+TEXT_LINE_EDGE_WHITESPACES = re.compile(r"(^[\s]+)|([\s]+$)", re.MULTILINE | re.ASCII)
+ASCII_WHITESPACES = " \t\n\r\f\v"
+# Whitespace separated attributes, normalized to single spaces like BeautifulSoup does
+LIST_ATTRIBUTES = frozenset({"accept-charset", "accesskey", "archive", "class", "dropzone", "headers", "rel", "rev"})
+
+HTML_PARSER = html.HTMLParser(encoding="utf-8")
+
+T = TypeVar("T")
 
 
 def find_title_in_provider_results(  # noqa: C901
@@ -29,8 +50,7 @@ def find_title_in_provider_results(  # noqa: C901
     results = []
 
     for item in data:
-        item_title = data_item_title_getter(item)
-        cmp = Indel.normalized_similarity(item_title, title)
+        cmp = title_similarity(data_item_title_getter(item), title)
         if cmp == 1.0:
             raise ProviderResultFound(item)
         if cmp >= title_similarity_factor:
@@ -46,6 +66,21 @@ def find_title_in_provider_results(  # noqa: C901
     raise ProviderMultipleResultError
 
 
+def title_similarity(first: AnimeTitle, second: AnimeTitle) -> float:
+    """
+    1.0 for identical titles, down to 0.0 for titles without anything in common
+    """
+    return Indel.normalized_similarity(first, second)
+
+
+def search_cache_id(title: AnimeTitle, *parts: Any) -> str:
+    """
+    Short stable id of a title lookup, case and whitespace insensitive, fits the `id` column of the cache
+    """
+    key = "\0".join([" ".join(title.casefold().split()), *map(str, parts)])
+    return hashlib.blake2b(key.encode(), digest_size=5).hexdigest()
+
+
 def capitalize(value: str) -> str:
     return " ".join(map(str.capitalize, value.strip().split()))
 
@@ -77,62 +112,124 @@ def minimize_html(html: str) -> str:
     """
     Remove distracting whitespaces and newline characters
     """
-    pat = re.compile(r"(^[\s]+)|([\s]+$)", re.MULTILINE)
-    html = re.sub(pat, "", html)  # remove leading and trailing whitespaces
-    html = re.sub("\n", " ", html)  # convert newlines to spaces
+    html = LINE_EDGE_WHITESPACES.sub("", html)  # remove leading and trailing whitespaces
+    html = html.replace("\n", " ")  # convert newlines to spaces
     # this preserves newline delimiters
-    html = re.sub(r"[\s]+<", "<", html)  # remove whitespaces before opening tags
-    html = re.sub(r">[\s]+", ">", html)  # remove whitespaces after closing tags
+    html = WHITESPACES_BEFORE_TAG.sub("<", html)  # remove whitespaces before opening tags
+    html = WHITESPACES_AFTER_TAG.sub(">", html)  # remove whitespaces after closing tags
     return html
 
 
 def load_html(raw_data: bytes) -> html.HtmlElement:
+    """
+    Parses the page once and minimizes whitespaces of the resulting tree like `minimize_html()` does to the markup
+    """
+    try:
+        root = html.fromstring(raw_data, parser=HTML_PARSER)
+    except etree.ParserError:
+        return load_html_lenient(raw_data)
+
+    for element in root.iter():
+        _minimize_element(element)
+    return root
+
+
+def load_html_lenient(raw_data: bytes) -> html.HtmlElement:
+    """
+    Minimizes the markup and lets BeautifulSoup repair it before parsing, several times slower than `load_html()`
+    """
     return html.fromstring(str(BeautifulSoup(minimize_html(raw_data.decode("utf-8")), "html.parser")))
 
 
+def _minimize_element(element: html.HtmlElement) -> None:
+    if isinstance(element, etree._Comment):
+        # Comments are kept verbatim by the parser, markup inside them included
+        element.text = minimize_html(f"<!--{element.text}-->")[4:-3]
+    else:
+        element.text = _minimize_text(element.text)
+    element.tail = _minimize_text(element.tail)
+
+    for name, value in element.attrib.items():
+        minimized = _minimize_attribute(name, value)
+        if minimized != value:
+            element.attrib[name] = minimized
+
+
+def _minimize_text(value: Optional[str]) -> Optional[str]:
+    if not value:
+        return value
+    # Wrapped in the tags around it, line anchors match exactly where they would in the whole markup
+    value = TEXT_LINE_EDGE_WHITESPACES.sub("", f">{value}<").replace("\n", " ")[1:-1]
+    return value.strip(ASCII_WHITESPACES) or None
+
+
+def _minimize_attribute(name: str, value: str) -> str:
+    if name in LIST_ATTRIBUTES:
+        return " ".join(value.split())
+    if value.strip(ASCII_WHITESPACES) == value and "\n" not in value:
+        return value
+    return TEXT_LINE_EDGE_WHITESPACES.sub("", f'"{value}"').replace("\n", " ")[1:-1]
+
+
 def normalize_string(value: Union[str, ET.Element, None]) -> Union[str, None]:
     value = getattr(value, "text", value)
     value = None if value is None else value.strip()
     if not value:
         return None
-
-    result = (
-        value.replace("`", "'")
-        .replace("’", "'")
-        .replace("“", '"')
-        .replace("”", '"')
-        .replace("…", "...")
-        .replace("—", "-")
-        .replace('."', '".')
-        .replace(',"', '",')
-        .replace(';"', '";')
-    )
-
-    result = re.sub(r" {2,}", " ", result)
-    result = ANIDB_LINK_REMOVER.sub("\\2", result)
-    result = html_br_to_nl(result)
+    return _normalize_text(value)
+
+
+# Summaries repeat across providers and lookups of the same series
+@functools.lru_cache(maxsize=4096)
+def _normalize_text(value: str) -> str:
+    result = value.translate(NORMALIZED_CHARACTERS)
+    # Each step only runs when it can change something
+    if '"' in result:
+        result = result.replace('."', '".').replace(',"', '",').replace(';"', '";')
+    if "  " in result:
+        result = MULTIPLE_SPACES.sub(" ", result)
+    if "anidb.net/" in result:
+        result = ANIDB_LINK_REMOVER.sub("\\2", result)
+    if MARKUP_CHARACTERS.search(result):
+        result = html_br_to_nl(result)
 
     # TODO: Remove:
     #  - Text containing: "(Source ...)"
 
-    def _line_filter(text_line: str) -> bool:
-        text_line = text_line.strip()
-        if any(
-            (
-                text_line.lower().startswith("source:"),
-                text_line.lower().startswith("note:"),
-                text_line.startswith("* "),
-            )
-        ):
-            return False
-        return bool(text_line)
-
-    # fmt: off
-    result = "\n".join(
-        filter(
-            _line_filter,
-            (line.strip("*").strip() for line in result.splitlines()),
-        )
-    )
-    # fmt: on
-    return result
+    return "\n".join(filter(_line_filter, (line.strip("*").strip() for line in result.splitlines())))
+
+
+def _line_filter(text_line: str) -> bool:
+    text_line = text_line.strip()
+    if text_line.lower().startswith(SKIPPED_LINE_PREFIXES) or text_line.startswith("* "):
+        return False
+    return bool(text_line)
+
+
+async def gather_with_concurrency(limit: int, *aws: Awaitable[T]) -> List[T]:
+    """
+    Like `asyncio.gather`, but at most `limit` awaitables run at once, results keep the input order
+    """
+    semaphore = asyncio.Semaphore(limit)
+    return list(await asyncio.gather(*(_run_bounded(semaphore, aw) for aw in aws)))
+
+
+async def wait_with_concurrency(limit: int, timeout: Optional[float], *aws: Awaitable[T]) -> List[Optional[T]]:
+    """
+    Like `gather_with_concurrency`, but awaitables not finished within `timeout` seconds are cancelled and yield None
+    """
+    semaphore = asyncio.Semaphore(limit)
+    tasks = [asyncio.ensure_future(_run_bounded(semaphore, aw)) for aw in aws]
+    if not tasks:
+        return []
+
+    _done, pending = await asyncio.wait(tasks, timeout=timeout)
+    for task in pending:
+        task.cancel()
+
+    return [None if task in pending else task.result() for task in tasks]
+
+
+async def _run_bounded(semaphore: asyncio.Semaphore, aw: Awaitable[T]) -> T:
+    async with semaphore:
+        return await aw
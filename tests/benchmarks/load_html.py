@@ -0,0 +1,46 @@
+"""
+Compares `utils.load_html()` with the BeautifulSoup based `utils.load_html_lenient()` on the wiremock fixture pages:
+
+    python -m tests.benchmarks.load_html [--rounds N]
+"""
+import argparse
+from pathlib import Path
+import timeit
+from typing import Iterator, Optional, Tuple
+
+from lxml import html
+
+from anime_metadata import utils
+
+FILES_DIR = Path(__file__).parent.parent / "wiremock" / "__files"
+
+TreeItem = Tuple[str, Optional[str], Optional[str]]
+
+
+def _texts(root: html.HtmlElement) -> Iterator[TreeItem]:
+    for element in root.iter():
+        yield str(element.tag), element.text, element.tail
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    total_lenient = total_fast = 0.0
+    for path in sorted(FILES_DIR.glob("**/*.html")):
+        raw_data = path.read_bytes()
+        if list(_texts(utils.load_html(raw_data))) != list(_texts(utils.load_html_lenient(raw_data))):
+            raise AssertionError(f"{path.name}: trees differ")
+
+        lenient = timeit.timeit(lambda: utils.load_html_lenient(raw_data), number=args.rounds) / args.rounds
+        fast = timeit.timeit(lambda: utils.load_html(raw_data), number=args.rounds) / args.rounds
+        total_lenient += lenient
+        total_fast += fast
+        print(f"{path.name:<20} {lenient * 1000:>8.1f} ms {fast * 1000:>8.1f} ms {lenient / fast:>6.1f}x")
+
+    print(f"{'total':<20} {total_lenient * 1000:>8.1f} ms {total_fast * 1000:>8.1f} ms {total_lenient / total_fast:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
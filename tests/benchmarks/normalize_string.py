@@ -0,0 +1,81 @@
+"""
+Times `utils.normalize_string()` on AniDB episode summaries against the previous implementation, which parsed every
+string with BeautifulSoup:
+
+    python -m tests.benchmarks.normalize_string [--summaries N] [--rounds N]
+"""
+import argparse
+from pathlib import Path
+import re
+import timeit
+from typing import List, Optional
+import xml.etree.ElementTree as ET
+
+from anime_metadata import utils
+
+ANIDB_XML = Path(__file__).parent.parent / "wiremock" / "__files" / "anidb" / "httpapi-14289.xml"
+
+
+def normalize_string_baseline(value: Optional[str]) -> Optional[str]:
+    value = None if value is None else value.strip()
+    if not value:
+        return None
+
+    result = (
+        value.replace("`", "'")
+        .replace("’", "'")
+        .replace("“", '"')
+        .replace("”", '"')
+        .replace("…", "...")
+        .replace("—", "-")
+        .replace('."', '".')
+        .replace(',"', '",')
+        .replace(';"', '";')
+    )
+    result = re.sub(r" {2,}", " ", result)
+    result = utils.ANIDB_LINK_REMOVER.sub("\\2", result)
+    result = utils.html_br_to_nl(result)
+
+    def _line_filter(text_line: str) -> bool:
+        text_line = text_line.strip()
+        if text_line.lower().startswith(("source:", "note:")) or text_line.startswith("* "):
+            return False
+        return bool(text_line)
+
+    return "\n".join(filter(_line_filter, (line.strip("*").strip() for line in result.splitlines())))
+
+
+def _summaries(count: int) -> List[str]:
+    root = ET.parse(ANIDB_XML).getroot()
+    texts = [item.text or "" for item in root.iter() if item.tag in ("summary", "description")]
+    # Distinct strings, the memo of `normalize_string()` only helps the repeated runs
+    return [f"{texts[i % len(texts)]}\nEpisode {i}." for i in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--summaries", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    summaries = _summaries(args.summaries)
+    for summary in summaries:
+        if utils.normalize_string(summary) != normalize_string_baseline(summary):
+            raise AssertionError(f"Results differ for {summary!r}")
+
+    def _cold() -> None:
+        utils._normalize_text.cache_clear()
+        for summary in summaries:
+            utils.normalize_string(summary)
+
+    baseline = timeit.timeit(lambda: [normalize_string_baseline(item) for item in summaries], number=args.rounds)
+    cold = timeit.timeit(_cold, number=args.rounds)
+    warm = timeit.timeit(lambda: [utils.normalize_string(item) for item in summaries], number=args.rounds)
+
+    for name, elapsed in (("baseline", baseline), ("uncached", cold), ("memoized", warm)):
+        per_round = elapsed / args.rounds * 1000
+        print(f"{name:<10} {per_round:>9.2f} ms / {len(summaries)} summaries {baseline / elapsed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
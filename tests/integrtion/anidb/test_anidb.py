@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from decimal import Decimal
 
@@ -105,3 +106,14 @@ def test_search_series(anidb_base_img_cdn_url: str, anidb_provider: AniDBProvide
         enums.Language.ROMAJI: "Bokutachi wa Benkyou ga Dekinai",
         enums.Language.JAPANESE: "ぼくたちは勉強ができない",
     }
+
+
+def test_asearch_series(anidb_provider: AniDBProvider) -> None:
+    # GIVEN
+    anime_title: AnimeTitle = "Bokutachi wa Benkyou ga Dekinai"
+
+    # WHEN
+    result = asyncio.run(anidb_provider.asearch_series(anime_title))
+
+    # THEN
+    assert result == anidb_provider.search_series(anime_title)
@@ -1,15 +1,29 @@
+import os
 from typing import Iterator
 from unittest import mock
 
 import pytest
+import requests
 
 import anime_metadata.interfaces.cache
 from anime_metadata.exceptions import CacheDataNotFound
 
 
+@pytest.fixture(scope="session")
+def wiremock_url() -> str:
+    return f"http://localhost:{os.environ['WIREMOCK_PORT']}"  # FIXME
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _reload_wiremock_stubs(wiremock_url: str) -> None:
+    response = requests.post(f"{wiremock_url}/__admin/mappings/reset")
+    response.raise_for_status()
+
+
 @pytest.fixture(autouse=True)
 def _disable_cache() -> Iterator[None]:
     with \
          mock.patch.object(anime_metadata.interfaces.cache.BaseCache, "get", side_effect=CacheDataNotFound), \
-         mock.patch.object(anime_metadata.interfaces.cache.BaseCache, "set"):
+         mock.patch.object(anime_metadata.interfaces.cache.BaseCache, "set"), \
+         mock.patch.object(anime_metadata.interfaces.cache.BaseCache, "set_show_status"):
         yield
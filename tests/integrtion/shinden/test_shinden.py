@@ -1,5 +1,7 @@
+import asyncio
 from datetime import datetime
 from decimal import Decimal
+from unittest import mock
 
 from anime_metadata import dtos, enums
 from anime_metadata.providers import ShindenProvider
@@ -65,3 +67,27 @@ def test_search_series(shinden_base_web_url: str, shinden_provider: ShindenProvi
         enums.Language.ROMAJI: "Bokutachi wa Benkyou ga Dekinai",
     }
 
+
+def test_asearch_series(shinden_provider: ShindenProvider) -> None:
+    # GIVEN
+    anime_title: AnimeTitle = "Bokutachi wa Benkyou ga Dekinai"
+
+    # WHEN
+    result = asyncio.run(shinden_provider.asearch_series(anime_title))
+
+    # THEN
+    assert result == shinden_provider.search_series(anime_title)
+
+
+def test_asearch_series_stops_at_exact_match(shinden_provider: ShindenProvider) -> None:
+    # GIVEN
+    anime_title: AnimeTitle = "Bokutachi wa Benkyou ga Dekinai"
+
+    # WHEN
+    with mock.patch.object(shinden_provider, "afetch", wraps=shinden_provider.afetch) as afetch:
+        result = asyncio.run(shinden_provider.asearch_series(anime_title))
+
+    # THEN
+    assert result.id == "53932"
+    # First search results page, then the series page
+    assert [call.args[0].url.path.segments[-1] for call in afetch.call_args_list] == ["series", "53932"]
@@ -0,0 +1,122 @@
+import threading
+import time
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type
+
+from furl import furl
+import requests
+
+from anime_metadata import dtos, enums, interfaces
+from anime_metadata.transport import Transport
+from anime_metadata.typeshed import AnimeId, AnimeTitle
+
+
+class FakeProvider(interfaces.BaseProvider):
+    """
+    Returns `result` or raises `error` after `delay` seconds, without any HTTP requests
+    """
+
+    def __init__(
+        self,
+        result: Optional[dtos.TvSeriesData] = None,
+        error: Optional[Exception] = None,
+        delay: float = 0.0,
+        **kwargs: Any,
+    ) -> None:
+        self.result = result
+        self.error = error
+        self.delay = delay
+        self.calls: List[AnimeId] = []
+        super().__init__(api_key="", **kwargs)
+
+    def _get_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        self.calls.append(anime_id)
+        time.sleep(self.delay)
+        return self._result()
+
+    async def _aget_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        return self._get_series_by_id(anime_id)
+
+    def _find_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
+        return self._get_series_by_id(title)
+
+    async def _afind_series_by_title(self, title: AnimeTitle, year: Optional[int]) -> dtos.TvSeriesData:
+        return self._get_series_by_id(title)
+
+    def _result(self) -> dtos.TvSeriesData:
+        if self.error is not None:
+            raise self.error
+        assert self.result is not None
+        return self.result
+
+
+def fake_provider_class(
+    name: str,
+    provides: Optional[FrozenSet[str]] = None,
+    expected_latency: float = 1.0,
+) -> Type[FakeProvider]:
+    return type(name, (FakeProvider,), {"provides": provides, "expected_latency": expected_latency})
+
+
+def series(anime_id: AnimeId = "1", **kwargs: Any) -> dtos.TvSeriesData:
+    kwargs.setdefault("titles", {enums.Language.ROMAJI: f"Title {anime_id}"})
+    return dtos.TvSeriesData(provider=None, id=anime_id, **kwargs)
+
+
+class FakeTransport(Transport):
+    """
+    Answers every request with `status_code` and `content`, records the headers of each request
+    """
+
+    def __init__(
+        self,
+        content: bytes = b"data",
+        status_code: int = 200,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        self.content = content
+        self.status_code = status_code
+        self.etag = etag
+        self.last_modified = last_modified
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+        # Cleared to hold requests until it is set again
+        self.unblocked = threading.Event()
+        self.unblocked.set()
+        super().__init__()
+
+    def get(self, url: furl, *args: Any, **kwargs: Any) -> requests.Response:
+        self.requests.append((url.tostr(), dict(kwargs.get("headers") or {})))
+        assert self.unblocked.wait(5)
+        response = requests.Response()
+        response.status_code = self.status_code
+        response._content = self.content
+        if self.etag is not None:
+            response.headers["ETag"] = self.etag
+        if self.last_modified is not None:
+            response.headers["Last-Modified"] = self.last_modified
+        return response
+
+
+class PageCache(interfaces.BaseCache):
+    provider_name = "page"
+
+
+class PageProvider(interfaces.BaseProvider):
+    """
+    Parses the plot of a series from its cached page, downloaded through `transport`
+    """
+
+    cache_class = PageCache
+
+    def __init__(self, transport: FakeTransport, **kwargs: Any) -> None:
+        super().__init__(api_key="", transport=transport, **kwargs)
+
+    def page_request(self, anime_id: AnimeId) -> interfaces.ProviderRequest:
+        return interfaces.ProviderRequest(
+            url=furl("https://example.com/series").add(path=str(anime_id)),
+            cache=PageCache("web,series", anime_id),
+        )
+
+    def _get_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        page = self.fetch(self.page_request(anime_id))
+        return series(anime_id, plot=page.decode(), dates=dtos.ShowDate(premiered="2019-04-06", ended="2019-06-29"))
@@ -0,0 +1,105 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from anime_metadata import aggregator as aggregator_module, enums
+from anime_metadata.aggregator import Aggregator, PartialResult
+from anime_metadata.exceptions import ProviderNoResultError, ValidationError
+
+from .fake_providers import fake_provider_class, series
+
+First = fake_provider_class("First")
+Second = fake_provider_class("Second")
+
+
+def test_fields_are_merged_in_provider_order() -> None:
+    # GIVEN
+    aggregator = Aggregator(
+        [
+            First(series("1", plot="First plot", titles={enums.Language.ROMAJI: "First"})),
+            Second(series("2", plot="Second plot", mpaa=enums.MPAA.PG_13, titles={enums.Language.ENGLISH: "Second"})),
+        ]
+    )
+
+    # WHEN
+    result = aggregator.get_series({"First": "1", "Second": "2"})
+
+    # THEN
+    assert result.id == "1"
+    assert result.plot == "First plot"
+    assert result.mpaa == enums.MPAA.PG_13
+    assert result.titles == {enums.Language.ROMAJI: "First", enums.Language.ENGLISH: "Second"}
+    assert result._raw is not None
+    assert set(result._raw) == {"First", "Second"}
+
+
+def test_priority_overrides_provider_order() -> None:
+    # GIVEN
+    aggregator = Aggregator(
+        [First(series("1", plot="First plot")), Second(series("2", plot="Second plot"))],
+        priority={"plot": ["Second"]},
+    )
+
+    # WHEN
+    result = aggregator.search_series("Title")
+
+    # THEN
+    assert result.plot == "Second plot"
+    assert result.id == "1"
+
+
+def test_provider_errors_are_reported_and_skipped() -> None:
+    # GIVEN
+    error = ProviderNoResultError()
+    aggregator = Aggregator([First(error=error), Second(series("2", plot="Second plot"))])
+
+    # WHEN
+    partial_results: List[PartialResult] = list(aggregator.iter_get_series({"First": "1", "Second": "2"}))
+
+    # THEN
+    assert {item.provider: item.error for item in partial_results} == {"First": error, "Second": None}
+    assert partial_results[-1].pending == 0
+    assert partial_results[-1].merged is not None
+    assert partial_results[-1].merged.plot == "Second plot"
+
+
+def test_no_result_when_every_provider_fails() -> None:
+    # GIVEN
+    aggregator = Aggregator([First(error=RuntimeError("down")), Second(error=ProviderNoResultError())])
+
+    # WHEN / THEN
+    with pytest.raises(ProviderNoResultError):
+        aggregator.get_series({"First": "1", "Second": "2"})
+
+
+def test_aggregators_share_worker_pool() -> None:
+    # GIVEN
+    Aggregator([First(series("1")), Second(series("2"))]).get_series({"First": "1", "Second": "2"})
+    executors = dict(aggregator_module._executors)
+
+    # WHEN
+    Aggregator([First(series("1")), Second(series("2"))]).get_series({"First": "1", "Second": "2"})
+
+    # THEN
+    assert aggregator_module._executors == executors
+
+
+def test_async_results_match_sync_results() -> None:
+    # GIVEN
+    aggregator = Aggregator(
+        [First(series("1", plot="First plot"), delay=0.05), Second(series("2", genres={"Comedy"}))],
+    )
+
+    # WHEN
+    result = asyncio.run(aggregator.aget_series({"First": "1", "Second": "2"}))
+
+    # THEN
+    assert result == aggregator.get_series({"First": "1", "Second": "2"})
+    assert result.plot == "First plot"
+    assert result.genres == {"Anime", "Comedy"}
+
+
+def test_at_least_one_provider_is_required() -> None:
+    with pytest.raises(ValidationError):
+        Aggregator([])
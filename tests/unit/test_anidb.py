@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from anime_metadata import enums
+from anime_metadata.providers.anidb import AniDBXML
+
+
+def test_external_entities_are_not_resolved(tmp_path: Path) -> None:
+    # GIVEN
+    secret = tmp_path / "secret.txt"
+    secret.write_text("secret")
+    raw_xml_doc = f"""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE anime [<!ENTITY xxe SYSTEM "{secret.as_uri()}">]>
+<anime id="1">
+    <titles><title xml:lang="x-jat" type="main">Title</title></titles>
+    <description>Plot &xxe;</description>
+</anime>
+""".encode()
+
+    # WHEN
+    parser = AniDBXML(raw_xml_doc)
+
+    # THEN
+    assert "secret" not in parser.get_plot()
+    assert parser.get_id() == "1"
+    assert parser.get_titles() == {enums.Language.ROMAJI: "Title"}
@@ -0,0 +1,194 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from anime_metadata import backends, enums, interfaces
+from anime_metadata.exceptions import ValidationError
+from anime_metadata.typeshed import CacheEntry
+
+KEY = ("provider", "web,series", "1")
+OTHER_KEY = ("provider", "web,series", "2")
+
+
+@pytest.fixture(params=["memory", "filesystem", "sqlite"])
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> interfaces.BaseCacheBackend:
+    if request.param == "memory":
+        return backends.MemoryBackend()
+    if request.param == "filesystem":
+        return backends.FilesystemBackend(tmp_path / "cache")
+    return backends.SqliteBackend(tmp_path / "cache.db")
+
+
+def test_get_missing(backend: interfaces.BaseCacheBackend) -> None:
+    assert backend.get(KEY) is None
+
+
+def test_set_and_get(backend: interfaces.BaseCacheBackend) -> None:
+    # GIVEN
+    started = datetime.utcnow() - timedelta(seconds=1)
+
+    # WHEN
+    backend.set(KEY, b"data", "etag", "Wed, 21 Oct 2015 07:28:00 GMT", enums.ShowStatus.AIRING)
+
+    # THEN
+    entry = backend.get(KEY)
+    assert entry is not None
+    assert entry.data == b"data"
+    assert entry.etag == "etag"
+    assert entry.last_modified == "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert entry.show_status is enums.ShowStatus.AIRING
+    assert entry.last_update >= started
+    assert backend.get(OTHER_KEY) is None
+
+
+def test_set_replaces_entry_and_keeps_show_status(backend: interfaces.BaseCacheBackend) -> None:
+    # GIVEN
+    backend.set(KEY, b"data", "etag", None, enums.ShowStatus.FINISHED)
+
+    # WHEN
+    backend.set(KEY, b"new data")
+
+    # THEN
+    entry = backend.get(KEY)
+    assert entry is not None
+    assert entry.data == b"new data"
+    assert entry.etag is None
+    assert entry.show_status is enums.ShowStatus.FINISHED
+
+
+def test_touch_refreshes_last_update(backend: interfaces.BaseCacheBackend) -> None:
+    # GIVEN
+    old = datetime.utcnow() - timedelta(days=30)
+    backend.set_many({KEY: CacheEntry(data=b"data", last_update=old)})
+    backend.set_show_status([KEY], enums.ShowStatus.AIRING)
+
+    # WHEN
+    backend.touch(KEY)
+    backend.touch(OTHER_KEY)
+
+    # THEN
+    entry = backend.get(KEY)
+    assert entry is not None
+    assert entry.last_update > old + timedelta(days=29)
+    assert backend.get(OTHER_KEY) is None
+
+
+def test_get_many_and_set_many(backend: interfaces.BaseCacheBackend) -> None:
+    # GIVEN
+    now = datetime.utcnow()
+    items = {
+        KEY: CacheEntry(data=b"first", last_update=now, etag="1"),
+        OTHER_KEY: CacheEntry(data=b"second", last_update=now),
+    }
+
+    # WHEN
+    backend.set_many(items)
+
+    # THEN
+    result = backend.get_many([KEY, OTHER_KEY, ("provider", "web,series", "3")])
+    assert {key: entry.data for key, entry in result.items()} == {KEY: b"first", OTHER_KEY: b"second"}
+    assert result[KEY].etag == "1"
+
+
+def test_set_show_status(backend: interfaces.BaseCacheBackend) -> None:
+    # GIVEN
+    backend.set(KEY, b"data")
+    before = backend.get(KEY)
+
+    # WHEN
+    backend.set_show_status([KEY, OTHER_KEY], enums.ShowStatus.FINISHED)
+
+    # THEN
+    entry = backend.get(KEY)
+    assert before is not None and entry is not None
+    assert entry.show_status is enums.ShowStatus.FINISHED
+    assert entry.data == b"data"
+    assert abs(entry.last_update - before.last_update) < timedelta(seconds=1)
+    assert backend.get(OTHER_KEY) is None
+
+
+def test_memory_backend_evicts_least_recently_used() -> None:
+    # GIVEN
+    backend = backends.MemoryBackend(max_bytes=10)
+    backend.set(("p", "t", "1"), b"1234")
+    backend.set(("p", "t", "2"), b"1234")
+    backend.get(("p", "t", "1"))
+
+    # WHEN
+    backend.set(("p", "t", "3"), b"1234")
+
+    # THEN
+    assert backend.get(("p", "t", "2")) is None
+    assert backend.get(("p", "t", "1")) is not None
+    assert backend.get(("p", "t", "3")) is not None
+    stats = backend.stats()
+    assert (stats.entries, stats.size, stats.evictions) == (2, 8, 1)
+    assert (stats.hits, stats.misses) == (3, 1)
+    assert stats.hit_rate == 0.75
+
+
+def test_memory_backend_skips_entries_larger_than_limit() -> None:
+    # GIVEN
+    backend = backends.MemoryBackend(max_bytes=4)
+
+    # WHEN
+    backend.set(KEY, b"12345")
+
+    # THEN
+    assert backend.get(KEY) is None
+    assert backend.stats().size == 0
+
+
+def test_memory_backend_ttl() -> None:
+    # GIVEN
+    backend = backends.MemoryBackend(ttl=timedelta(hours=1))
+    backend.put(KEY, CacheEntry(data=b"data", last_update=datetime.utcnow() - timedelta(hours=2)))
+    backend.set(OTHER_KEY, b"data")
+
+    # WHEN / THEN
+    assert backend.get(KEY) is None
+    assert backend.get(OTHER_KEY) is not None
+
+
+def test_filesystem_backend_shards_files(tmp_path: Path) -> None:
+    # GIVEN
+    backend = backends.FilesystemBackend(tmp_path)
+
+    # WHEN
+    backend.set(KEY, b"data")
+
+    # THEN
+    path = backend.path(KEY)
+    assert path.is_file()
+    assert path.relative_to(tmp_path).parts[:2] == (path.name[:2], path.name[2:4])
+    assert [item.name for item in path.parent.iterdir()] == [path.name]
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("memory://", backends.MemoryBackend),
+        ("memory://?max_bytes=1024", backends.MemoryBackend),
+        ("file://{tmp_path}/cache", backends.FilesystemBackend),
+        ("sqlite://{tmp_path}/cache.db", backends.SqliteBackend),
+    ],
+)
+def test_from_url(url: str, expected: type, tmp_path: Path) -> None:
+    # WHEN
+    backend = backends.from_url(url.format(tmp_path=tmp_path))
+
+    # THEN
+    assert type(backend) is expected
+    assert not isinstance(backend, backends.FilesystemBackend) or backend.root == tmp_path / "cache"
+
+
+def test_from_url_memory_limit() -> None:
+    backend = backends.from_url("memory://?max_bytes=1024")
+    assert isinstance(backend, backends.MemoryBackend)
+    assert backend.max_bytes == 1024
+
+
+def test_from_url_unsupported() -> None:
+    with pytest.raises(ValidationError):
+        backends.from_url("redis://localhost")
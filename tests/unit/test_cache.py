@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+from typing import Dict, List, Sequence
+
+from anime_metadata import backends, interfaces
+from anime_metadata.typeshed import CacheEntry, CacheKey
+
+
+class Cache(interfaces.BaseCache):
+    provider_name = "provider"
+
+
+class CountingBackend(backends.MemoryBackend):
+    def __init__(self) -> None:
+        self.lookups: List[Sequence[CacheKey]] = []
+        super().__init__()
+
+    def get_many(self, keys: Sequence[CacheKey]) -> Dict[CacheKey, CacheEntry]:
+        self.lookups.append(keys)
+        return super().get_many(keys)
+
+
+def test_get_many_reads_each_backend_once() -> None:
+    # GIVEN
+    first, second = CountingBackend(), CountingBackend()
+    caches = [
+        Cache("web,series", 1, backend=first),
+        Cache("web,series", 2, backend=second),
+        Cache("web,series", 3, backend=first),
+    ]
+    interfaces.BaseCache.set_many([(caches[0], b"first"), (caches[1], b"second")])
+
+    # WHEN
+    result = interfaces.BaseCache.get_many(caches)
+
+    # THEN
+    assert result == [b"first", b"second", None]
+    assert first.lookups == [[caches[0].key, caches[2].key]]
+    assert second.lookups == [[caches[1].key]]
+
+
+def test_get_many_skips_expired_entries() -> None:
+    # GIVEN
+    backend = backends.MemoryBackend()
+    fresh, expired = Cache("web,series", 1, backend=backend), Cache("web,series", 2, backend=backend)
+    backend.put(fresh.key, CacheEntry(data=b"fresh", last_update=datetime.utcnow()))
+    backend.put(expired.key, CacheEntry(data=b"expired", last_update=datetime.utcnow() - timedelta(days=365)))
+
+    # WHEN
+    result = interfaces.BaseCache.get_many([fresh, expired])
+
+    # THEN
+    assert result == [b"fresh", None]
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+from click.testing import CliRunner
+import peewee
+import pytest
+
+from anime_metadata import backends, constants, main
+
+
+@pytest.fixture
+def cache_url(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    url = f"sqlite://{tmp_path}/cache.db"
+    monkeypatch.setattr(constants, "CACHE_URL", url)
+    backend = backends.from_url(url)
+    for _id in range(3):
+        backend.set(("anidb", "web,series", str(_id)), bytes(400))
+    backend.set(("mal", "api,series", "1"), bytes(100))
+    return url
+
+
+def test_cache_usage(cache_url: str) -> None:
+    # WHEN
+    result = CliRunner().invoke(main, ["cache-usage"])
+
+    # THEN
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines() == [
+        f"{'anidb':<10} {'web,series':<20} {3:>10} {1200:>14}",
+        f"{'mal':<10} {'api,series':<20} {1:>10} {100:>14}",
+        f"{'total':<31} {4:>10} {1300:>14}",
+    ]
+
+
+def test_cache_evict(cache_url: str) -> None:
+    # WHEN
+    result = CliRunner().invoke(main, ["cache-evict", "--max-size", "500", "--vacuum"])
+
+    # THEN
+    assert result.exit_code == 0, result.output
+    usage = backends.from_url(cache_url).usage()  # type:ignore
+    assert result.output == f"Evicted {4 - sum(item.entries for item in usage)} entries\n"
+    assert 0 < sum(item.size for item in usage) <= 500
+
+
+def test_cache_evict_requires_database_backend(monkeypatch: pytest.MonkeyPatch) -> None:
+    # GIVEN
+    monkeypatch.setattr(constants, "CACHE_URL", "memory://")
+
+    # WHEN
+    result = CliRunner().invoke(main, ["cache-evict"])
+
+    # THEN
+    assert result.exit_code == 1
+    assert "requires a database backend" in result.output
+
+
+def test_main_creates_tables_of_cache_url(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # GIVEN
+    monkeypatch.setattr(constants, "CACHE_URL", f"sqlite://{tmp_path}/new.db")
+
+    # WHEN
+    result = CliRunner().invoke(main, [])
+
+    # THEN
+    assert result.exit_code == 0, result.output
+    assert peewee.SqliteDatabase(str(tmp_path / "new.db")).table_exists("providers_cache")
@@ -0,0 +1,65 @@
+import os
+from unittest import mock
+
+import pytest
+
+from anime_metadata import compression, constants
+
+# `zstandard` is optional, without it everything is compressed with zlib
+requires_zstandard = pytest.mark.skipif(compression.zstandard is None, reason="zstandard is not installed")
+
+
+@pytest.mark.parametrize("codec", [pytest.param(compression.ZSTD, marks=requires_zstandard), compression.ZLIB])
+def test_round_trip(codec: str) -> None:
+    # GIVEN
+    data = b"<html>" + b"anime metadata " * 1000 + b"</html>"
+
+    # WHEN
+    with mock.patch.object(compression, "zstandard", compression.zstandard if codec == compression.ZSTD else None):
+        stored_codec, payload = compression.compress(data)
+
+    # THEN
+    assert stored_codec == codec
+    assert len(payload) < len(data)
+    assert compression.decompress(stored_codec, payload) == data
+
+
+def test_small_data_is_stored_as_is() -> None:
+    # GIVEN
+    data = b"x" * (constants.CACHE_COMPRESSION_MIN_SIZE - 1)
+
+    # WHEN
+    codec, payload = compression.compress(data)
+
+    # THEN
+    assert codec is None
+    assert payload is data
+    assert compression.decompress(codec, payload) == data
+
+
+def test_incompressible_data_is_stored_as_is() -> None:
+    # GIVEN
+    data = os.urandom(4096)
+
+    # WHEN
+    codec, payload = compression.compress(data)
+
+    # THEN
+    assert codec is None
+    assert payload == data
+
+
+def test_unknown_codec() -> None:
+    with pytest.raises(ValueError):
+        compression.decompress("lzma", b"")
+
+
+@requires_zstandard
+def test_zstd_without_zstandard() -> None:
+    # GIVEN
+    codec, payload = compression.compress(b"anime metadata " * 1000)
+
+    # WHEN / THEN
+    with mock.patch.object(compression, "zstandard", None):
+        with pytest.raises(RuntimeError):
+            compression.decompress(codec, payload)
@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+from typing import Iterator
+
+import pytest
+
+from anime_metadata import backends, constants
+from anime_metadata.typeshed import CacheEntry
+
+from .fake_providers import FakeTransport, PageProvider
+
+LAST_MODIFIED = "Sat, 06 Apr 2019 00:00:00 GMT"
+PAST_GRACE = constants.MAX_CACHE_LIFETIME + constants.CACHE_STALE_GRACE + timedelta(hours=1)
+
+
+@pytest.fixture(autouse=True)
+def memory_backend() -> Iterator[backends.MemoryBackend]:
+    backend = backends.MemoryBackend()
+    backends.set_default_backend(backend)
+    yield backend
+    backends.set_default_backend(None)
+
+
+def _cache_page(backend: backends.MemoryBackend, provider: PageProvider) -> datetime:
+    last_update = datetime.utcnow() - PAST_GRACE
+    key = provider.page_request("1").cache.key  # type:ignore
+    backend.put(key, CacheEntry(data=b"cached", last_update=last_update, etag='"v1"', last_modified=LAST_MODIFIED))
+    return last_update
+
+
+def test_validators_of_response_are_stored(memory_backend: backends.MemoryBackend) -> None:
+    # GIVEN
+    transport = FakeTransport(b"page", etag='"v1"', last_modified=LAST_MODIFIED)
+    provider = PageProvider(transport)
+
+    # WHEN
+    provider.fetch(provider.page_request("1"))
+
+    # THEN
+    assert "If-None-Match" not in transport.requests[0][1]
+    assert "If-Modified-Since" not in transport.requests[0][1]
+    entry = memory_backend.get(provider.page_request("1").cache.key)  # type:ignore
+    assert entry is not None
+    assert (entry.data, entry.etag, entry.last_modified) == (b"page", '"v1"', LAST_MODIFIED)
+
+
+def test_stored_validators_are_sent_back(memory_backend: backends.MemoryBackend) -> None:
+    # GIVEN
+    transport = FakeTransport(b"fresh", etag='"v2"')
+    provider = PageProvider(transport)
+    _cache_page(memory_backend, provider)
+
+    # WHEN
+    result = provider.fetch(provider.page_request("1"))
+
+    # THEN
+    assert result == b"fresh"
+    assert transport.requests[0][1]["If-None-Match"] == '"v1"'
+    assert transport.requests[0][1]["If-Modified-Since"] == LAST_MODIFIED
+    entry = memory_backend.get(provider.page_request("1").cache.key)  # type:ignore
+    assert entry is not None and (entry.data, entry.etag) == (b"fresh", '"v2"')
+
+
+def test_not_modified_refreshes_last_update_only(memory_backend: backends.MemoryBackend) -> None:
+    # GIVEN
+    provider = PageProvider(FakeTransport(b"", status_code=304))
+    last_update = _cache_page(memory_backend, provider)
+
+    # WHEN
+    result = provider.fetch(provider.page_request("1"))
+
+    # THEN
+    assert result == b"cached"
+    entry = memory_backend.get(provider.page_request("1").cache.key)  # type:ignore
+    assert entry is not None
+    assert (entry.data, entry.etag, entry.last_modified) == (b"cached", '"v1"', LAST_MODIFIED)
+    assert entry.last_update > last_update
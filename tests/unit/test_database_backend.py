@@ -0,0 +1,213 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import peewee
+import pytest
+
+from anime_metadata import backends, compression, constants, enums
+from anime_metadata.typeshed import CacheEntry
+
+
+class BaselineProviderCache(peewee.Model):
+    """
+    `providers_cache` as created before the HTTP validators, compression, show status and access time were added
+    """
+
+    id = peewee.CharField(max_length=10, index=True)
+    provider = peewee.CharField(max_length=20, index=True)
+    data_type = peewee.CharField(max_length=20, index=True)
+    last_update = peewee.DateTimeField(default=datetime.utcnow)
+    data = peewee.BlobField()
+
+    class Meta:
+        table_name = "providers_cache"
+        primary_key = peewee.CompositeKey("id", "provider", "data_type")
+
+
+def _create_baseline_database(path: Path) -> None:
+    database = peewee.SqliteDatabase(str(path))
+    with database.bind_ctx([BaselineProviderCache]):
+        database.create_tables([BaselineProviderCache])
+        BaselineProviderCache.create(id="1", provider="anidb", data_type="web,series", data=b"baseline data")
+    database.close()
+
+
+def _last_access(backend: backends.DatabaseBackend, _id: str) -> datetime:
+    return backend.model.select().where(backend.model.id == _id).get().last_access
+
+
+def test_baseline_schema_is_migrated(tmp_path: Path) -> None:
+    # GIVEN
+    _create_baseline_database(tmp_path / "cache.db")
+
+    # WHEN
+    backend = backends.SqliteBackend(tmp_path / "cache.db")
+
+    # THEN
+    entry = backend.get(("anidb", "web,series", "1"))
+    assert entry is not None
+    assert entry.data == b"baseline data"
+    assert (entry.etag, entry.last_modified, entry.show_status) == (None, None, None)
+    assert {column.name for column in backend.database.get_columns("providers_cache")} == {
+        "id",
+        "provider",
+        "data_type",
+        "last_update",
+        "last_access",
+        "data",
+        "etag",
+        "last_modified",
+        "codec",
+        "show_status",
+    }
+
+
+def test_migrated_database_is_writable(tmp_path: Path) -> None:
+    # GIVEN
+    _create_baseline_database(tmp_path / "cache.db")
+    backend = backends.SqliteBackend(tmp_path / "cache.db")
+
+    # WHEN
+    backend.set(("anidb", "web,series", "1"), b"new data " * 100, "etag", None, enums.ShowStatus.FINISHED)
+
+    # THEN
+    entry = backends.SqliteBackend(tmp_path / "cache.db").get(("anidb", "web,series", "1"))
+    assert entry is not None
+    assert entry.data == b"new data " * 100
+    assert entry.show_status is enums.ShowStatus.FINISHED
+
+
+def test_data_is_stored_compressed(tmp_path: Path) -> None:
+    # GIVEN
+    backend = backends.SqliteBackend(tmp_path / "cache.db")
+    data = b"anime metadata " * 1000
+
+    # WHEN
+    backend.set(("anidb", "web,series", "1"), data)
+
+    # THEN
+    row = backend.model.select().get()
+    assert row.codec is not None
+    assert len(row.data) < len(data)
+    assert compression.decompress(row.codec, bytes(row.data)) == data
+
+
+def test_bulk_reads_and_writes_are_batched(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # GIVEN
+    monkeypatch.setattr(constants, "CACHE_BATCH_SIZE", 2)
+    backend = backends.SqliteBackend(tmp_path / "cache.db")
+    now = datetime.utcnow()
+    items = {("anidb", "web,series", str(_id)): CacheEntry(data=str(_id).encode(), last_update=now) for _id in range(5)}
+
+    # WHEN
+    backend.set_many(items)
+
+    # THEN
+    result = backend.get_many([*items, ("anidb", "web,series", "5")])
+    assert {key: entry.data for key, entry in result.items()} == {key: entry.data for key, entry in items.items()}
+
+
+def test_set_many_upserts_and_keeps_show_status(tmp_path: Path) -> None:
+    # GIVEN
+    backend = backends.SqliteBackend(tmp_path / "cache.db")
+    backend.set(("anidb", "web,series", "1"), b"data", "etag", None, enums.ShowStatus.AIRING)
+    backend.set(("anidb", "web,series", "2"), b"data", None, None, enums.ShowStatus.AIRING)
+    now = datetime.utcnow()
+
+    # WHEN
+    backend.set_many(
+        {
+            ("anidb", "web,series", "1"): CacheEntry(data=b"new data", last_update=now),
+            ("anidb", "web,series", "2"): CacheEntry(
+                data=b"new data", last_update=now, show_status=enums.ShowStatus.FINISHED
+            ),
+        }
+    )
+
+    # THEN
+    first = backend.get(("anidb", "web,series", "1"))
+    second = backend.get(("anidb", "web,series", "2"))
+    assert first is not None and second is not None
+    assert (first.data, first.etag, first.show_status) == (b"new data", None, enums.ShowStatus.AIRING)
+    assert (second.data, second.show_status) == (b"new data", enums.ShowStatus.FINISHED)
+    assert backend.model.select().count() == 2
+
+
+def test_get_refreshes_last_access_once_per_resolution(tmp_path: Path) -> None:
+    # GIVEN
+    backend = backends.SqliteBackend(tmp_path / "cache.db")
+    backend.set(("anidb", "web,series", "1"), b"data")
+    backend.set(("anidb", "web,series", "2"), b"data")
+    old = datetime.utcnow() - constants.CACHE_ACCESS_RESOLUTION * 2
+    backend.model.update(last_access=old).execute()
+    backend.model.update(last_access=datetime.utcnow()).where(backend.model.id == "2").execute()
+    recent = _last_access(backend, "2")
+
+    # WHEN
+    backend.get_many([("anidb", "web,series", "1"), ("anidb", "web,series", "2")])
+
+    # THEN
+    assert _last_access(backend, "1") > old
+    assert _last_access(backend, "2") == recent
+
+
+def _set_rows(backend: backends.DatabaseBackend, count: int) -> None:
+    for _id in range(count):
+        # Below `CACHE_COMPRESSION_MIN_SIZE`, stored as is
+        backend.set(("anidb", "web,series", str(_id)), bytes(400))
+
+
+def test_evict_deletes_expired_entries(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # GIVEN
+    monkeypatch.setattr(constants, "CACHE_BATCH_SIZE", 1)
+    backend = backends.SqliteBackend(tmp_path / "cache.db")
+    now = datetime.utcnow()
+    _set_rows(backend, 4)
+    rows = {
+        "0": (now - timedelta(days=30), enums.ShowStatus.FINISHED.value),
+        "1": (now - timedelta(days=3), enums.ShowStatus.AIRING.value),
+        "2": (now - timedelta(days=3), enums.ShowStatus.AIRING.value),
+        "3": (now - constants.MAX_CACHE_LIFETIME - timedelta(days=2), None),
+    }
+    for _id, (last_update, show_status) in rows.items():
+        backend.model.update(last_update=last_update, show_status=show_status).where(backend.model.id == _id).execute()
+
+    # WHEN
+    evicted = backend.evict()
+
+    # THEN
+    assert evicted == 3
+    assert [row.id for row in backend.model.select()] == ["0"]
+
+
+def test_evict_deletes_least_recently_accessed_down_to_max_bytes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # GIVEN
+    monkeypatch.setattr(constants, "CACHE_BATCH_SIZE", 2)
+    backend = backends.SqliteBackend(tmp_path / "cache.db")
+    _set_rows(backend, 5)
+    for _id in range(5):
+        last_access = datetime.utcnow() - timedelta(hours=10 - _id)
+        backend.model.update(last_access=last_access).where(backend.model.id == str(_id)).execute()
+
+    # WHEN
+    evicted = backend.evict(max_bytes=1000)
+
+    # THEN
+    assert evicted == 3
+    assert sorted(row.id for row in backend.model.select()) == ["3", "4"]
+    assert sum(item.size for item in backend.usage()) == 800
+
+
+def test_vacuum(tmp_path: Path) -> None:
+    # GIVEN
+    backend = backends.SqliteBackend(tmp_path / "cache.db")
+    _set_rows(backend, 5)
+    backend.evict(max_bytes=0)
+
+    # WHEN
+    backend.vacuum()
+
+    # THEN
+    assert backend.usage() == []
@@ -0,0 +1,163 @@
+import datetime
+from decimal import Decimal
+import pickle
+from typing import Any, Iterator, Tuple, cast
+
+import pytest
+
+from anime_metadata import backends, dtos, enums, interfaces
+from anime_metadata.typeshed import AnimeId
+
+from .fake_providers import FakeProvider, series
+
+
+class Cache(interfaces.BaseCache):
+    provider_name = "fake"
+
+
+class CachedProvider(FakeProvider):
+    cache_class = Cache
+
+    def __init__(self, *args: Any, lang: str = "en", partial: bool = False, **kwargs: Any) -> None:
+        self.lang = lang
+        self.partial = partial
+        super().__init__(*args, **kwargs)
+
+    def _dto_cache_variant(self) -> Tuple[Any, ...]:
+        return (self.lang,)
+
+    def _get_series_by_id(self, anime_id: AnimeId) -> dtos.TvSeriesData:
+        if self.partial:
+            self._mark_partial()
+        return super()._get_series_by_id(anime_id)
+
+
+@pytest.fixture(autouse=True)
+def _memory_backend() -> Iterator[backends.MemoryBackend]:
+    backend = backends.MemoryBackend()
+    backends.set_default_backend(backend)
+    yield backend
+    backends.set_default_backend(None)
+
+
+def _full_series() -> dtos.TvSeriesData:
+    # `attr.converters.optional(set)` leaves the element type of converted fields unbound for mypy
+    return dtos.TvSeriesData(
+        provider=CachedProvider,
+        raw={"api": {"id": 1, "title": "Title"}, "web": b"<html></html>"},
+        dates=dtos.ShowDate(premiered="2019-04-06", ended="2019-06-29"),
+        genres={"Comedy"},
+        id=1,
+        images=dtos.ShowImage(base_url="https://example.com/images", folder="1.jpg"),
+        main_characters=cast(Any, {dtos.ShowCharacter(name="Yuiga Nariyuki", seiyuu="Itou Kentarou")}),
+        mpaa=enums.MPAA.PG_13,
+        plot="Plot",
+        rating=Decimal("7.5"),
+        source_material=enums.SourceMaterial.MANGA,
+        staff=dtos.ShowStaff(director=cast(Any, ["Director"])),
+        studios=cast(Any, {"Studio"}),
+        titles={enums.Language.ROMAJI: "Bokutachi wa Benkyou ga Dekinai", enums.Language.ENGLISH: "We Never Learn"},
+        episodes=[
+            dtos.ShowEpisode(
+                no=1,
+                type=enums.EpisodeType.SPECIAL,
+                id="1",
+                plot="Episode plot",
+                premiered="2019-04-06",
+                rating="8.1",
+                titles={enums.Language.ENGLISH: "Episode 1"},
+            )
+        ],
+    )
+
+
+def test_series_round_trip() -> None:
+    # GIVEN
+    data = _full_series()
+
+    # WHEN
+    result = dtos.loads_series(dtos.dumps_series(data))
+
+    # THEN
+    assert result == data
+    assert result.images is not None and result.images.folder == "https://example.com/images/1.jpg"
+    assert result.dates is not None and result.dates.premiered == datetime.date(2019, 4, 6)
+    assert result.episodes is not None and result.episodes[0].rating == Decimal("8.1")
+
+
+def test_series_with_unknown_and_missing_optional_fields_loads() -> None:
+    # GIVEN
+    raw_data = b'{"_provider":null,"id":"1","titles":{"ROMAJI":"Title 1"},"removed_field":1}'
+
+    # WHEN
+    result = dtos.loads_series(raw_data)
+
+    # THEN
+    assert result == series("1")
+
+
+@pytest.mark.parametrize(
+    "raw_data",
+    [
+        pickle.dumps(series("1")),
+        b'{"_provider":null,"id":"1"}',
+        b'{"_provider":null,"id":"1","titles":{"KLINGON":"Title"}}',
+    ],
+)
+def test_incompatible_series_raises(raw_data: bytes) -> None:
+    with pytest.raises(ValueError):
+        dtos.loads_series(raw_data)
+
+
+def test_cached_series_keeps_raw_pages() -> None:
+    # GIVEN
+    provider = CachedProvider(result=_full_series())
+    cold = provider.get_series(1)
+
+    # WHEN
+    warm = provider.get_series(1)
+
+    # THEN
+    assert provider.calls == [1]
+    assert warm == cold
+    assert warm._raw == {"api": {"id": 1, "title": "Title"}, "web": b"<html></html>"}
+
+
+def test_instance_options_are_part_of_cache_key() -> None:
+    # GIVEN
+    CachedProvider(result=series("1", plot="English plot")).get_series("1")
+    provider = CachedProvider(result=series("1", plot="Polish plot"), lang="pl")
+
+    # WHEN
+    result = provider.get_series("1")
+
+    # THEN
+    assert provider.calls == ["1"]
+    assert result.plot == "Polish plot"
+    assert CachedProvider(lang="pl").get_series("1").plot == "Polish plot"
+
+
+def test_partial_series_is_not_cached() -> None:
+    # GIVEN
+    provider = CachedProvider(result=series("1"), partial=True)
+    provider.get_series("1")
+
+    # WHEN
+    provider.get_series("1")
+
+    # THEN
+    assert provider.calls == ["1", "1"]
+
+
+def test_incompatible_cached_series_is_parsed_again(_memory_backend: backends.MemoryBackend) -> None:
+    # GIVEN
+    provider = CachedProvider(result=series("1"))
+    provider._dto_cache("1").set(pickle.dumps(series("1")))
+
+    # WHEN
+    result = provider.get_series("1")
+
+    # THEN
+    assert result == series("1")
+    assert provider.calls == ["1"]
+    assert dtos.loads_series(_memory_backend.get(provider._dto_cache("1").key).data) == series("1")  # type:ignore
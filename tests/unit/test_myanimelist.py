@@ -0,0 +1,123 @@
+import asyncio
+import threading
+from typing import Any, Iterator, List
+
+import pytest
+
+from anime_metadata import backends, interfaces
+from anime_metadata.providers import MALProvider
+from anime_metadata.providers.myanimelist import _get_executor
+from anime_metadata.typeshed import RawHtml
+
+EPISODES_PAGE = b"""<table class="episode_list ascend">
+<tr class="episode-list-data">
+<td class="episode-number">1</td>
+<td class="episode-title"><a>First</a><span>Daiichi</span></td>
+<td class="episode-aired">Apr 6, 2019</td>
+</tr>
+<tr class="episode-list-data">
+<td class="episode-number">2</td>
+<td class="episode-title"><a>Second</a><span>Daini</span></td>
+<td class="episode-aired">Apr 13, 2019</td>
+</tr>
+</table>"""
+
+
+class StubMALProvider(MALProvider):
+    """
+    Serves generated pages instead of downloading them, the plot of episode 2 waits until `unblocked` is set
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.urls: List[str] = []
+        self.unblocked = threading.Event()
+        super().__init__(api_key="", **kwargs)
+
+    def fetch(self, request: interfaces.ProviderRequest) -> RawHtml:
+        url = self._record(request)
+        if url.endswith("/episode/2"):
+            assert self.unblocked.wait(5)
+        return _page(url)
+
+    async def afetch(self, request: interfaces.ProviderRequest) -> RawHtml:
+        url = self._record(request)
+        while url.endswith("/episode/2") and not self.unblocked.is_set():
+            await asyncio.sleep(0.01)
+        return _page(url)
+
+    def _record(self, request: interfaces.ProviderRequest) -> str:
+        url: str = request.url.tostr()
+        self.urls.append(url)
+        return url
+
+
+def _page(url: str) -> RawHtml:
+    if url.endswith("/episode"):
+        return EPISODES_PAGE
+    return f"<div><h2>Synopsis</h2>Plot {url.rsplit('/', 1)[-1]}</div>".encode()
+
+
+@pytest.fixture(autouse=True)
+def memory_backend() -> Iterator[backends.MemoryBackend]:
+    backend = backends.MemoryBackend()
+    backends.set_default_backend(backend)
+    yield backend
+    backends.set_default_backend(None)
+
+
+def test_instances_share_worker_pool() -> None:
+    # GIVEN
+    first = MALProvider(api_key="")
+    second = MALProvider(api_key="")
+    other = MALProvider(api_key="", max_workers=2)
+
+    # WHEN
+    results = [provider._submit(lambda: 1) for provider in (first, second, other)]
+
+    # THEN
+    assert [future.result() for future in results] == [1, 1, 1]
+    assert _get_executor(first.max_workers) is _get_executor(second.max_workers)
+    assert _get_executor(other.max_workers) is not _get_executor(first.max_workers)
+    assert _get_executor(other.max_workers)._max_workers == 2
+
+
+def test_episode_plots_budget_caps_plot_fetches() -> None:
+    # GIVEN
+    provider = StubMALProvider(episode_plots_budget=0.1)
+
+    # WHEN
+    try:
+        episodes = provider._get_anime_episodes_from_web("1")
+    finally:
+        provider.unblocked.set()
+
+    # THEN
+    assert [episode.get("plot") for episode in episodes] == ["Plot 1", None]
+
+
+def test_async_episode_plots_budget_caps_plot_fetches() -> None:
+    # GIVEN
+    provider = StubMALProvider(episode_plots_budget=0.1)
+
+    # WHEN
+    try:
+        episodes = asyncio.run(provider._aget_anime_episodes_from_web("1"))
+    finally:
+        provider.unblocked.set()
+
+    # THEN
+    assert [episode.get("plot") for episode in episodes] == ["Plot 1", None]
+
+
+def test_episode_plots_are_not_fetched_when_disabled() -> None:
+    # GIVEN
+    provider = StubMALProvider(episode_plots=False)
+
+    # WHEN
+    episodes = provider._get_anime_episodes_from_web("1")
+    async_episodes = asyncio.run(provider._aget_anime_episodes_from_web("1"))
+
+    # THEN
+    assert [episode.get("plot") for episode in episodes] == [None, None]
+    assert episodes == async_episodes
+    assert provider.urls == ["https://myanimelist.net/anime/1/_/episode"] * 2
@@ -0,0 +1,107 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Iterator
+
+import pytest
+
+from anime_metadata import backends, constants, interfaces, utils
+from anime_metadata.exceptions import ProviderNoResultError
+from anime_metadata.typeshed import CacheEntry
+
+from .fake_providers import FakeProvider, series
+
+
+class Cache(interfaces.BaseCache):
+    provider_name = "fake"
+
+
+class CachedProvider(FakeProvider):
+    cache_class = Cache
+
+
+@pytest.fixture(autouse=True)
+def memory_backend() -> Iterator[backends.MemoryBackend]:
+    backend = backends.MemoryBackend()
+    backends.set_default_backend(backend)
+    yield backend
+    backends.set_default_backend(None)
+
+
+def test_title_without_match_is_not_searched_again() -> None:
+    # GIVEN
+    provider = CachedProvider(error=ProviderNoResultError())
+    with pytest.raises(ProviderNoResultError):
+        provider.search_series("Bokutachi wa Benkyou ga Dekinai", year=2019)
+
+    # WHEN
+    with pytest.raises(ProviderNoResultError):
+        provider.search_series("  bokutachi wa  BENKYOU ga dekinai ", year=2019)
+
+    # THEN
+    assert provider.calls == ["Bokutachi wa Benkyou ga Dekinai"]
+
+
+def test_title_without_match_is_searched_in_other_year() -> None:
+    # GIVEN
+    provider = CachedProvider(error=ProviderNoResultError())
+    with pytest.raises(ProviderNoResultError):
+        provider.search_series("Title", year=2019)
+
+    # WHEN
+    with pytest.raises(ProviderNoResultError):
+        provider.search_series("Title", year=2020)
+
+    # THEN
+    assert provider.calls == ["Title", "Title"]
+
+
+def test_other_titles_are_searched_after_known_no_result() -> None:
+    # GIVEN
+    provider = CachedProvider(error=ProviderNoResultError())
+    with pytest.raises(ProviderNoResultError):
+        provider.search_series("Unknown")
+    provider.error = None
+    provider.result = series("1")
+
+    # WHEN
+    result = provider.search_series("Unknown", "Title 1")
+
+    # THEN
+    assert result == series("1")
+    assert provider.calls == ["Unknown", "Title 1"]
+
+
+def test_expired_no_result_is_searched_again(memory_backend: backends.MemoryBackend) -> None:
+    # GIVEN
+    provider = CachedProvider(result=series("1"))
+    key = Cache("search,noresult", utils.search_cache_id("Title 1", None)).key
+    last_update = datetime.utcnow() - constants.CACHE_NO_RESULT_TTL - timedelta(minutes=1)
+    memory_backend.put(key, CacheEntry(data=b"", last_update=last_update))
+
+    # WHEN
+    result = provider.search_series("Title 1")
+
+    # THEN
+    assert result == series("1")
+    assert provider.calls == ["Title 1"]
+
+
+def test_async_title_without_match_is_not_searched_again() -> None:
+    # GIVEN
+    provider = CachedProvider(error=ProviderNoResultError())
+
+    async def search_twice() -> None:
+        for _ in range(2):
+            with pytest.raises(ProviderNoResultError):
+                await provider.asearch_series("Title")
+
+    # WHEN
+    asyncio.run(search_twice())
+
+    # THEN
+    assert provider.calls == ["Title"]
+
+
+def test_search_cache_id_fits_id_column() -> None:
+    assert len(utils.search_cache_id("Title " * 100, 2019, "en-US")) <= 10
+    assert utils.search_cache_id("Title", 2019) != utils.search_cache_id("Title", 2020)
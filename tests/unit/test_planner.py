@@ -0,0 +1,125 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from anime_metadata import enums
+from anime_metadata.exceptions import ProviderNoResultError, ValidationError
+from anime_metadata.planner import LatencyTracker, Planner
+
+from .fake_providers import fake_provider_class, series
+
+Fast = fake_provider_class("Fast", provides=frozenset({"plot", "titles"}), expected_latency=0.5)
+Slow = fake_provider_class("Slow", expected_latency=5.0)
+Images = fake_provider_class("Images", provides=frozenset({"images"}), expected_latency=0.1)
+
+
+def test_plan_orders_providers_by_latency_and_skips_unrelated() -> None:
+    # GIVEN
+    planner = Planner([Slow(), Fast(), Images()])
+
+    # WHEN
+    plan = planner.plan(["plot"])
+
+    # THEN
+    assert plan == ["Fast", "Slow"]
+
+
+def test_plan_follows_measured_latency() -> None:
+    # GIVEN
+    latency_tracker = LatencyTracker()
+    latency_tracker.observe("Slow", 0.1)
+    planner = Planner([Slow(), Fast()], latency_tracker=latency_tracker)
+
+    # WHEN
+    plan = planner.plan(["plot"])
+
+    # THEN
+    assert plan == ["Slow", "Fast"]
+
+
+def test_stops_once_requested_fields_are_filled() -> None:
+    # GIVEN
+    fast = Fast(series("1", plot="Fast plot"))
+    slow = Slow(series("2", plot="Slow plot", mpaa=enums.MPAA.PG_13))
+    planner = Planner([slow, fast])
+
+    # WHEN
+    result = planner.search_series("Title", fields=["plot"])
+
+    # THEN
+    assert result.plot == "Fast plot"
+    assert slow.calls == []
+
+
+def test_continues_with_next_provider_for_missing_fields() -> None:
+    # GIVEN
+    fast = Fast(series("1", plot="Fast plot"))
+    slow = Slow(series("2", plot="Slow plot", mpaa=enums.MPAA.PG_13))
+    planner = Planner([fast, slow])
+
+    # WHEN
+    result = planner.get_series({"Fast": "1", "Slow": "2"}, fields=["plot", "mpaa"])
+
+    # THEN
+    assert result.plot == "Fast plot"
+    assert result.mpaa == enums.MPAA.PG_13
+    assert fast.calls == ["1"]
+    assert slow.calls == ["2"]
+
+
+@pytest.mark.parametrize("error", [ProviderNoResultError(), RuntimeError("parsing failed")])
+def test_falls_through_to_next_provider_on_error(error: Exception) -> None:
+    # GIVEN
+    slow = Slow(series("2", plot="Slow plot"))
+    planner = Planner([slow, Fast(error=error)])
+
+    # WHEN
+    result = planner.search_series("Title", fields=["plot"])
+
+    # THEN
+    assert result.plot == "Slow plot"
+    assert slow.calls == ["Title"]
+
+
+def test_async_falls_through_to_next_provider_on_error() -> None:
+    # GIVEN
+    planner = Planner([Slow(series("2", plot="Slow plot")), Fast(error=RuntimeError("parsing failed"))])
+
+    # WHEN
+    result = asyncio.run(planner.asearch_series("Title", fields=["plot"]))
+
+    # THEN
+    assert result.plot == "Slow plot"
+
+
+def test_no_result_when_every_provider_fails() -> None:
+    # GIVEN
+    planner = Planner([Slow(error=RuntimeError("down")), Fast(error=ProviderNoResultError())])
+
+    # WHEN / THEN
+    with pytest.raises(ProviderNoResultError):
+        planner.search_series("Title", fields=["plot"])
+
+
+@pytest.mark.parametrize("fields", [[], ["unknown"]])
+def test_invalid_fields(fields: List[str]) -> None:
+    # GIVEN
+    planner = Planner([Images(series("1"))])
+
+    # WHEN / THEN
+    with pytest.raises(ValidationError):
+        planner.get_series({"Images": "1"}, fields=fields)
+
+
+def test_latency_tracker_moving_average() -> None:
+    # GIVEN
+    latency_tracker = LatencyTracker(smoothing=0.5)
+
+    # WHEN
+    latency_tracker.observe("Provider", 1.0)
+    latency_tracker.observe("Provider", 3.0)
+
+    # THEN
+    assert latency_tracker.estimate("Provider", 10.0) == 2.0
+    assert latency_tracker.estimate("Other", 10.0) == 10.0
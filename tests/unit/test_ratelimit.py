@@ -0,0 +1,136 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from anime_metadata.ratelimit import RateLimit, RequestScheduler, TokenBucket, _parse_retry_after
+
+
+def test_requests_are_spaced_by_rate() -> None:
+    # GIVEN
+    bucket = TokenBucket(RateLimit(requests_per_second=10))
+
+    # WHEN
+    delays = [bucket.reserve() for _ in range(3)]
+
+    # THEN
+    assert delays[0] == 0
+    assert delays[1] == pytest.approx(0.1, abs=0.01)
+    assert delays[2] == pytest.approx(0.2, abs=0.01)
+
+
+def test_burst_is_let_through_at_once() -> None:
+    # GIVEN
+    bucket = TokenBucket(RateLimit(requests_per_second=10, burst=3))
+
+    # WHEN
+    delays = [bucket.reserve() for _ in range(4)]
+
+    # THEN
+    assert delays[:3] == [0, 0, 0]
+    assert delays[3] == pytest.approx(0.1, abs=0.01)
+
+
+def test_without_rate_requests_are_not_delayed() -> None:
+    # GIVEN
+    bucket = TokenBucket(RateLimit())
+
+    # WHEN
+    delays = [bucket.reserve() for _ in range(5)]
+
+    # THEN
+    assert delays == [0, 0, 0, 0, 0]
+
+
+def test_throttle_halves_rate_and_waits_for_retry_after() -> None:
+    # GIVEN
+    bucket = TokenBucket(RateLimit(requests_per_second=10))
+
+    # WHEN
+    bucket.on_throttle(2.0)
+
+    # THEN
+    assert bucket.requests_per_second == 5
+    assert bucket.throttled == 1
+    assert bucket.reserve() == pytest.approx(2.0, abs=0.01)
+
+
+def test_rate_recovers_on_success_up_to_limit() -> None:
+    # GIVEN
+    bucket = TokenBucket(RateLimit(requests_per_second=10))
+    bucket.on_throttle(0)
+
+    # WHEN
+    bucket.on_success()
+    recovered = bucket.requests_per_second
+    for _ in range(10):
+        bucket.on_success()
+
+    # THEN
+    assert recovered == 6
+    assert bucket.requests_per_second == 10
+
+
+def test_scheduler_keys_buckets_on_host_and_rate_limit() -> None:
+    # GIVEN
+    scheduler = RequestScheduler()
+    slow = RateLimit(requests_per_second=1)
+    fast = RateLimit(requests_per_second=10)
+
+    # WHEN
+    slow_bucket = scheduler.bucket("example.com", slow)
+    fast_bucket = scheduler.bucket("example.com", fast)
+
+    # THEN
+    assert slow_bucket is not fast_bucket
+    assert slow_bucket.requests_per_second == 1
+    assert fast_bucket.requests_per_second == 10
+    assert scheduler.bucket("example.com", RateLimit(requests_per_second=1)) is slow_bucket
+    assert scheduler.bucket("example.com", None) is scheduler.bucket("example.com", RateLimit())
+
+
+def test_scheduler_feedback() -> None:
+    # GIVEN
+    scheduler = RequestScheduler()
+    rate_limit = RateLimit(requests_per_second=10)
+    scheduler.acquire("example.com", rate_limit)
+
+    # WHEN
+    throttled = scheduler.feedback("example.com", rate_limit, 429, "1")
+    succeeded = scheduler.feedback("example.com", rate_limit, 200, None)
+
+    # THEN
+    assert throttled is True
+    assert succeeded is False
+    metrics = scheduler.metrics()[("example.com", rate_limit)]
+    assert metrics.requests == 1
+    assert metrics.throttled == 1
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, None),
+        ("", None),
+        ("120", 120.0),
+        (" 5 ", 5.0),
+        ("not a date", None),
+    ],
+)
+def test_parse_retry_after(value: str, expected: float) -> None:
+    assert _parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date() -> None:
+    # GIVEN
+    value = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+
+    # WHEN
+    result = _parse_retry_after(value)
+
+    # THEN
+    assert result == pytest.approx(30, abs=2)
+
+
+def test_parse_retry_after_http_date_in_past() -> None:
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -0,0 +1,264 @@
+import asyncio
+from typing import Callable, List
+
+import httpx
+import pytest
+import requests
+
+from anime_metadata.exceptions import ProviderUnavailableError
+from anime_metadata.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    RetryPolicy,
+    acall_with_retries,
+    call_with_retries,
+    is_transient_error,
+)
+
+NO_DELAY = RetryPolicy(retries=2, backoff=0)
+
+
+def _requests_error(status_code: int) -> requests.HTTPError:
+    response = requests.Response()
+    response.status_code = status_code
+    return requests.HTTPError(response=response)
+
+
+def _httpx_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "http://example.com")
+    return httpx.HTTPStatusError("", request=request, response=httpx.Response(status_code, request=request))
+
+
+def _failing(calls: List[int], error: Exception) -> Callable[[], int]:
+    def func() -> int:
+        calls.append(1)
+        raise error
+
+    return func
+
+
+def _open(circuit_breaker: CircuitBreaker) -> None:
+    for _ in range(circuit_breaker.failure_threshold):
+        circuit_breaker.before_call()
+        circuit_breaker.on_failure()
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (_requests_error(500), True),
+        (_requests_error(502), True),
+        (_requests_error(503), False),
+        (_requests_error(429), False),
+        (_requests_error(404), False),
+        (_httpx_error(504), True),
+        (_httpx_error(503), False),
+        (requests.ConnectionError(), True),
+        (requests.Timeout(), True),
+        (httpx.ConnectTimeout(""), True),
+        (ValueError(), False),
+    ],
+)
+def test_is_transient_error(error: Exception, expected: bool) -> None:
+    assert is_transient_error(error) is expected
+
+
+def test_circuit_opens_after_consecutive_failures() -> None:
+    # GIVEN
+    circuit_breaker = CircuitBreaker("test", failure_threshold=3, recovery_timeout=60)
+
+    # WHEN
+    _open(circuit_breaker)
+
+    # THEN
+    assert circuit_breaker.state is CircuitState.OPEN
+    with pytest.raises(ProviderUnavailableError):
+        circuit_breaker.before_call()
+
+
+def test_success_resets_failures() -> None:
+    # GIVEN
+    circuit_breaker = CircuitBreaker("test", failure_threshold=2)
+    circuit_breaker.on_failure()
+
+    # WHEN
+    circuit_breaker.on_success()
+    circuit_breaker.on_failure()
+
+    # THEN
+    assert circuit_breaker.state is CircuitState.CLOSED
+
+
+def test_half_open_lets_single_probe_through() -> None:
+    # GIVEN
+    circuit_breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0)
+    _open(circuit_breaker)
+
+    # WHEN
+    probe = circuit_breaker.before_call()
+
+    # THEN
+    assert probe is True
+    assert circuit_breaker.state is CircuitState.HALF_OPEN
+    with pytest.raises(ProviderUnavailableError):
+        circuit_breaker.before_call()
+
+
+@pytest.mark.parametrize(
+    "outcome, expected",
+    [("on_success", CircuitState.CLOSED), ("on_failure", CircuitState.OPEN)],
+)
+def test_probe_outcome(outcome: str, expected: CircuitState) -> None:
+    # GIVEN
+    circuit_breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0)
+    _open(circuit_breaker)
+    circuit_breaker.before_call()
+
+    # WHEN
+    getattr(circuit_breaker, outcome)()
+
+    # THEN
+    assert circuit_breaker.state is expected
+
+
+def test_interrupted_probe_is_released() -> None:
+    # GIVEN
+    circuit_breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0)
+    _open(circuit_breaker)
+
+    # WHEN
+    with pytest.raises(KeyboardInterrupt):
+        with circuit_breaker.guard():
+            raise KeyboardInterrupt
+
+    # THEN
+    assert circuit_breaker.state is CircuitState.OPEN
+    assert circuit_breaker.before_call() is True
+
+
+def test_interrupted_call_does_not_release_other_probe() -> None:
+    # GIVEN
+    circuit_breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0)
+
+    # WHEN
+    with pytest.raises(KeyboardInterrupt):
+        with circuit_breaker.guard():
+            _open(circuit_breaker)
+            circuit_breaker.before_call()  # probe of another caller
+            raise KeyboardInterrupt
+
+    # THEN
+    assert circuit_breaker.state is CircuitState.HALF_OPEN
+
+
+def test_cancelled_async_probe_is_released() -> None:
+    # GIVEN
+    circuit_breaker = CircuitBreaker("test", failure_threshold=1, recovery_timeout=0)
+    _open(circuit_breaker)
+
+    async def hang() -> int:
+        await asyncio.sleep(10)
+        return 1
+
+    async def cancel_probe() -> None:
+        task = asyncio.ensure_future(acall_with_retries(hang, NO_DELAY, circuit_breaker))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    # WHEN
+    asyncio.run(cancel_probe())
+
+    # THEN
+    assert circuit_breaker.state is CircuitState.OPEN
+    assert circuit_breaker.before_call() is True
+
+
+def test_transient_errors_are_retried_within_budget() -> None:
+    # GIVEN
+    calls: List[int] = []
+    circuit_breaker = CircuitBreaker("test", failure_threshold=10)
+
+    # WHEN
+    with pytest.raises(requests.ConnectionError):
+        call_with_retries(_failing(calls, requests.ConnectionError()), NO_DELAY, circuit_breaker)
+
+    # THEN
+    assert len(calls) == 3
+    assert circuit_breaker.failures == 3
+
+
+@pytest.mark.parametrize("error", [_requests_error(503), _requests_error(404), ValueError()])
+def test_other_errors_are_not_retried(error: Exception) -> None:
+    # GIVEN
+    calls: List[int] = []
+    circuit_breaker = CircuitBreaker("test")
+
+    # WHEN
+    with pytest.raises(type(error)):
+        call_with_retries(_failing(calls, error), NO_DELAY, circuit_breaker)
+
+    # THEN
+    assert len(calls) == 1
+    assert circuit_breaker.state is CircuitState.CLOSED
+
+
+def test_retries_stop_when_circuit_opens() -> None:
+    # GIVEN
+    calls: List[int] = []
+    circuit_breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=60)
+
+    # WHEN
+    with pytest.raises(ProviderUnavailableError):
+        call_with_retries(_failing(calls, requests.Timeout()), RetryPolicy(retries=5, backoff=0), circuit_breaker)
+
+    # THEN
+    assert len(calls) == 2
+
+
+def test_retry_succeeds() -> None:
+    # GIVEN
+    attempts = iter([requests.ConnectionError(), None])
+    circuit_breaker = CircuitBreaker("test")
+
+    def func() -> int:
+        error = next(attempts)
+        if error is not None:
+            raise error
+        return 42
+
+    # WHEN
+    result = call_with_retries(func, NO_DELAY, circuit_breaker)
+
+    # THEN
+    assert result == 42
+    assert circuit_breaker.failures == 0
+
+
+def test_async_transient_errors_are_retried_within_budget() -> None:
+    # GIVEN
+    calls: List[int] = []
+    circuit_breaker = CircuitBreaker("test", failure_threshold=10)
+
+    async def func() -> int:
+        calls.append(1)
+        raise _httpx_error(500)
+
+    # WHEN
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(acall_with_retries(func, NO_DELAY, circuit_breaker))
+
+    # THEN
+    assert len(calls) == 3
+
+
+def test_retry_delay_is_bounded() -> None:
+    # GIVEN
+    policy = RetryPolicy(backoff=1, max_backoff=3)
+
+    # WHEN
+    delays = [policy.delay(attempt) for attempt in range(10) for _ in range(10)]
+
+    # THEN
+    assert all(0 <= delay <= 3 for delay in delays)
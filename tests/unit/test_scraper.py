@@ -0,0 +1,72 @@
+from typing import List
+
+from lxml.html import HtmlElement
+import pytest
+
+from anime_metadata import interfaces, utils
+
+
+class Scraper(interfaces.BaseScraper):
+    def __init__(self, first_page: bytes, second_page: bytes) -> None:
+        self.first_page = first_page
+        self.second_page = second_page
+        super().__init__()
+
+
+@pytest.fixture
+def loaded_pages(monkeypatch: pytest.MonkeyPatch) -> List[bytes]:
+    loaded: List[bytes] = []
+    load_html = utils.load_html
+
+    def recording_load_html(raw_data: bytes) -> HtmlElement:
+        loaded.append(raw_data)
+        return load_html(raw_data)
+
+    monkeypatch.setattr(utils, "load_html", recording_load_html)
+    return loaded
+
+
+def test_page_is_parsed_once(loaded_pages: List[bytes]) -> None:
+    # GIVEN
+    scraper = Scraper(b"<p>First</p>", b"<p>Second</p>")
+
+    # WHEN
+    first = scraper._load_page("first_page")
+    again = scraper._load_page("first_page")
+
+    # THEN
+    assert again is first
+    assert loaded_pages == [b"<p>First</p>"]
+
+
+def test_pages_are_parsed_separately(loaded_pages: List[bytes]) -> None:
+    # GIVEN
+    scraper = Scraper(b"<p>First</p>", b"<p>Second</p>")
+
+    # WHEN
+    first = scraper._load_page("first_page")
+    second = scraper._load_page("second_page")
+
+    # THEN
+    assert (first.text_content(), second.text_content()) == ("First", "Second")
+    assert scraper._load_page("first_page") is first
+    assert scraper._load_page("second_page") is second
+    assert loaded_pages == [b"<p>First</p>", b"<p>Second</p>"]
+
+
+def test_other_instances_parse_their_own_pages(loaded_pages: List[bytes]) -> None:
+    # GIVEN
+    first = Scraper(b"<p>First</p>", b"")
+    other = Scraper(b"<p>Other</p>", b"")
+
+    # WHEN
+    pages = [scraper._load_page("first_page").text_content() for scraper in (first, other)]
+
+    # THEN
+    assert pages == ["First", "Other"]
+    assert loaded_pages == [b"<p>First</p>", b"<p>Other</p>"]
+
+
+def test_missing_page_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        Scraper(b"<p>First</p>", b"")._load_page("second_page")
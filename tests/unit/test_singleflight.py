@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+import pytest
+
+from anime_metadata.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_calls_share_one_result() -> None:
+    # GIVEN
+    single_flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls: List[int] = []
+
+    def func() -> int:
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 42
+
+    results: List[int] = []
+    leader = threading.Thread(target=lambda: results.append(single_flight.do("key", func)))
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=lambda: results.append(single_flight.do("key", func))) for _ in range(3)]
+
+    # WHEN
+    for follower in followers:
+        follower.start()
+    time.sleep(0.1)  # let the followers reach the call in flight
+    release.set()
+    for thread in (leader, *followers):
+        thread.join(5)
+
+    # THEN
+    assert results == [42, 42, 42, 42]
+    assert len(calls) == 1
+
+
+def test_error_is_shared_and_key_released() -> None:
+    # GIVEN
+    single_flight = SingleFlight()
+
+    def fail() -> int:
+        raise ValueError("boom")
+
+    # WHEN
+    with pytest.raises(ValueError):
+        single_flight.do("key", fail)
+
+    # THEN
+    assert single_flight.do("key", lambda: 1) == 1
+
+
+def test_async_concurrent_calls_share_one_result() -> None:
+    # GIVEN
+    single_flight = AsyncSingleFlight()
+    calls: List[int] = []
+
+    async def func() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def run() -> List[int]:
+        return list(await asyncio.gather(*(single_flight.do("key", func) for _ in range(4))))
+
+    # WHEN
+    results = asyncio.run(run())
+
+    # THEN
+    assert results == [42, 42, 42, 42]
+    assert len(calls) == 1
+
+
+def test_async_cancelled_waiter_does_not_cancel_call() -> None:
+    # GIVEN
+    single_flight = AsyncSingleFlight()
+
+    async def func() -> int:
+        await asyncio.sleep(0.01)
+        return 42
+
+    async def run() -> int:
+        waiter = asyncio.ensure_future(single_flight.do("key", func))
+        other = asyncio.ensure_future(single_flight.do("key", func))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        return await other
+
+    # WHEN
+    result = asyncio.run(run())
+
+    # THEN
+    assert result == 42
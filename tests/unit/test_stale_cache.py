@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+import time
+from typing import Iterator
+
+import pytest
+
+from anime_metadata import backends, constants
+from anime_metadata.interfaces import provider as provider_module
+from anime_metadata.typeshed import CacheEntry
+
+from .fake_providers import FakeTransport, PageProvider
+
+EXPIRED = constants.MAX_CACHE_LIFETIME + timedelta(hours=1)
+PAST_GRACE = constants.MAX_CACHE_LIFETIME + constants.CACHE_STALE_GRACE + timedelta(hours=1)
+
+
+@pytest.fixture(autouse=True)
+def memory_backend() -> Iterator[backends.MemoryBackend]:
+    backend = backends.MemoryBackend()
+    backends.set_default_backend(backend)
+    yield backend
+    backends.set_default_backend(None)
+
+
+def _cache_page(backend: backends.MemoryBackend, provider: PageProvider, age: timedelta) -> None:
+    key = provider.page_request("1").cache.key  # type:ignore
+    backend.put(key, CacheEntry(data=b"cached", last_update=datetime.utcnow() - age, etag='"v1"'))
+
+
+def _wait_for_refreshes() -> None:
+    deadline = time.monotonic() + 5
+    while provider_module._refreshing:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_expired_page_is_served_and_refreshed_in_background(memory_backend: backends.MemoryBackend) -> None:
+    # GIVEN
+    transport = FakeTransport(b"fresh", etag='"v2"')
+    transport.unblocked.clear()
+    provider = PageProvider(transport)
+    _cache_page(memory_backend, provider, EXPIRED)
+
+    # WHEN
+    first = provider.fetch(provider.page_request("1"))
+    second = provider.fetch(provider.page_request("1"))
+    transport.unblocked.set()
+    _wait_for_refreshes()
+
+    # THEN
+    assert first == second == b"cached"
+    assert len(transport.requests) == 1
+    assert transport.requests[0][1]["If-None-Match"] == '"v1"'
+    assert provider.fetch(provider.page_request("1")) == b"fresh"
+
+
+def test_page_past_grace_is_revalidated_inline(memory_backend: backends.MemoryBackend) -> None:
+    # GIVEN
+    provider = PageProvider(FakeTransport(b"fresh"))
+    _cache_page(memory_backend, provider, PAST_GRACE)
+
+    # WHEN
+    result = provider.fetch(provider.page_request("1"))
+
+    # THEN
+    assert result == b"fresh"
+    assert not provider_module._refreshing
+
+
+def test_not_modified_page_is_touched(memory_backend: backends.MemoryBackend) -> None:
+    # GIVEN
+    provider = PageProvider(FakeTransport(b"", status_code=304))
+    _cache_page(memory_backend, provider, PAST_GRACE)
+
+    # WHEN
+    result = provider.fetch(provider.page_request("1"))
+
+    # THEN
+    assert result == b"cached"
+    entry = memory_backend.get(provider.page_request("1").cache.key)  # type:ignore
+    assert entry is not None and entry.last_update > datetime.utcnow() - timedelta(minutes=1)
+
+
+def test_series_parsed_from_stale_page_is_not_cached(memory_backend: backends.MemoryBackend) -> None:
+    # GIVEN
+    transport = FakeTransport(b"fresh")
+    provider = PageProvider(transport)
+    _cache_page(memory_backend, provider, EXPIRED)
+
+    # WHEN
+    stale = provider.get_series("1")
+    _wait_for_refreshes()
+    fresh = provider.get_series("1")
+
+    # THEN
+    assert (stale.plot, fresh.plot) == ("cached", "fresh")
+    assert memory_backend.get(provider._dto_cache("1").key) is not None
@@ -0,0 +1,102 @@
+from datetime import datetime, timedelta
+from typing import Tuple
+
+from anime_metadata import backends, enums, ttl
+from anime_metadata.typeshed import CacheEntry
+
+KEY = ("provider", "web,series", "1")
+POLICY = ttl.TtlPolicy(rules=(), default=timedelta(days=1))
+
+
+def _tiered() -> Tuple[backends.TieredBackend, backends.MemoryBackend]:
+    shared = backends.MemoryBackend()
+    return backends.TieredBackend(shared, backends.MemoryBackend(), POLICY), shared
+
+
+def test_reads_are_served_from_front_tier() -> None:
+    # GIVEN
+    backend, shared = _tiered()
+    shared.set(KEY, b"data")
+
+    # WHEN
+    first = backend.get(KEY)
+    second = backend.get(KEY)
+
+    # THEN
+    assert first is not None and second is not None
+    assert first.data == second.data == b"data"
+    assert backend.stats().hits == 1
+    assert shared.stats().hits == 1
+
+
+def test_expired_entries_are_not_kept_in_front_tier() -> None:
+    # GIVEN
+    backend, shared = _tiered()
+    shared.put(KEY, CacheEntry(data=b"data", last_update=datetime.utcnow() - timedelta(days=2)))
+
+    # WHEN
+    entry = backend.get(KEY)
+
+    # THEN
+    assert entry is not None
+    assert backend.front.stats().entries == 0
+
+
+def test_front_entries_expire_with_policy() -> None:
+    # GIVEN
+    backend, shared = _tiered()
+    backend.front.put(KEY, CacheEntry(data=b"old", last_update=datetime.utcnow() - timedelta(days=2)))
+    shared.set(KEY, b"refreshed by another process")
+
+    # WHEN
+    entry = backend.get(KEY)
+
+    # THEN
+    assert entry is not None
+    assert entry.data == b"refreshed by another process"
+
+
+def test_writes_go_through_to_both_tiers() -> None:
+    # GIVEN
+    backend, shared = _tiered()
+
+    # WHEN
+    backend.set(KEY, b"data", "etag")
+    backend.set_show_status([KEY], enums.ShowStatus.FINISHED)
+
+    # THEN
+    for tier in (backend.front, shared):
+        entry = tier.get(KEY)
+        assert entry is not None
+        assert (entry.data, entry.etag, entry.show_status) == (b"data", "etag", enums.ShowStatus.FINISHED)
+
+
+def test_get_many_combines_tiers() -> None:
+    # GIVEN
+    backend, shared = _tiered()
+    other_key = ("provider", "web,series", "2")
+    backend.set(KEY, b"first")
+    shared.set(other_key, b"second")
+
+    # WHEN
+    result = backend.get_many([KEY, other_key, ("provider", "web,series", "3")])
+
+    # THEN
+    assert {key: entry.data for key, entry in result.items()} == {KEY: b"first", other_key: b"second"}
+    assert backend.front.get(other_key) is not None
+
+
+def test_rewrite_keeps_show_status_in_front_tier() -> None:
+    # GIVEN
+    backend, shared = _tiered()
+    backend.set(KEY, b"data", show_status=enums.ShowStatus.AIRING)
+
+    # WHEN
+    backend.set(KEY, b"refreshed")
+    backend.set_many({KEY: CacheEntry(data=b"refreshed again", last_update=datetime.utcnow())})
+
+    # THEN
+    for tier in (backend.front, shared):
+        entry = tier.get(KEY)
+        assert entry is not None
+        assert (entry.data, entry.show_status) == (b"refreshed again", enums.ShowStatus.AIRING)
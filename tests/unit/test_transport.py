@@ -0,0 +1,51 @@
+import asyncio
+from typing import Tuple
+
+import httpx
+
+from anime_metadata.transport import AsyncTransport
+
+
+def test_async_client_is_shared_within_event_loop() -> None:
+    # GIVEN
+    transport = AsyncTransport()
+
+    async def get_clients() -> Tuple[httpx.AsyncClient, httpx.AsyncClient]:
+        return await transport.client(), await transport.client()
+
+    # WHEN
+    first, second = asyncio.run(get_clients())
+
+    # THEN
+    assert first is second
+
+
+def test_async_client_is_closed_with_its_event_loop() -> None:
+    # GIVEN
+    transport = AsyncTransport()
+
+    # WHEN
+    client = asyncio.run(transport.client())
+    next_client = asyncio.run(transport.client())
+
+    # THEN
+    assert client.is_closed
+    assert next_client.is_closed
+    assert next_client is not client
+
+
+def test_async_client_aclose() -> None:
+    # GIVEN
+    transport = AsyncTransport()
+
+    async def close_client() -> Tuple[httpx.AsyncClient, httpx.AsyncClient]:
+        client = await transport.client()
+        await transport.aclose()
+        return client, await transport.client()
+
+    # WHEN
+    client, next_client = asyncio.run(close_client())
+
+    # THEN
+    assert client.is_closed
+    assert next_client is not client
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+from typing import Iterator, Optional
+
+import pytest
+
+from anime_metadata import backends, constants, enums, ttl
+from anime_metadata.typeshed import CacheEntry
+
+from .fake_providers import FakeTransport, PageProvider
+
+KEY = ("provider", "web,series", "1")
+
+
+@pytest.fixture(autouse=True)
+def memory_backend() -> Iterator[backends.MemoryBackend]:
+    backend = backends.MemoryBackend()
+    backends.set_default_backend(backend)
+    yield backend
+    backends.set_default_backend(None)
+
+
+@pytest.mark.parametrize(
+    "rule, provider, data_type, show_status, expected",
+    [
+        (ttl.TtlRule(ttl=timedelta(1)), "anidb", "web,series", None, True),
+        (ttl.TtlRule(ttl=timedelta(1), provider="anidb"), "mal", "web,series", None, False),
+        (ttl.TtlRule(ttl=timedelta(1), data_type="web"), "anidb", "web,character", None, True),
+        (ttl.TtlRule(ttl=timedelta(1), data_type="web,character"), "anidb", "web", None, False),
+        (
+            ttl.TtlRule(ttl=timedelta(1), show_status=enums.ShowStatus.AIRING),
+            "anidb",
+            "web",
+            enums.ShowStatus.FINISHED,
+            False,
+        ),
+    ],
+)
+def test_rule_matches(
+    rule: ttl.TtlRule,
+    provider: str,
+    data_type: str,
+    show_status: Optional[enums.ShowStatus],
+    expected: bool,
+) -> None:
+    assert rule.matches(provider, data_type, show_status) is expected
+
+
+def test_first_matching_rule_wins() -> None:
+    # GIVEN
+    policy = ttl.TtlPolicy(
+        rules=(
+            ttl.TtlRule(provider="anidb", data_type="search", ttl=timedelta(hours=1)),
+            ttl.TtlRule(data_type="search", ttl=timedelta(hours=2)),
+        ),
+        default=timedelta(hours=3),
+    )
+
+    # THEN
+    assert policy.ttl("anidb", "search") == timedelta(hours=1)
+    assert policy.ttl("mal", "search") == timedelta(hours=2)
+    assert policy.ttl("mal", "web,series") == timedelta(hours=3)
+
+
+def test_default_rules() -> None:
+    # GIVEN
+    policy = ttl.TtlPolicy()
+
+    # THEN
+    assert policy.ttl("anidb", "search,noresult") == constants.CACHE_NO_RESULT_TTL
+    assert policy.ttl("anidb", "search") == constants.CACHE_SEARCH_TTL
+    assert policy.ttl("anidb", "web", enums.ShowStatus.AIRING) == timedelta(days=1)
+    assert policy.ttl("anidb", "web", enums.ShowStatus.NOT_YET_AIRED) == timedelta(days=3)
+    assert policy.ttl("anidb", "web", enums.ShowStatus.FINISHED) == timedelta(days=90)
+    assert policy.ttl("anidb", "web") == constants.MAX_CACHE_LIFETIME
+
+
+def test_freshness_depends_on_show_status() -> None:
+    # GIVEN
+    policy = ttl.TtlPolicy()
+    last_update = datetime.utcnow() - timedelta(days=2)
+
+    # THEN
+    assert policy.is_fresh(KEY, CacheEntry(data=b"", last_update=last_update, show_status=enums.ShowStatus.FINISHED))
+    assert not policy.is_fresh(KEY, CacheEntry(data=b"", last_update=last_update, show_status=enums.ShowStatus.AIRING))
+
+
+def test_set_default_policy() -> None:
+    # GIVEN
+    policy = ttl.TtlPolicy(rules=(), default=timedelta(hours=1))
+
+    # WHEN
+    ttl.set_default_policy(policy)
+
+    # THEN
+    try:
+        assert ttl.get_default_policy() is policy
+    finally:
+        ttl.set_default_policy(None)
+    assert ttl.get_default_policy() is not policy
+
+
+def test_pages_and_series_are_tagged_with_show_status(memory_backend: backends.MemoryBackend) -> None:
+    # GIVEN
+    provider = PageProvider(FakeTransport(b"plot"))
+
+    # WHEN
+    provider.get_series("1")
+
+    # THEN
+    page = memory_backend.get(provider.page_request("1").cache.key)  # type:ignore
+    dto = memory_backend.get(provider._dto_cache("1").key)
+    assert page is not None and page.show_status is enums.ShowStatus.FINISHED
+    assert dto is not None and dto.show_status is enums.ShowStatus.FINISHED
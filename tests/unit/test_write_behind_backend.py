@@ -0,0 +1,167 @@
+from datetime import datetime
+import threading
+from typing import List, Mapping
+
+import pytest
+
+from anime_metadata import backends, enums
+from anime_metadata.typeshed import CacheEntry, CacheKey
+
+KEY = ("provider", "web,series", "1")
+OTHER_KEY = ("provider", "web,series", "2")
+
+
+class BlockingBackend(backends.MemoryBackend):
+    """
+    Holds every batch until `release` is set
+    """
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.batches: List[List[CacheKey]] = []
+        super().__init__()
+
+    def set_many(self, items: Mapping[CacheKey, CacheEntry]) -> None:
+        self.started.set()
+        assert self.release.wait(5)
+        self.batches.append(list(items))
+        super().set_many(items)
+
+
+class FailingBackend(backends.MemoryBackend):
+    def set_many(self, items: Mapping[CacheKey, CacheEntry]) -> None:
+        raise RuntimeError("database is locked")
+
+
+def _entry(data: bytes) -> CacheEntry:
+    return CacheEntry(data=data, last_update=datetime.utcnow())
+
+
+def test_pending_writes_are_served_before_flush() -> None:
+    # GIVEN
+    backend = BlockingBackend()
+    write_behind = backends.WriteBehindBackend(backend, max_pending=1, flush_interval=0.01)
+
+    # WHEN
+    write_behind.set(KEY, b"data")
+    assert backend.started.wait(5)
+    write_behind.set(OTHER_KEY, b"other data")
+
+    # THEN
+    assert backend.get(KEY) is None
+    assert {key: entry.data for key, entry in write_behind.get_many([KEY, OTHER_KEY]).items()} == {
+        KEY: b"data",
+        OTHER_KEY: b"other data",
+    }
+    backend.release.set()
+    write_behind.close()
+
+
+def test_show_status_of_in_flight_writes_is_updated() -> None:
+    # GIVEN
+    backend = BlockingBackend()
+    write_behind = backends.WriteBehindBackend(backend, max_pending=1, flush_interval=0.01)
+    write_behind.set(KEY, b"data")
+    assert backend.started.wait(5)
+
+    # WHEN
+    write_behind.set_show_status([KEY], enums.ShowStatus.AIRING)
+
+    # THEN
+    entry = write_behind.get(KEY)
+    assert entry is not None and entry.show_status is enums.ShowStatus.AIRING
+    backend.release.set()
+    write_behind.close()
+    entry = backend.get(KEY)
+    assert entry is not None and entry.show_status is enums.ShowStatus.AIRING
+
+
+def test_flush_persists_the_latest_write() -> None:
+    # GIVEN
+    backend = backends.MemoryBackend()
+    write_behind = backends.WriteBehindBackend(backend, flush_interval=0.01)
+    write_behind.set(KEY, b"data")
+    write_behind.set(KEY, b"new data", "etag")
+
+    # WHEN
+    write_behind.flush()
+
+    # THEN
+    entry = backend.get(KEY)
+    assert entry is not None
+    assert (entry.data, entry.etag) == (b"new data", "etag")
+    write_behind.close()
+
+
+def test_sync_durability_writes_through() -> None:
+    # GIVEN
+    backend = BlockingBackend()
+    backend.release.set()
+    write_behind = backends.WriteBehindBackend(backend, durability=enums.CacheDurability.SYNC)
+
+    # WHEN
+    write_behind.set(KEY, b"data")
+    write_behind.set_many({OTHER_KEY: _entry(b"other data")})
+
+    # THEN
+    assert backend.get(KEY) is not None
+    assert backend.batches == [[OTHER_KEY]]
+    write_behind.close()
+
+
+def test_best_effort_durability_drops_writes_while_queue_is_full() -> None:
+    # GIVEN
+    backend = BlockingBackend()
+    write_behind = backends.WriteBehindBackend(
+        backend,
+        durability=enums.CacheDurability.BEST_EFFORT,
+        max_pending=1,
+        flush_interval=0.01,
+    )
+    write_behind.set(KEY, b"data")
+    assert backend.started.wait(5)
+    write_behind.set(OTHER_KEY, b"other data")
+
+    # WHEN
+    write_behind.set(("provider", "web,series", "3"), b"dropped")
+    write_behind.set(OTHER_KEY, b"new other data")
+
+    # THEN
+    assert write_behind.dropped == 1
+    backend.release.set()
+    write_behind.close()
+    assert backend.batches == [[KEY], [OTHER_KEY]]
+    assert backend.get(("provider", "web,series", "3")) is None
+    other = backend.get(OTHER_KEY)
+    assert other is not None and other.data == b"new other data"
+
+
+def test_close_flushes_and_later_writes_go_through() -> None:
+    # GIVEN
+    backend = backends.MemoryBackend()
+    write_behind = backends.WriteBehindBackend(backend, flush_interval=60)
+    write_behind.set(KEY, b"data")
+
+    # WHEN
+    write_behind.close()
+    write_behind.set(OTHER_KEY, b"other data")
+
+    # THEN
+    assert backend.get(KEY) is not None
+    assert backend.get(OTHER_KEY) is not None
+    write_behind.close()
+
+
+def test_failed_batch_is_logged(caplog: pytest.LogCaptureFixture) -> None:
+    # GIVEN
+    write_behind = backends.WriteBehindBackend(FailingBackend(), flush_interval=0.01)
+    write_behind.set(KEY, b"data")
+
+    # WHEN
+    write_behind.flush()
+
+    # THEN
+    assert "Failed to persist 1 cache entries" in caplog.text
+    assert write_behind.get(KEY) is None
+    write_behind.close()
@@ -0,0 +1,150 @@
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, List, Sequence, Tuple
+
+from lxml.etree import XPath
+from lxml.html import HtmlElement
+import pytest
+
+from anime_metadata import utils
+from anime_metadata.providers.anidb import xpaths as anidb_xpaths
+from anime_metadata.providers.myanimelist import xpaths as mal_xpaths
+from anime_metadata.providers.shinden import xpaths as shinden_xpaths
+
+FILES_DIR = Path(__file__).parent.parent / "wiremock" / "__files"
+
+# Parts of the MAL anime characters, character, episode and episodes pages the selectors apply to
+MAL_PAGE = b"""<html><body><div id="content">
+<table><tr><td>
+<div class="spaceit_pad"><a href="https://myanimelist.net/character/1/Yuiga"><h3 class="h3_character_name">Yuiga, Nariyuki (Main)</h3></a></div>
+<div class="spaceit_pad">Main</div>
+</td></tr></table>
+<div><h2 class="h2_overwrite">Staff</h2></div>
+<table><tr><td><a href="https://myanimelist.net/people/1/Director">Director</a><div><small>Director, Storyboard</small></div></td></tr></table>
+<h2 class="normal_header">Nariyuki Yuiga <span><small>(Yuiga Nariyuki)</small></span></h2>
+<table><tr><td><a href="https://myanimelist.net/people/2/Seiyuu">Itou, Kentarou</a><div><small>Japanese</small></div></td></tr></table>
+<div><h2>Synopsis</h2>Episode plot</div>
+<table class="episode_list ascend">
+<tr class="episode-list-data">
+<td class="episode-number">1</td>
+<td class="episode-title"><a>First</a><span>Daiichi</span></td>
+<td class="episode-aired">Apr 6, 2019</td>
+</tr>
+</table>
+</div></body></html>"""
+
+# Literal expressions the scrapers evaluated before the selectors were compiled, relative ones are evaluated on the
+# nodes found by the chain of selectors in `context`
+Selector = Tuple[str, str, Sequence[str]]
+
+ANIDB_SELECTORS: List[Selector] = [
+    ("EPISODES_COUNT", "//*[@itemprop='numberOfEpisodes']", ()),
+    ("TAGS", "//span[contains(@class, 'tagname')][@itemprop='genre']", ()),
+    ("TAG_LINK", "./ancestor::a[position()=1]", ("TAGS",)),
+]
+
+MAL_SELECTORS: List[Selector] = [
+    ("CHARACTER_NAMES", "//*[contains(@class, 'h3_character_name')]", ()),
+    ("CHARACTER_CELL", "./ancestor::td[position()=1]", ("CHARACTER_NAMES",)),
+    ("CHARACTER_LINK", "./ancestor::a[position()=1]", ("CHARACTER_NAMES",)),
+    ("CHARACTER_TYPE", "./*[contains(@class, 'spaceit_pad')][position()=2]", ("CHARACTER_NAMES", "CHARACTER_CELL")),
+    ("STAFF_HEADER", "//h2[contains(text(), 'Staff')][contains(@class, 'h2_overwrite')]", ()),
+    ("STAFF_HEADER_CONTAINER", "./ancestor::div[position()=1]", ("STAFF_HEADER",)),
+    ("STAFF_TABLES", "./following-sibling::table", ("STAFF_HEADER", "STAFF_HEADER_CONTAINER")),
+    (
+        "PEOPLE_LINKS",
+        ".//a[contains(@href, 'myanimelist.net/people/')]",
+        ("STAFF_HEADER", "STAFF_HEADER_CONTAINER", "STAFF_TABLES"),
+    ),
+    ("PERSON_ROLE", "./ancestor::td[position()=1]/div/small", ("CONTENT", "SEIYUU_LINKS")),
+    ("CONTENT", "//*[@id='content']", ()),
+    ("CHARACTER_HEADER", "//h2[contains(@class, 'normal_header')]", ("CONTENT",)),
+    ("SEIYUU_LINKS", "//table//a[contains(@href, 'myanimelist.net/people/')]", ("CONTENT",)),
+    ("EPISODE_SYNOPSIS", "//h2[contains(text(), 'Synopsis')]/ancestor::*[position()=1]", ()),
+    ("EPISODES_TABLE", "//table[contains(@class, 'episode_list')][contains(@class, 'ascend')]", ()),
+    ("EPISODE_ROWS", "./tr[contains(@class, 'episode-list-data')]", ("EPISODES_TABLE",)),
+    ("EPISODE_NUMBER", "./td[contains(@class, 'episode-number')]", ("EPISODES_TABLE", "EPISODE_ROWS")),
+    ("EPISODE_TITLE", "./td[contains(@class, 'episode-title')]/a", ("EPISODES_TABLE", "EPISODE_ROWS")),
+    ("EPISODE_TITLE_JAPANESE", "./td[contains(@class, 'episode-title')]/span", ("EPISODES_TABLE", "EPISODE_ROWS")),
+    ("EPISODE_AIRED", "./td[contains(@class, 'episode-aired')]", ("EPISODES_TABLE", "EPISODE_ROWS")),
+]
+
+SHINDEN_SERIES_SELECTORS: List[Selector] = [
+    ("COVER_LINK", "//*[normalize-space(@class)='title-cover']/a[contains(@href, '/images/')]", ()),
+    ("TITLE", "//h1[contains(@class, 'page-title')]//*[normalize-space(@class)='title']", ()),
+    ("DESCRIPTION", "//*[normalize-space(@id)='description']", ()),
+    ("RATING", "//*[normalize-space(@class)='info-aside-rating-user']", ()),
+    (
+        "TAG_LINKS",
+        "//*[normalize-space(@class)='info-top-table-highlight']//ul[normalize-space(@class)='tags']//a",
+        (),
+    ),
+    (
+        "INFO_TERMS",
+        "//*[normalize-space(@class)='title-small-info']//dl[normalize-space(@class)='info-aside-list']/dt",
+        (),
+    ),
+    ("INFO_DEFINITION", "./following-sibling::dd[1]", ("INFO_TERMS",)),
+]
+
+SHINDEN_SEARCH_SELECTORS: List[Selector] = [
+    ("SEARCH_ROWS", "//*[normalize-space(@class)='title-table']//ul[normalize-space(@class)='div-row']", ()),
+    ("SEARCH_ROW_COVER_LINK", ".//li[normalize-space(@class)='cover-col']/a", ("SEARCH_ROWS",)),
+    ("SEARCH_ROW_TITLE_LINK", ".//li[normalize-space(@class)='desc-col']//a", ("SEARCH_ROWS",)),
+    ("SEARCH_ROW_TYPE", ".//li[normalize-space(@class)='title-kind-col']", ("SEARCH_ROWS",)),
+    ("SEARCH_ROW_EPISODES", ".//li[normalize-space(@class)='episodes-col']", ("SEARCH_ROWS",)),
+    ("SEARCH_ROW_STATUS", ".//li[normalize-space(@class)='title-status-col']", ("SEARCH_ROWS",)),
+    ("SEARCH_ROW_RATING", ".//li[normalize-space(@class)='rate-top']", ("SEARCH_ROWS",)),
+    ("PREV_PAGE_LINK", "//*[normalize-space(@class)='pagination-prev']//a", ()),
+    ("NEXT_PAGE_LINK", "//*[normalize-space(@class)='pagination-next']//a", ()),
+]
+
+PAGES: Dict[str, bytes] = {
+    "anidb": (FILES_DIR / "anidb" / "web-14289.html").read_bytes(),
+    "mal": MAL_PAGE,
+    "shinden series": (FILES_DIR / "shinden" / "series-53932.html").read_bytes(),
+    "shinden search": (FILES_DIR / "shinden" / "search-page2.html").read_bytes(),
+}
+
+SELECTORS = [
+    (module, page, selector)
+    for module, page, selectors in (
+        (anidb_xpaths, "anidb", ANIDB_SELECTORS),
+        (mal_xpaths, "mal", MAL_SELECTORS),
+        (shinden_xpaths, "shinden series", SHINDEN_SERIES_SELECTORS),
+        (shinden_xpaths, "shinden search", SHINDEN_SEARCH_SELECTORS),
+    )
+    for selector in selectors
+]
+
+
+def _paths(root: HtmlElement, nodes: Sequence[HtmlElement]) -> List[str]:
+    return [root.getroottree().getpath(node) for node in nodes]
+
+
+@pytest.mark.parametrize(
+    "module, page, selector",
+    [pytest.param(*item, id=f"{item[0].__name__.split('.')[-2]}.{item[2][0]}") for item in SELECTORS],
+)
+def test_compiled_selector_matches_literal_expression(module: ModuleType, page: str, selector: Selector) -> None:
+    # GIVEN
+    name, expression, context = selector
+    root = utils.load_html(PAGES[page])
+    nodes = [root]
+    for context_name in context:
+        nodes = [found for node in nodes for found in getattr(module, context_name)(node)]
+
+    # WHEN
+    compiled = getattr(module, name)
+    result = [found for node in nodes for found in compiled(node)]
+
+    # THEN
+    assert isinstance(compiled, XPath)
+    expected = [found for node in nodes for found in node.xpath(expression)]
+    assert expected
+    assert _paths(root, result) == _paths(root, expected)
+
+
+@pytest.mark.parametrize("module", [anidb_xpaths, mal_xpaths, shinden_xpaths])
+def test_every_selector_is_compared(module: ModuleType) -> None:
+    assert sorted(module.__all__) == sorted(name for item_module, _, (name, _, _) in SELECTORS if item_module is module)